@@ -0,0 +1,40 @@
+"""
+Benchmark for the GTIN read-through product cache
+
+Fills a ProductCache with synthetic products and times lookups of hot GTINs, which
+are answered without leaving the process.
+
+Usage:
+    python benchmarks/bench_cache.py [entries]
+"""
+
+import sys
+import random
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from oneworldsync.cache import ProductCache, cache_scope
+from oneworldsync.models import Content1Product
+from sample_data import make_item
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    cache = ProductCache(max_entries=count)
+    scope = cache_scope('US')
+    gtins = [f'{n:014d}' for n in range(count)]
+    cache.store(gtins, scope, [Content1Product(make_item(n)) for n in range(count)])
+    
+    for batch in (1, 10, 100):
+        lookups = [random.sample(gtins, batch) for _ in range(1000)]
+        seconds = min(timeit.repeat(lambda: [cache.lookup(lookup, scope) for lookup in lookups], number=1, repeat=5))
+        print(f"{batch:>4} GTINs per lookup  {seconds / len(lookups) * 1e6:8.1f} us per lookup")
+    
+    stats = cache.stats()
+    print(f"{stats['entries']} entries, {stats['memory_bytes'] / 1e6:.1f} MB of item JSON, hit rate {stats['hit_rate']:.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark for the JSON codecs
+
+Decodes and encodes a fetch response page of full items with every installed codec,
+as the client does for response bodies and the CLI does for its output.
+
+Usage:
+    python benchmarks/bench_codec.py [page_size]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from oneworldsync.codec import available_codecs, get_codec
+from oneworldsync.models import Content1ProductResults
+from sample_data import make_page
+
+
+def main():
+    page_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    page = make_page(page_size)
+    body = get_codec('json').dumps(page)
+    output = Content1ProductResults(page).to_dict()
+    print(f"page of {page_size} items, {len(body) / 1e6:.1f} MB")
+    
+    baseline = None
+    for name in reversed(available_codecs()):
+        codec = get_codec(name)
+        timings = [
+            min(timeit.repeat(lambda: codec.loads(body), number=5, repeat=5)) / 5,
+            min(timeit.repeat(lambda: codec.dumps(page), number=5, repeat=5)) / 5,
+            min(timeit.repeat(lambda: codec.dumps(output, indent=True), number=5, repeat=5)) / 5
+        ]
+        if baseline is None:
+            baseline = timings
+        columns = '  '.join(f"{t * 1e3:7.2f} ms ({b / t:4.1f}x)" for t, b in zip(timings, baseline))
+        print(f"{name:<8} decode, encode, indented output: {columns}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark for compressed transfer of fetch responses
+
+Compresses a fetch response page with each encoding the client can negotiate and
+reports the wire size and the time to decompress it. Synthetic items are more
+repetitive than real ones, so real ratios are lower.
+
+Usage:
+    python benchmarks/bench_compression.py [page_size]
+"""
+
+import sys
+import json
+import gzip
+import zlib
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from oneworldsync.compression import accept_encoding
+from sample_data import make_page
+
+
+def encoders():
+    """Get (name, compress, decompress) for every encoding the client accepts"""
+    available = [
+        ('gzip', gzip.compress, gzip.decompress),
+        ('deflate', zlib.compress, zlib.decompress)
+    ]
+    accepted = accept_encoding().split(',')
+    if 'br' in accepted:
+        import brotli
+        available.append(('br', lambda data: brotli.compress(data, quality=5), brotli.decompress))
+    if 'zstd' in accepted:
+        try:
+            from compression import zstd
+        except ImportError:
+            from backports import zstd
+        available.append(('zstd', zstd.compress, zstd.decompress))
+    return available
+
+
+def main():
+    page_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    body = json.dumps(make_page(page_size)).encode('utf-8')
+    print(f"page of {page_size} items, {len(body) / 1e6:.2f} MB decoded, accepting {accept_encoding()}")
+    
+    for name, compress, decompress in encoders():
+        wire = compress(body)
+        seconds = min(timeit.repeat(lambda: decompress(wire), number=10, repeat=5)) / 10
+        print(f"{name:<8} {len(wire) / 1e3:9.1f} kB on the wire  {len(body) / len(wire):6.1f}x  "
+              f"decompress {seconds * 1e3:6.2f} ms ({len(body) / seconds / 1e6:6.0f} MB/s)")
+
+
+if __name__ == '__main__':
+    main()
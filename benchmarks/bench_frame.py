@@ -0,0 +1,59 @@
+"""
+Benchmark for ProductFrame filters and group-bys
+
+Builds a frame of synthetic products and times filter, count_by and group_by with the
+NumPy scans and with the pure Python loops used when NumPy is not installed.
+
+Usage:
+    python benchmarks/bench_frame.py [rows]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from oneworldsync import frame as frame_module
+from oneworldsync.frame import ProductFrame
+from oneworldsync.models import Content1Product
+from sample_data import make_item
+
+
+def build_frame(count):
+    frame = ProductFrame(columns=('gtin', 'brand_name', 'target_market', 'gpc_category'))
+    for n in range(count):
+        item = make_item(n)
+        item['item']['brandName'] = f'Brand {n % 500}'
+        item['item']['targetMarket'] = ('US', 'CA', 'DE', 'FR')[n % 4]
+        item['item']['globalClassificationCategory']['code'] = str(10000000 + n % 50)
+        frame.append(Content1Product(item))
+    return frame
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    frame = build_frame(count)
+    numpy = frame_module.np
+    if numpy is None:
+        print("numpy is not installed; only the Python loops can be timed")
+    
+    operations = {
+        'filter': lambda: frame.filter(target_market={'US', 'CA'}, brand_name=lambda brand: brand < 'Brand 2'),
+        'count_by': lambda: frame.count_by('brand_name'),
+        'count_by x2': lambda: frame.count_by('target_market', 'gpc_category'),
+        'group_by': lambda: frame.group_by('target_market')
+    }
+    
+    print(f"{count} rows{'':>6}" + ("numpy      python" if numpy is not None else "python"))
+    for name, operation in operations.items():
+        timings = []
+        for np in ((numpy, None) if numpy is not None else (None,)):
+            frame_module.np = np
+            timings.append(min(timeit.repeat(operation, number=1, repeat=5)))
+        frame_module.np = numpy
+        print(f"{name:<12} " + "  ".join(f"{seconds * 1e3:8.1f} ms" for seconds in timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark for the local SQLite product mirror
+
+Bulk-loads synthetic items into a temporary mirror and times point lookups by GTIN,
+including decoding the stored JSON into a Content1Product.
+
+Usage:
+    python benchmarks/bench_mirror.py [items]
+"""
+
+import sys
+import time
+import random
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from oneworldsync.mirror import ProductMirror
+from oneworldsync.models import Content1Product
+from sample_data import make_item
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    products = [Content1Product(make_item(n)) for n in range(count)]
+    
+    with tempfile.TemporaryDirectory() as directory, ProductMirror(Path(directory) / 'mirror.db') as mirror:
+        start = time.perf_counter()
+        mirror.load(products)
+        seconds = time.perf_counter() - start
+        print(f"load     {count} items in {seconds:.2f} s ({count / seconds:,.0f} items/s)")
+        
+        gtins = [f'{random.randrange(count):014d}' for _ in range(1000)]
+        seconds = min(timeit.repeat(lambda: [mirror.get(gtin) for gtin in gtins], number=1, repeat=5)) / len(gtins)
+        print(f"get      {seconds * 1e6:.1f} us per lookup")
+        
+        seconds = min(timeit.repeat(lambda: mirror.get_many(gtins), number=1, repeat=5)) / len(gtins)
+        print(f"get_many {seconds * 1e6:.1f} us per GTIN")
+
+
+if __name__ == '__main__':
+    main()
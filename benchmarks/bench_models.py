@@ -0,0 +1,73 @@
+"""
+Memory benchmark for the Content1 response models
+
+Measures the bytes each model instance adds on top of the raw response dicts, which
+is what a large export or mirror build pays per product held in memory. Each slotted
+model is compared with a __dict__-backed copy, as the models were before __slots__.
+
+Usage:
+    python benchmarks/bench_models.py [count]
+"""
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from oneworldsync.models import Content1Product, Content1Hierarchy
+from sample_data import make_hierarchy, make_item
+
+
+def unslotted(model):
+    """
+    Create a copy of a model whose instances keep their attributes in a __dict__
+    
+    Args:
+        model (type): Slotted model class
+    
+    Returns:
+        type: Class with the same __init__ but without __slots__
+    """
+    return type(f"Unslotted{model.__name__}", (), {'__init__': model.__init__})
+
+
+def measure(build, count):
+    """
+    Measure the memory allocated by build() per item
+    
+    Args:
+        build (callable): Function creating the models
+        count (int): Number of items built
+    
+    Returns:
+        float: Bytes per item
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    models = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del models
+    return (after - before) / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    
+    # Raw payloads are built before tracing so only the model overhead is measured
+    payloads = [
+        ('Content1Product', Content1Product, [make_item(n) for n in range(count)]),
+        ('Content1Hierarchy', Content1Hierarchy, [make_hierarchy(n) for n in range(count)])
+    ]
+    
+    print(f"{'bytes per model':<20} {'__dict__':>9} {'__slots__':>9}   ({count} models)")
+    for label, model, items in payloads:
+        baseline = unslotted(model)
+        before = measure(lambda: [baseline(item) for item in items], count)
+        after = measure(lambda: [model(item) for item in items], count)
+        print(f"{label:<20} {before:9.1f} {after:9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Microbenchmark for nested path lookups
+
+Compares the previous get_nested_dict_value implementation, which split the path on
+every call, with compile_path accessors and with extract_product_data as a whole.
+
+Usage:
+    python benchmarks/bench_paths.py [iterations]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from oneworldsync.utils import compile_path, extract_product_data, get_nested_dict_value
+from sample_data import make_item
+
+
+def split_path_lookup(data, path, default=None):
+    """The get_nested_dict_value implementation before compile_path, kept for comparison"""
+    if not data or not isinstance(data, dict):
+        return default
+    
+    parts = path.split('.')
+    current = data
+    
+    for part in parts:
+        if part.isdigit() and isinstance(current, list):
+            index = int(part)
+            if 0 <= index < len(current):
+                current = current[index]
+            else:
+                return default
+        elif isinstance(current, dict):
+            current = current.get(part)
+        else:
+            return default
+        
+        if current is None:
+            return default
+    
+    return current
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    item = make_item(1)['item']
+    
+    cases = [
+        'tradeItemInformation',
+        'itemIdentificationInformation.itemIdentifier',
+        'tradeItemInformation.0.tradeItemDescriptionModule.tradeItemDescriptionInformation',
+        'itemIdentificationInformation.missing.key'
+    ]
+    
+    print(f"{'path':<85} {'split':>9} {'lookup':>9} {'compiled':>9}  (ns per call)")
+    for path in cases:
+        accessor = compile_path(path)
+        split = timeit.timeit(lambda: split_path_lookup(item, path, []), number=iterations)
+        lookup = timeit.timeit(lambda: get_nested_dict_value(item, path, []), number=iterations)
+        compiled = timeit.timeit(lambda: accessor(item, []), number=iterations)
+        print(f"{path:<85} {split / iterations * 1e9:9.0f} {lookup / iterations * 1e9:9.0f} "
+              f"{compiled / iterations * 1e9:9.0f}")
+    
+    product = make_item(1)
+    count = max(1, iterations // 100)
+    extract = timeit.timeit(lambda: extract_product_data(product), number=count)
+    print(f"extract_product_data: {extract / count * 1e6:.1f} us per product")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+Benchmark for declarative extraction schemas
+
+Compares the full product schema used by extract_product_data with schemas that
+select only a few fields.
+
+Usage:
+    python benchmarks/bench_schema.py [iterations]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from oneworldsync.schema import PRODUCT_SCHEMA
+from sample_data import make_item
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    item = make_item(1)['item']
+    
+    schemas = [
+        ('all fields', PRODUCT_SCHEMA),
+        ('gtin, brand_name, product_name', PRODUCT_SCHEMA.select('gtin', 'brand_name', 'product_name')),
+        ('gtin', PRODUCT_SCHEMA.select('gtin'))
+    ]
+    
+    for label, schema in schemas:
+        best = min(timeit.repeat(lambda: schema.extract(item), number=iterations, repeat=5))
+        print(f"{label:<35} {best / iterations * 1e6:6.2f} us per item")
+
+
+if __name__ == '__main__':
+    main()
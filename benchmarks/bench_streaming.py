@@ -0,0 +1,74 @@
+"""
+Memory benchmark for streamed page parsing
+
+Compares the peak memory of parsing a full fetch page with ``json.loads`` (what
+``response.json()`` does) against JSONStreamParser, which yields one item at a time.
+
+Usage:
+    python benchmarks/bench_streaming.py [page_size]
+"""
+
+import sys
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from oneworldsync.models import Content1Product
+from oneworldsync.streaming import JSONStreamParser
+from sample_data import make_page
+
+
+def chunked(body, size):
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+def parse_whole(body):
+    # response.json() reads the whole body, then builds the whole object graph
+    text = b''.join(chunked(body, 65536))
+    for item in json.loads(text)['items']:
+        Content1Product(item).gtin
+
+
+def parse_streamed(body):
+    parser = JSONStreamParser()
+    for key, item in parser.parse(chunked(body, 65536)):
+        Content1Product(item).gtin
+
+
+def measure(parse, body):
+    """
+    Measure the peak memory and time of parsing one page
+    
+    Args:
+        parse (callable): Parser taking the body bytes
+        body (bytes): Response body
+    
+    Returns:
+        tuple: (peak bytes, seconds)
+    """
+    tracemalloc.start()
+    parse(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    started = time.perf_counter()
+    parse(body)
+    return peak, time.perf_counter() - started
+
+
+def main():
+    page_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    body = json.dumps(make_page(page_size)).encode('utf-8')
+    print(f"page of {page_size} items, {len(body) / 1e6:.1f} MB")
+    
+    for label, parse in (('json.loads', parse_whole), ('JSONStreamParser', parse_streamed)):
+        peak, seconds = measure(parse, body)
+        print(f"{label:<18} peak {peak / 1e6:7.2f} MB  {seconds * 1e3:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Synthetic Content1 API payloads shared by the benchmarks
+"""
+
+
+def make_item(n):
+    """
+    Build a product item shaped like a Content1 fetch response item
+    
+    Args:
+        n (int): Sequence number used for the GTIN and names
+    
+    Returns:
+        dict: Product item
+    """
+    return {
+        'gtin': f'{n:014d}', 'informationProviderGLN': '1234567890123', 'targetMarket': 'US',
+        'lastModifiedDate': '2024-01-01T12:00:00Z',
+        'item': {
+            'gtin': f'{n:014d}', 'brandName': 'Brand', 'targetMarket': 'US',
+            'globalClassificationCategory': {'code': '10000043', 'name': 'Cereal'},
+            'gtinName': [{'value': f'Product {n}', 'languageCode': 'en'}],
+            'itemIdentificationInformation': {'itemIdentifier': [{'itemId': f'{n:014d}', 'itemIdType': {'value': 'GTIN'}}],
+                                              'itemReferenceIdInformation': {'itemReferenceId': str(n)}},
+            'tradeItemInformation': [{
+                'tradeItemDescriptionModule': {'tradeItemDescriptionInformation': [{
+                    'brandNameInformation': {'brandName': 'Brand'},
+                    'regulatedProductName': [{'statement': {'values': [{'value': f'Product {n}'}]}}],
+                    'additionalTradeItemDescription': {'values': [{'value': 'A description ' * 10}]}}]},
+                'referencedFileDetailInformationModule': {'referencedFileHeader': [
+                    {'referencedFileTypeCode': {'value': 'PRODUCT_IMAGE'}, 'uniformResourceIdentifier': f'https://img/{n}.jpg',
+                     'isPrimaryFile': {'value': 'true'}}]},
+                'tradeItemMeasurementsModuleGroup': [{'tradeItemMeasurementsModule': {'tradeItemMeasurements': {
+                    'height': {'value': '10', 'qual': 'CM'}, 'width': {'value': '5', 'qual': 'CM'}, 'depth': {'value': '2', 'qual': 'CM'}}}}],
+                'foodAndBeverageIngredientModule': [{'ingredientStatement': [{'statement': {'values': [{'value': 'Oats, sugar'}]}}]}],
+                'placeOfItemActivityModule': {'placeOfProductActivity': {'countryOfOrigin': [{'countryCode': {'value': 'US'}}]}},
+            }],
+            'productCategory': [{'productCategoryScheme': {'value': 'GPC'}, 'productCategoryCodes': [
+                {'productCategoryCode': {'value': '10000043'}, 'productCategoryComponent': {'value': 'BRICK'}}]}],
+        }
+    }
+
+
+def make_hierarchy(n):
+    """
+    Build a hierarchy shaped like a Content1 hierarchy response item
+    
+    Args:
+        n (int): Sequence number used for the GTINs
+    
+    Returns:
+        dict: Hierarchy item
+    """
+    return {
+        'gtin': f'{n:014d}', 'informationProviderGLN': '1234567890123', 'targetMarket': 'US',
+        'hierarchy': [{'parentGtin': f'{n:014d}', 'gtin': f'{n + 1:014d}', 'quantity': 6, 'children': []}]
+    }
+
+
+def make_page(size, start=0):
+    """
+    Build a product fetch response page
+    
+    Args:
+        size (int): Number of items
+        start (int, optional): First sequence number. Defaults to 0.
+    
+    Returns:
+        dict: Response page with items and searchAfter
+    """
+    return {'items': [make_item(n) for n in range(start, start + size)], 'searchAfter': [start + size]}
@@ -4,10 +4,23 @@ Django service for retrieving nutritional information from 1WorldSync Content1 A
 
 import logging
 from django.conf import settings
-from oneworldsync import Content1Client
+from oneworldsync import Content1Client, Schema, Field
+from oneworldsync.schema import LAST, COLLECT
+from oneworldsync.utils import compile_path
 
 logger = logging.getLogger(__name__)
 
+
+# Nutritional data located in a product item in a single pass
+NUTRITION_SCHEMA = Schema({
+    'serving_size': Field('nutrientInformation[].servingSize', rule=LAST),
+    'servings_per_package': Field('nutrientInformation[].servingsPerPackageDescription', rule=LAST),
+    'nutrients': Field('nutrientInformation[].nutrientDetail[]', rule=COLLECT)
+})
+
+_quantity_value = compile_path('quantityContained.0.value')
+
+
 class NutritionService:
     """Service for retrieving nutritional information from 1WorldSync Content1 API."""
     
@@ -119,43 +132,32 @@ class NutritionService:
         nutrition_info = {}
         
         try:
-            item_data = product_data.get('item', {})
+            extracted = NUTRITION_SCHEMA.extract(product_data.get('item', {}))
             
-            # In this product, nutritional info is in nutrientInformation
-            nutrient_info = item_data.get('nutrientInformation', [])
+            # Extract serving size
+            serving_size = extracted['serving_size']
+            if serving_size:
+                value = serving_size[0].get('value', '')
+                unit = serving_size[0].get('qual', '')
+                nutrition_info['serving_size'] = f"{value} {unit}".strip()
             
-            for info in nutrient_info:
-                # Extract serving size
-                serving_size = info.get('servingSize', [])
-                if serving_size and len(serving_size) > 0:
-                    value = serving_size[0].get('value', '')
-                    unit = serving_size[0].get('qual', '')
-                    nutrition_info['serving_size'] = f"{value} {unit}".strip()
-                
-                # Extract servings per package
-                servings_per_package = info.get('servingsPerPackageDescription', [])
-                if servings_per_package and len(servings_per_package) > 0:
-                    nutrition_info['servings_per_container'] = servings_per_package[0].get('value', '')
+            # Extract servings per package
+            servings_per_package = extracted['servings_per_package']
+            if servings_per_package:
+                nutrition_info['servings_per_container'] = servings_per_package[0].get('value', '')
+            
+            for nutrient in extracted['nutrients']:
+                nutrient_type = nutrient.get('nutrientTypeCode', '')
                 
-                # Extract nutrient details
-                nutrient_details = info.get('nutrientDetail', [])
+                # Map to Django model fields, keeping empty quantities
+                field_name = self.NUTRIENT_MAPPING.get(nutrient_type)
+                if field_name:
+                    nutrition_info[field_name] = _quantity_value(nutrient, '')
                 
-                for nutrient in nutrient_details:
-                    nutrient_type = nutrient.get('nutrientTypeCode', '')
-                    
-                    # Get quantity
-                    quantity = nutrient.get('quantityContained', [])
-                    value = quantity[0].get('value', '') if quantity else ''
-                    
-                    # Map to Django model fields
-                    field_name = self.NUTRIENT_MAPPING.get(nutrient_type)
-                    if field_name:
-                        nutrition_info[field_name] = value
-                    
-                    # Get daily value percentage
-                    daily_value = nutrient.get('dailyValueIntakePercent', '')
-                    if daily_value and field_name:
-                        nutrition_info[f"{field_name}_dv"] = daily_value
+                # Get daily value percentage
+                daily_value = nutrient.get('dailyValueIntakePercent', '')
+                if daily_value and field_name:
+                    nutrition_info[f"{field_name}_dv"] = daily_value
         
         except Exception as e:
             logger.error(f"Error extracting nutritional info: {e}")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Script to export all records with target market 'US' using several concurrent
+date-window partitions, writing them to JSON Lines.
+"""
+
+import os
+import json
+import time
+from dotenv import load_dotenv
+from oneworldsync import Content1Client, PartitionedExporter, AuthenticationError, APIError
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Constants
+TARGET_MARKET = "US"
+FROM_DATE = "2000-01-01"
+TO_DATE = time.strftime("%Y-%m-%d")
+PARTITIONS = 8
+OUTPUT_FILE = "us_records.jsonl"
+
+def main():
+    """Main function to export US records in parallel"""
+    # Allow one pooled connection per partition
+    client = Content1Client(
+        app_id=os.getenv("ONEWORLDSYNC_APP_ID"),
+        secret_key=os.getenv("ONEWORLDSYNC_SECRET_KEY"),
+        gln=os.getenv("ONEWORLDSYNC_USER_GLN"),
+        api_url=os.getenv("ONEWORLDSYNC_CONTENT1_API_URL"),
+        pool_maxsize=PARTITIONS
+    )
+    
+    try:
+        exporter = PartitionedExporter(
+            client,
+            from_date=FROM_DATE,
+            to_date=TO_DATE,
+            criteria={"targetMarket": TARGET_MARKET},
+            partitions=PARTITIONS
+        )
+        
+        print("Planning date windows...")
+        for window in exporter.plan():
+            print(f"  {window['from_date']} to {window['to_date']}: ~{window['count']} products")
+        
+        start = time.time()
+        with open(OUTPUT_FILE, 'w') as f:
+            for product in exporter:
+                f.write(json.dumps(product.data) + "\n")
+        
+        elapsed = time.time() - start
+        print(f"\nExported {exporter.stats['items']} products in {exporter.stats['pages']} pages "
+              f"({elapsed:.1f}s, {exporter.stats['duplicates']} duplicates skipped) to {OUTPUT_FILE}")
+        
+    except AuthenticationError as e:
+        print(f"Authentication error: {e}")
+    except APIError as e:
+        print(f"API error: {e}")
+    finally:
+        client.close()
+
+if __name__ == "__main__":
+    main()
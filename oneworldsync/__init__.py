@@ -7,24 +7,67 @@ various endpoints of the 1WorldSync Content1 API.
 """
 
 from .content1_client import Content1Client
+from .content1_async_client import AsyncContent1Client
 from .content1_auth import Content1HMACAuth
 from .exceptions import OneWorldSyncError, AuthenticationError, APIError
-from .criteria import ProductCriteria, DateRangeCriteria, SortField
+from .retry import RetryPolicy
+from .concurrency import AdaptiveConcurrencyLimiter
+from .rate_limit import RateLimiter, TokenBucketRateLimiter, FileTokenBucketRateLimiter
+from .criteria import ProductCriteria, FrozenCriteria, DateRangeCriteria, SortField
+from .export import PartitionedExporter
+from .frame import ProductFrame
+from .schema import Schema, Field
+from .streaming import JSONStreamParser, StreamedResults
+from .codec import JSONCodec
+from .compression import TransferStats
+from .checkpoint import ExportCheckpoint, CheckpointedExport, CheckpointedPartitionedExport
+from .sync import DeltaSync, ProductStore, MemoryProductStore
+from .mirror import ProductMirror
+from .cache import ProductCache
+from .coalesce import SingleFlight, AsyncSingleFlight
+from .batch import GtinBatcher, BulkGtinFetch
 from .models import Content1Product, Content1ProductResults, Content1Hierarchy, Content1HierarchyResults
 
 __version__ = '0.3.2'
 
 __all__ = [
     'Content1Client',
+    'AsyncContent1Client',
     'Content1HMACAuth',
     'OneWorldSyncError',
     'AuthenticationError',
     'APIError',
+    'RetryPolicy',
+    'RateLimiter',
+    'TokenBucketRateLimiter',
+    'FileTokenBucketRateLimiter',
+    'AdaptiveConcurrencyLimiter',
     'ProductCriteria',
+    'FrozenCriteria',
     'DateRangeCriteria',
     'SortField',
     'Content1Product',
     'Content1ProductResults',
     'Content1Hierarchy',
-    'Content1HierarchyResults'
+    'Content1HierarchyResults',
+    'PartitionedExporter',
+    'ProductFrame',
+    'Schema',
+    'Field',
+    'JSONStreamParser',
+    'StreamedResults',
+    'JSONCodec',
+    'TransferStats',
+    'ExportCheckpoint',
+    'CheckpointedExport',
+    'CheckpointedPartitionedExport',
+    'DeltaSync',
+    'ProductStore',
+    'MemoryProductStore',
+    'ProductMirror',
+    'ProductCache',
+    'SingleFlight',
+    'AsyncSingleFlight',
+    'GtinBatcher',
+    'BulkGtinFetch'
 ]
@@ -0,0 +1,344 @@
+"""
+Batched GTIN lookups for the 1WorldSync Content1 API
+
+Services often look up one GTIN per incoming request, although the ``gtin`` criterion
+takes a list. This module queues single lookups from any number of threads, gathers
+them for a few milliseconds (or until a batch is full), fetches each batch with one
+multi-GTIN request and routes every returned item to the futures of the callers that
+asked for its GTIN. It also fetches long GTIN lists, such as a retailer feed, as
+de-duplicated chunks on concurrent workers.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List
+
+from .cache import _group_by_gtin
+from .content1_client import _gtin_criteria, _put_until_stopped
+from .utils import normalize_gtin
+
+
+# Queued after the last lookup to stop the collector thread
+_STOP = object()
+
+
+def _gtin_pages(client, gtins, page_size=1000, target_market=None, ip_gln=None, fields=None):
+    """
+    Fetch every page of products for a list of GTINs
+    
+    Args:
+        client (Content1Client): Client used for all requests
+        gtins (list): GTINs to fetch
+        page_size (int, optional): Number of products per page. Defaults to 1000.
+        target_market (str, optional): Target market. Defaults to None.
+        ip_gln (str, optional): Information Provider GLN. Defaults to None.
+        fields (dict, optional): Field projection. Defaults to None.
+    
+    Yields:
+        Content1ProductResults: Each page of results
+    """
+    criteria = _gtin_criteria(gtins, target_market, ip_gln, fields)
+    results = client.fetch_products_by_gtin(gtins, page_size, target_market, ip_gln, fields)
+    yield results
+    while len(results) and results.search_after:
+        results = client.fetch_next_page(results, page_size, criteria)
+        yield results
+
+
+class GtinBatcher:
+    """
+    Dispatcher combining concurrent single-GTIN lookups into multi-GTIN fetches
+    
+    A collector thread starts a batch with the first queued lookup and closes it after
+    ``max_wait`` seconds or once it holds ``max_batch`` distinct GTINs. Lookups of a GTIN
+    already in the batch join it without making it larger, but never keep it open past
+    ``max_wait``. Batches are fetched on a small thread pool, so a slow request does not
+    hold back the next batch. Each lookup resolves to the list of products returned for
+    its GTIN, which is empty when the GTIN was not found.
+    """
+    
+    def __init__(self, client, max_wait=0.005, max_batch=100, max_in_flight=4, page_size=1000,
+                 target_market=None, ip_gln=None, fields=None):
+        """
+        Initialize the batcher and start its collector thread
+        
+        Args:
+            client (Content1Client): Client used for all requests
+            max_wait (float, optional): Seconds a batch collects lookups after its first one. Defaults to 0.005.
+            max_batch (int, optional): Maximum number of distinct GTINs per request. Defaults to 100.
+            max_in_flight (int, optional): Maximum number of batch requests sent concurrently. Defaults to 4.
+            page_size (int, optional): Number of products per page. Defaults to 1000.
+            target_market (str, optional): Target market of every lookup. Defaults to None.
+            ip_gln (str, optional): Information Provider GLN of every lookup. Defaults to None.
+            fields (dict, optional): Field projection of every lookup. Defaults to None.
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.client = client
+        self.max_wait = max_wait
+        self.max_batch = max_batch
+        self.page_size = page_size
+        self.target_market = target_market
+        self.ip_gln = ip_gln
+        self.fields = fields
+        
+        self.lookups = 0
+        self.batches = 0
+        self.requests = 0
+        
+        self._lock = threading.Lock()
+        self._closed = False
+        self._queue = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        self._collector = threading.Thread(target=self._collect, name='GtinBatcher', daemon=True)
+        self._collector.start()
+    
+    def submit(self, gtin) -> Future:
+        """
+        Queue a lookup
+        
+        Args:
+            gtin (str): GTIN to look up
+        
+        Returns:
+            Future: Resolves to the list of Content1Product objects for the GTIN
+        
+        Raises:
+            RuntimeError: If the batcher has been closed
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("GtinBatcher is closed")
+            self.lookups += 1
+            self._queue.put((gtin, future))
+        return future
+    
+    def lookup(self, gtin, timeout=None) -> List[Any]:
+        """
+        Look up a GTIN and wait for its batch
+        
+        Args:
+            gtin (str): GTIN to look up
+            timeout (float, optional): Seconds to wait for the result. Defaults to no limit.
+        
+        Returns:
+            list: Content1Product objects for the GTIN
+        
+        Raises:
+            concurrent.futures.TimeoutError: If the result is not ready in time
+        """
+        return self.submit(gtin).result(timeout)
+    
+    def _collect(self):
+        get = self._queue.get
+        carried = None
+        while True:
+            entry = carried if carried is not None else get()
+            carried = None
+            if entry is _STOP:
+                return
+            
+            batch = [entry]
+            gtins = {entry[0]}
+            deadline = time.monotonic() + self.max_wait
+            stopping = False
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                # A full batch still takes queued lookups of its GTINs until max_wait, without waiting
+                full = len(gtins) >= self.max_batch
+                try:
+                    entry = get(block=False) if full else get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                if full and entry[0] not in gtins:
+                    carried = entry
+                    break
+                batch.append(entry)
+                gtins.add(entry[0])
+            
+            self._executor.submit(self._dispatch, batch)
+            if stopping:
+                return
+    
+    def _fetch(self, gtins):
+        requests = 0
+        products = []
+        for results in _gtin_pages(self.client, gtins, self.page_size, self.target_market, self.ip_gln, self.fields):
+            requests += 1
+            products.extend(results)
+        return products, requests
+    
+    def _dispatch(self, batch):
+        waiting = {}
+        for gtin, future in batch:
+            if future.set_running_or_notify_cancel():
+                waiting.setdefault(gtin, []).append(future)
+        if not waiting:
+            return
+        
+        gtins = list(waiting)
+        try:
+            products, requests = self._fetch(gtins)
+        except Exception as e:
+            for futures in waiting.values():
+                for future in futures:
+                    future.set_exception(e)
+            return
+        
+        found = _group_by_gtin(gtins, products)
+        with self._lock:
+            self.batches += 1
+            self.requests += requests
+        for gtin, futures in waiting.items():
+            for future in futures:
+                future.set_result(list(found[gtin]))
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the batching statistics
+        
+        Returns:
+            dict: Lookups queued, batches fetched, API requests sent and lookups per request
+        """
+        with self._lock:
+            return {
+                'lookups': self.lookups,
+                'batches': self.batches,
+                'requests': self.requests,
+                'lookups_per_request': self.lookups / self.requests if self.requests else 0.0
+            }
+    
+    def close(self):
+        """Fetch the lookups already queued, then stop the collector and the request threads"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._collector.join()
+        self._executor.shutdown(wait=True)
+    
+    def __enter__(self):
+        """Enter a context that closes the batcher on exit"""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the batcher when leaving the context"""
+        self.close()
+
+
+class BulkGtinFetch:
+    """
+    Fetch of a long GTIN list as concurrent, de-duplicated chunks
+    
+    GTINs are normalized to 14 digits, de-duplicated and split into chunks of
+    ``chunk_size``. Each chunk is fetched with every page on a worker thread, and products
+    are yielded as their pages arrive. Once iteration has finished, ``not_found`` lists
+    the GTINs no product was returned for. Iterate the fetch only once.
+    """
+    
+    def __init__(self, client, gtins, chunk_size=100, max_workers=4, page_size=1000,
+                 target_market=None, ip_gln=None, fields=None, max_pending_pages=None):
+        """
+        Initialize the fetch
+        
+        Args:
+            client (Content1Client): Client shared by all workers
+            gtins (iterable): GTINs to fetch, in any GTIN-8 to GTIN-14 form
+            chunk_size (int, optional): Number of GTINs per request. Defaults to 100.
+            max_workers (int, optional): Number of chunks fetched concurrently. Defaults to 4.
+            page_size (int, optional): Number of products per page. Defaults to 1000.
+            target_market (str, optional): Target market. Defaults to None.
+            ip_gln (str, optional): Information Provider GLN. Defaults to None.
+            fields (dict, optional): Field projection. Defaults to None.
+            max_pending_pages (int, optional): Pages buffered ahead of the consumer. Defaults to 2 * max_workers.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.client = client
+        self.gtins = list(dict.fromkeys(normalize_gtin(gtin) for gtin in gtins if str(gtin).strip()))
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.target_market = target_market
+        self.ip_gln = ip_gln
+        self.fields = fields
+        self.max_pending_pages = max_pending_pages or 2 * max_workers
+        
+        self.not_found = None
+        self.stats = {
+            'gtins': len(self.gtins),
+            'chunks': 0,
+            'pages': 0,
+            'items': 0
+        }
+        self._iterated = False
+    
+    @property
+    def chunks(self) -> List[List[str]]:
+        """Get the GTIN chunks, one request chain each"""
+        return [self.gtins[start:start + self.chunk_size] for start in range(0, len(self.gtins), self.chunk_size)]
+    
+    def _run_chunk(self, chunk, pages, stop):
+        """Walk one chunk's pages and report completion or failure on the queue"""
+        try:
+            for results in _gtin_pages(self.client, chunk, self.page_size, self.target_market, self.ip_gln, self.fields):
+                if not _put_until_stopped(pages, results, stop):
+                    return
+            _put_until_stopped(pages, None, stop)
+        except Exception as e:
+            _put_until_stopped(pages, e, stop)
+    
+    def __iter__(self):
+        """
+        Fetch all chunks concurrently, yielding products as they arrive
+        
+        Yields:
+            Content1Product: Fetched products in arrival order
+        
+        Raises:
+            RuntimeError: If the fetch is iterated a second time
+        """
+        if self._iterated:
+            raise RuntimeError("A bulk fetch can only be iterated once")
+        self._iterated = True
+        
+        chunks = self.chunks
+        found = set()
+        pages = queue.Queue(maxsize=self.max_pending_pages)
+        stop = threading.Event()
+        remaining = len(chunks)
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(chunks))))
+        try:
+            for chunk in chunks:
+                executor.submit(self._run_chunk, chunk, pages, stop)
+            
+            while remaining:
+                results = pages.get()
+                if results is None:
+                    remaining -= 1
+                    self.stats['chunks'] += 1
+                    continue
+                if isinstance(results, Exception):
+                    raise results
+                
+                self.stats['pages'] += 1
+                for product in results:
+                    found.add(normalize_gtin(product.gtin))
+                    self.stats['items'] += 1
+                    yield product
+            
+            self.not_found = [gtin for gtin in self.gtins if gtin not in found]
+        finally:
+            # Workers stop at their next page boundary once the consumer is done
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
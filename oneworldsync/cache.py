@@ -0,0 +1,226 @@
+"""
+Read-through product cache for the 1WorldSync Content1 API
+
+This module caches the products returned for each GTIN so that repeated lookups of hot
+GTINs are answered in process. Entries are keyed on (gtin, target market, information
+provider GLN, field projection), expire after a time to live, and the least recently
+used entries are evicted once the cache is full. A GTIN the API has no product for is
+cached as well, so misses for unknown GTINs do not reach the API on every lookup either,
+unless a field projection left the GTIN out of the returned products.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple
+
+from .codec import resolve_codec
+from .models import Content1ProductResults
+from .utils import normalize_gtin
+
+
+def cache_scope(target_market=None, ip_gln=None, fields=None) -> Tuple[str, str, str]:
+    """
+    Get the part of a cache key shared by every GTIN of a lookup
+    
+    Args:
+        target_market (str, optional): Target market criterion. Defaults to None.
+        ip_gln (str, optional): Information provider GLN criterion. Defaults to None.
+        fields (dict, optional): Field projection criterion with include/exclude lists. Defaults to None.
+    
+    Returns:
+        tuple: (target market, information provider GLN, canonical field projection)
+    """
+    projection = json.dumps(fields, sort_keys=True, separators=(',', ':')) if fields else ''
+    return (target_market or '', ip_gln or '', projection)
+
+
+def _matching_gtin(gtin, requested):
+    """Find the requested GTIN a returned GTIN answers, allowing for zero padding"""
+    match = requested.get(gtin)
+    return match if match is not None else requested.get(normalize_gtin(gtin))
+
+
+def _group_by_gtin(gtins, products):
+    """
+    Group returned products under the GTINs that were requested
+    
+    Args:
+        gtins (list): Requested GTINs
+        products (iterable): Content1Product objects returned for them
+    
+    Returns:
+        dict: Requested GTIN to the list of its products, empty if none was returned
+    """
+    requested = {normalize_gtin(gtin): gtin for gtin in gtins}
+    requested.update((gtin, gtin) for gtin in gtins)
+    found = {gtin: [] for gtin in gtins}
+    for product in products:
+        gtin = _matching_gtin(product.gtin, requested)
+        if gtin is not None:
+            found[gtin].append(product)
+    return found
+
+
+class ProductCache:
+    """
+    Thread-safe TTL and LRU cache of the products found for each GTIN
+    
+    Each entry holds the tuple of products the API returned for one GTIN in one scope,
+    which is empty when the GTIN was not found.
+    """
+    
+    def __init__(self, max_entries=10000, ttl=300, codec=None, clock=time.monotonic):
+        """
+        Initialize the cache
+        
+        Args:
+            max_entries (int, optional): Number of GTIN entries kept before the least recently
+                                         used one is evicted. Defaults to 10000.
+            ttl (float, optional): Seconds an entry is served after it was stored. Defaults to 300.
+            codec (JSONCodec or str, optional): JSON codec used to measure entry sizes. Defaults to the
+                                                fastest installed library.
+            clock (callable, optional): Monotonic time source in seconds. Defaults to time.monotonic.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.codec = resolve_codec(codec)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def _size(self, products):
+        # Encoded JSON size, a stable approximation of the memory held by the products
+        return sum(len(self.codec.dumps(product.data)) for product in products)
+    
+    def _remove(self, key):
+        expires, products, size = self._entries.pop(key)
+        self._bytes -= size
+    
+    def lookup(self, gtins, scope) -> Tuple[List[Any], List[str]]:
+        """
+        Look up GTINs, refreshing the recency of every hit
+        
+        Args:
+            gtins (list): Requested GTINs
+            scope (tuple): Scope from cache_scope
+        
+        Returns:
+            tuple: (cached products in request order, GTINs that must be fetched)
+        """
+        now = self._clock()
+        products = []
+        missing = []
+        with self._lock:
+            for gtin in dict.fromkeys(gtins):
+                key = (gtin,) + scope
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] <= now:
+                    self._remove(key)
+                    self.expirations += 1
+                    entry = None
+                if entry is None:
+                    self.misses += 1
+                    missing.append(gtin)
+                    continue
+                self.hits += 1
+                self._entries.move_to_end(key)
+                products.extend(entry[1])
+        return products, missing
+    
+    def store(self, gtins, scope, products):
+        """
+        Store the products fetched for a list of GTINs
+        
+        GTINs without a returned product are stored as not found, unless a returned
+        product has no GTIN (e.g. a field projection excluded it): such a product may
+        belong to any of them, so only the GTINs with matched products are stored.
+        
+        Args:
+            gtins (list): GTINs that were fetched
+            scope (tuple): Scope from cache_scope
+            products (iterable): Content1Product objects returned for the GTINs
+        """
+        products = list(products)
+        found = _group_by_gtin(gtins, products)
+        if any(not product.gtin for product in products):
+            found = {gtin: items for gtin, items in found.items() if items}
+        expires = self._clock() + self.ttl
+        sizes = {gtin: self._size(items) for gtin, items in found.items()}
+        with self._lock:
+            for gtin, items in found.items():
+                key = (gtin,) + scope
+                if key in self._entries:
+                    self._remove(key)
+                self._entries[key] = (expires, tuple(items), sizes[gtin])
+                self._bytes += sizes[gtin]
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+    
+    def invalidate(self, gtin=None):
+        """
+        Drop the entries of one GTIN in every scope, or every entry
+        
+        Args:
+            gtin (str, optional): GTIN to drop. Defaults to all entries.
+        """
+        with self._lock:
+            if gtin is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            for key in [key for key in self._entries if key[0] == gtin]:
+                self._remove(key)
+    
+    def __len__(self):
+        """Get the number of cached GTIN entries, including expired ones not yet dropped"""
+        return len(self._entries)
+    
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of GTIN lookups answered from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the cache statistics
+        
+        Returns:
+            dict: Entries, approximate memory in bytes, hits, misses, hit rate, evictions and expirations
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'memory_bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hit_rate,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
+
+
+def cached_results(products) -> Content1ProductResults:
+    """
+    Combine cached and fetched products into one results object
+    
+    Args:
+        products (list): Content1Product objects
+    
+    Returns:
+        Content1ProductResults: Results without a searchAfter value, holding the given product objects
+    """
+    results = Content1ProductResults({})
+    results.data = {'items': [product.data for product in products]}
+    results.products = list(products)
+    return results
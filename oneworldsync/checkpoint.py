@@ -0,0 +1,390 @@
+"""
+Resumable exports for the 1WorldSync Content1 API
+
+This module writes the items of a searchAfter chain to a JSON Lines file and, after every
+page, records the chain's progress (criteria, searchAfter token, page and item counts and
+the output file offset) in a small JSON state file. A state file is replaced atomically,
+and it is only written once the page it describes has been flushed to disk, so an export
+that dies at any point resumes from the last committed page: output written after that
+page is truncated and the page is fetched again, with no duplicate or missing items.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+
+from .codec import resolve_codec
+from .content1_client import _criteria_to_dict, _next_page_criteria
+from .export import split_date_range, window_criteria, product_key, _to_date
+from .models import Content1Product
+
+
+STATE_VERSION = 1
+
+
+def _as_stored(codec, value):
+    """Get a value as it reads back from a state file, e.g. with tuples turned into lists"""
+    return codec.loads(codec.dumps(value))
+
+
+def _write_atomic(path, data):
+    """
+    Replace a file with new contents so that readers see either the old or the new file
+    
+    Args:
+        path (str): File to replace
+        data (bytes): New contents
+    """
+    temporary = f"{path}.tmp"
+    with open(temporary, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+    
+    # Persist the rename itself
+    if hasattr(os, 'O_DIRECTORY'):
+        directory = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+class ExportCheckpoint:
+    """
+    Durable progress of one searchAfter chain
+    
+    Attributes:
+        criteria (dict): Search criteria of the chain, without searchAfter
+        search_after: searchAfter token of the last committed page, None before the first page
+        pages (int): Number of committed pages
+        items (int): Number of items written by committed pages
+        offset (int): Size of the output file after the last committed page
+        complete (bool): True once the last page has been committed
+    """
+    
+    def __init__(self, criteria, search_after=None, pages=0, items=0, offset=0, complete=False):
+        """
+        Initialize the checkpoint
+        
+        Args:
+            criteria (dict): Search criteria of the chain
+            search_after (optional): searchAfter token of the last committed page. Defaults to None.
+            pages (int, optional): Number of committed pages. Defaults to 0.
+            items (int, optional): Number of committed items. Defaults to 0.
+            offset (int, optional): Output file size after the last committed page. Defaults to 0.
+            complete (bool, optional): Whether the chain has been exported completely. Defaults to False.
+        """
+        self.criteria = criteria
+        self.search_after = search_after
+        self.pages = pages
+        self.items = items
+        self.offset = offset
+        self.complete = complete
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the checkpoint to a dictionary
+        
+        Returns:
+            dict: Dictionary representation stored in the state file
+        """
+        return {
+            'version': STATE_VERSION,
+            'criteria': self.criteria,
+            'search_after': self.search_after,
+            'pages': self.pages,
+            'items': self.items,
+            'offset': self.offset,
+            'complete': self.complete
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create a checkpoint from its dictionary representation
+        
+        Args:
+            data (dict): Dictionary from to_dict
+        
+        Returns:
+            ExportCheckpoint: Checkpoint
+        
+        Raises:
+            ValueError: If the state was written by an incompatible version
+        """
+        if data.get('version') != STATE_VERSION:
+            raise ValueError(f"Unsupported export state version: {data.get('version')}")
+        return cls(data['criteria'], data['search_after'], data['pages'], data['items'],
+                   data['offset'], data['complete'])
+    
+    @classmethod
+    def load(cls, path, codec=None) -> Optional['ExportCheckpoint']:
+        """
+        Load a checkpoint from a state file
+        
+        Args:
+            path (str): State file path
+            codec (JSONCodec or str, optional): JSON codec. Defaults to the fastest installed library.
+        
+        Returns:
+            ExportCheckpoint or None: The checkpoint, or None if the file does not exist
+        """
+        try:
+            with open(path, 'rb') as f:
+                return cls.from_dict(resolve_codec(codec).loads(f.read()))
+        except FileNotFoundError:
+            return None
+    
+    def save(self, path, codec=None):
+        """
+        Atomically write the checkpoint to a state file
+        
+        Args:
+            path (str): State file path
+            codec (JSONCodec or str, optional): JSON codec. Defaults to the fastest installed library.
+        """
+        _write_atomic(path, resolve_codec(codec).dumps(self.to_dict(), indent=True))
+
+
+class CheckpointedExport:
+    """
+    Export of one searchAfter chain to JSON Lines that can be resumed after a crash
+    
+    Each product's raw API data is written as one line of ``output_path``. After every
+    page the output is flushed and synced, then the checkpoint in ``state_path`` is
+    replaced. Running an export whose state file exists continues where it stopped.
+    """
+    
+    def __init__(self, client, criteria, output_path, state_path=None, page_size=1000, codec=None):
+        """
+        Initialize the export
+        
+        Args:
+            client (Content1Client): Client used for all requests
+            criteria (dict or ProductCriteria): Search criteria
+            output_path (str): JSON Lines file receiving the items
+            state_path (str, optional): Checkpoint file. Defaults to output_path + '.state.json'.
+            page_size (int, optional): Number of products per page. Defaults to 1000.
+            codec (JSONCodec or str, optional): JSON codec. Defaults to the fastest installed library.
+        """
+        self.client = client
+        self.criteria = dict(_criteria_to_dict(criteria))
+        self.criteria.pop('searchAfter', None)
+        self.output_path = str(output_path)
+        self.state_path = str(state_path) if state_path is not None else f"{self.output_path}.state.json"
+        self.page_size = page_size
+        self.codec = resolve_codec(codec)
+    
+    def checkpoint(self) -> ExportCheckpoint:
+        """
+        Get the saved checkpoint, or a new one if the export has not started
+        
+        Returns:
+            ExportCheckpoint: Current progress
+        
+        Raises:
+            ValueError: If the state file belongs to an export with different criteria
+        """
+        criteria = _as_stored(self.codec, self.criteria)
+        state = ExportCheckpoint.load(self.state_path, self.codec)
+        if state is None:
+            return ExportCheckpoint(criteria)
+        if state.criteria != criteria:
+            raise ValueError(f"{self.state_path} belongs to an export with different criteria")
+        return state
+    
+    def run(self, stop=None) -> ExportCheckpoint:
+        """
+        Export the remaining pages, committing a checkpoint after each one
+        
+        Args:
+            stop (threading.Event, optional): Event checked between pages to stop early. Defaults to None.
+        
+        Returns:
+            ExportCheckpoint: Progress after the last committed page
+        """
+        state = self.checkpoint()
+        if state.complete:
+            return state
+        
+        mode = 'r+b' if os.path.exists(self.output_path) else 'wb'
+        with open(self.output_path, mode) as out:
+            # Drop anything written after the last committed page
+            out.truncate(state.offset)
+            out.seek(state.offset)
+            
+            while not (stop is not None and stop.is_set()):
+                if state.search_after is None:
+                    page_criteria = self.criteria
+                else:
+                    page_criteria = _next_page_criteria({'searchAfter': state.search_after}, self.criteria)
+                results = self.client.fetch_products(page_criteria, self.page_size)
+                
+                out.write(b''.join(self.codec.dumps(product.data) + b'\n' for product in results))
+                out.flush()
+                os.fsync(out.fileno())
+                
+                state.pages += 1
+                state.items += len(results)
+                state.offset = out.tell()
+                state.search_after = results.search_after
+                state.complete = not len(results) or not results.search_after
+                state.save(self.state_path, self.codec)
+                
+                if state.complete:
+                    break
+        
+        return state
+    
+    def __iter__(self):
+        """
+        Iterate over the committed products in the output file
+        
+        Yields:
+            Content1Product: Each exported product
+        """
+        state = self.checkpoint()
+        if not state.offset:
+            return
+        
+        with open(self.output_path, 'rb') as f:
+            remaining = state.offset
+            for line in f:
+                remaining -= len(line)
+                if remaining < 0:
+                    return
+                yield Content1Product(self.codec.loads(line))
+
+
+class CheckpointedPartitionedExport:
+    """
+    Parallel resumable export over disjoint lastModifiedDate windows
+    
+    The date range is split as by PartitionedExporter and the plan is saved in
+    ``directory/plan.json``, so a resumed export reuses the same windows even if counts
+    have changed since. Each window is a CheckpointedExport with its own output and
+    state file in ``directory``, run on a worker thread; a window that had completed is
+    not fetched again.
+    """
+    
+    def __init__(self, client, from_date, to_date, directory, criteria=None, partitions=4,
+                 max_workers=None, page_size=1000, codec=None):
+        """
+        Initialize the export
+        
+        Args:
+            client (Content1Client): Client shared by all workers
+            from_date (str or date): First day of the export (inclusive)
+            to_date (str or date): Last day of the export (inclusive)
+            directory (str): Directory holding the plan, outputs and state files
+            criteria (dict or ProductCriteria, optional): Base search criteria. Defaults to None.
+            partitions (int, optional): Number of date windows. Defaults to 4.
+            max_workers (int, optional): Number of windows exported concurrently. Defaults to partitions.
+            page_size (int, optional): Number of products per page. Defaults to 1000.
+            codec (JSONCodec or str, optional): JSON codec. Defaults to the fastest installed library.
+        """
+        self.client = client
+        self.from_date = _to_date(from_date).isoformat()
+        self.to_date = _to_date(to_date).isoformat()
+        self.directory = str(directory)
+        self.criteria = dict(_criteria_to_dict(criteria))
+        self.partitions = partitions
+        self.max_workers = max_workers or partitions
+        self.page_size = page_size
+        self.codec = resolve_codec(codec)
+    
+    @property
+    def plan_path(self) -> str:
+        """Get the path of the saved plan"""
+        return os.path.join(self.directory, 'plan.json')
+    
+    def plan(self) -> List[Dict[str, Any]]:
+        """
+        Load the saved windows, or split the date range and save them
+        
+        Returns:
+            list: Windows as returned by split_date_range
+        
+        Raises:
+            ValueError: If the directory holds the plan of a different export
+        """
+        identity = {'from_date': self.from_date, 'to_date': self.to_date,
+                    'criteria': _as_stored(self.codec, self.criteria)}
+        try:
+            with open(self.plan_path, 'rb') as f:
+                saved = self.codec.loads(f.read())
+        except FileNotFoundError:
+            saved = None
+        
+        if saved is not None:
+            if saved['export'] != identity:
+                raise ValueError(f"{self.plan_path} belongs to a different export")
+            return saved['windows']
+        
+        os.makedirs(self.directory, exist_ok=True)
+        windows = split_date_range(self.client, self.criteria, self.from_date, self.to_date, self.partitions)
+        _write_atomic(self.plan_path, self.codec.dumps({'export': identity, 'windows': windows}, indent=True))
+        return windows
+    
+    def exports(self) -> List[CheckpointedExport]:
+        """
+        Get the export of every window
+        
+        Returns:
+            list: One CheckpointedExport per window, in date order
+        """
+        return [
+            CheckpointedExport(
+                self.client,
+                window_criteria(self.criteria, window['from_date'], window['to_date']),
+                os.path.join(self.directory, f"{window['from_date']}_{window['to_date']}.jsonl"),
+                page_size=self.page_size,
+                codec=self.codec
+            )
+            for window in self.plan()
+        ]
+    
+    def run(self) -> List[ExportCheckpoint]:
+        """
+        Export every window that is not complete yet
+        
+        If a window fails, the other windows stop at their next page boundary with their
+        progress saved, and the error is raised.
+        
+        Returns:
+            list: Final checkpoint of every window, in date order
+        """
+        exports = self.exports()
+        stop = threading.Event()
+        
+        def run_export(export):
+            try:
+                return export.run(stop)
+            except Exception:
+                stop.set()
+                raise
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(exports)) or 1) as executor:
+            futures = [executor.submit(run_export, export) for export in exports]
+            return [future.result() for future in futures]
+    
+    def __iter__(self):
+        """
+        Iterate over the committed products of every window
+        
+        A product modified while the export was running can appear in two windows;
+        it is yielded once, from the window where it was first seen.
+        
+        Yields:
+            Content1Product: Each exported product
+        """
+        seen = set()
+        for export in self.exports():
+            for product in export:
+                key = product_key(product)
+                if key not in seen:
+                    seen.add(key)
+                    yield product
@@ -6,13 +6,14 @@ Command line interface for 1WorldSync Content1 API.
 
 import os
 import sys
-import json
 import click
 from pathlib import Path
 from dotenv import load_dotenv
 from .content1_client import Content1Client
 from .exceptions import AuthenticationError, APIError
 from .criteria import ProductCriteria, DateRangeCriteria, SortField
+from .codec import dumps
+from .utils import normalize_gtin
 
 def load_credentials():
     """Load credentials from ~/.ows/credentials file"""
@@ -54,6 +55,16 @@ ONEWORLDSYNC_CONTENT1_API_URL=https://content1-api.1worldsync.com  # Optional
     
     return Content1Client(**credentials)
 
+def write_json(data, output=None):
+    """Write data as indented JSON to a file, or to stdout if no file is given"""
+    encoded = dumps(data, indent=True)
+    if output:
+        with open(output, 'wb') as f:
+            f.write(encoded)
+        click.echo(f"Results saved to {output}")
+    else:
+        click.echo(encoded.decode('utf-8'))
+
 from . import __version__
 
 @click.group()
@@ -87,8 +98,10 @@ def login():
 @click.option('--last-days', type=int, help='Fetch products modified in the last N days')
 @click.option('--brand', help='Brand name to filter by')
 @click.option('--gpc-code', help='GPC code to filter by')
+@click.option('--page-size', type=int, default=1000, show_default=True, help='Number of products per page')
+@click.option('--all', 'all_pages', is_flag=True, help='Fetch every page instead of only the first')
 @click.option('--output', '-o', help='Output file path (default: stdout)')
-def fetch(gtin, target_market, fields, last_days, brand, gpc_code, output):
+def fetch(gtin, target_market, fields, last_days, brand, gpc_code, page_size, all_pages, output):
     """Fetch product data with various filters"""
     try:
         client = get_client()
@@ -98,9 +111,8 @@ def fetch(gtin, target_market, fields, last_days, brand, gpc_code, output):
             criteria.with_target_market(target_market)
         
         if gtin:
-            # Ensure GTIN is 14 digits by padding with leading zeros if needed
-            padded_gtin = gtin.zfill(14)
-            criteria.with_gtin([padded_gtin])  # API expects an array of GTINs
+            # API expects an array of 14-digit GTINs
+            criteria.with_gtin([normalize_gtin(gtin)])
             
         if fields:
             field_list = [f.strip() for f in fields.split(',')]
@@ -115,17 +127,16 @@ def fetch(gtin, target_market, fields, last_days, brand, gpc_code, output):
         if gpc_code:
             criteria.with_gpc_code(gpc_code)
             
-        result = client.fetch_products(criteria)
-        
-        # Convert to dictionary for JSON serialization
-        result_dict = result.to_dict()
-        
-        if output:
-            with open(output, 'w') as f:
-                json.dump(result_dict, f, indent=2)
-            click.echo(f"Results saved to {output}")
+        if all_pages:
+            products = [product.to_dict() for product in client.iter_products(criteria, page_size)]
+            result_dict = {'metadata': {'search_after': None}, 'products': products}
         else:
-            click.echo(json.dumps(result_dict, indent=2))
+            result = client.fetch_products(criteria, page_size)
+            
+            # Convert to dictionary for JSON serialization
+            result_dict = result.to_dict()
+        
+        write_json(result_dict, output)
             
     except (AuthenticationError, APIError) as e:
         click.echo(f"Error: {e}", err=True)
@@ -166,9 +177,7 @@ def count(target_market, last_days, brand, gpc_code, output):
         response = {"count": result}
         
         if output:
-            with open(output, 'w') as f:
-                json.dump(response, f, indent=2)
-            click.echo(f"Results saved to {output}")
+            write_json(response, output)
         else:
             click.echo(f"Product count: {result}")
             
@@ -180,8 +189,10 @@ def count(target_market, last_days, brand, gpc_code, output):
 @click.option('--gtin', help='GTIN to fetch hierarchy for (14-digit format, pad shorter GTINs with leading zeros)')
 @click.option('--target-market', help='Target market')
 @click.option('--last-days', type=int, help='Fetch hierarchies modified in the last N days')
+@click.option('--page-size', type=int, default=1000, show_default=True, help='Number of hierarchies per page')
+@click.option('--all', 'all_pages', is_flag=True, help='Fetch every page instead of only the first')
 @click.option('--output', '-o', help='Output file path (default: stdout)')
-def hierarchy(gtin, target_market, last_days, output):
+def hierarchy(gtin, target_market, last_days, page_size, all_pages, output):
     """Fetch product hierarchy"""
     try:
         client = get_client()
@@ -191,24 +202,22 @@ def hierarchy(gtin, target_market, last_days, output):
             criteria.with_target_market(target_market)
         
         if gtin:
-            # Ensure GTIN is 14 digits by padding with leading zeros if needed
-            padded_gtin = gtin.zfill(14)
-            criteria.with_gtin([padded_gtin])  # API expects an array of GTINs
+            # API expects an array of 14-digit GTINs
+            criteria.with_gtin([normalize_gtin(gtin)])
             
         if last_days:
             criteria.with_last_modified_date(DateRangeCriteria.last_days(last_days))
             
-        result = client.fetch_hierarchies(criteria)
-        
-        # Convert to dictionary for JSON serialization
-        result_dict = result.to_dict()
-        
-        if output:
-            with open(output, 'w') as f:
-                json.dump(result_dict, f, indent=2)
-            click.echo(f"Results saved to {output}")
+        if all_pages:
+            hierarchies = [item.to_dict() for item in client.iter_hierarchies(criteria, page_size)]
+            result_dict = {'metadata': {'search_after': None}, 'hierarchies': hierarchies}
         else:
-            click.echo(json.dumps(result_dict, indent=2))
+            result = client.fetch_hierarchies(criteria, page_size)
+            
+            # Convert to dictionary for JSON serialization
+            result_dict = result.to_dict()
+        
+        write_json(result_dict, output)
             
     except (AuthenticationError, APIError) as e:
         click.echo(f"Error: {e}", err=True)
@@ -234,9 +243,7 @@ def recent(target_market, output):
         result_dict = result.to_dict()
         
         if output:
-            with open(output, 'w') as f:
-                json.dump(result_dict, f, indent=2)
-            click.echo(f"Results saved to {output}")
+            write_json(result_dict, output)
         else:
             click.echo(f"Found {len(result)} products")
             for i, product in enumerate(result):
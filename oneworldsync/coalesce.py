@@ -0,0 +1,144 @@
+"""
+Request coalescing for the 1WorldSync Content1 API
+
+When many threads or tasks ask for the same thing at the same moment, only the first
+caller sends the request; the others wait for it and get a copy of its parsed result,
+so each caller can modify its own response. Requests
+are identified by method, endpoint, query parameters and the canonical form of their
+criteria (see FrozenCriteria), so criteria built in a different order still coalesce.
+Nothing is cached: a call arriving after the request has completed sends a new one.
+"""
+
+import copy
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any
+
+from .criteria import FrozenCriteria
+
+
+def request_key(method, path, query_params=None, data=None):
+    """
+    Get the identity of a request for coalescing
+    
+    Args:
+        method (str): HTTP method
+        path (str): API endpoint path
+        query_params (dict, optional): Query parameters. Defaults to None.
+        data (dict, optional): Request body criteria. Defaults to None.
+    
+    Returns:
+        tuple: Hashable request key
+    """
+    params = tuple(sorted((str(k), str(v)) for k, v in (query_params or {}).items()))
+    criteria = None if data is None else FrozenCriteria(data).canonical
+    return (method.upper(), path, params, criteria)
+
+
+class _Stats:
+    """Counters shared by the thread and asyncio coalescers"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.executions = 0
+        self._in_flight = {}
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the coalescing statistics
+        
+        Returns:
+            dict: Calls made, requests actually sent, calls that shared another call's
+                  request, and requests currently in flight
+        """
+        return {
+            'calls': self.calls,
+            'executions': self.executions,
+            'coalesced': self.calls - self.executions,
+            'in_flight': len(self._in_flight)
+        }
+
+
+class SingleFlight(_Stats):
+    """
+    Thread-safe coalescing of identical calls in flight
+    
+    The first caller for a key runs the function; callers arriving while it runs block
+    until it finishes and get a deep copy of its result, or the same exception.
+    """
+    
+    def __init__(self):
+        """Initialize the coalescer"""
+        super().__init__()
+        self._lock = threading.Lock()
+    
+    def do(self, key, function):
+        """
+        Run a function, or wait for the identical call already running
+        
+        Args:
+            key (hashable): Identity of the call, e.g. from request_key
+            function (callable): Function called without arguments
+        
+        Returns:
+            Any: The function's result, or a deep copy of it for callers that waited
+        
+        Raises:
+            Exception: Whatever the function raised
+        """
+        with self._lock:
+            self.calls += 1
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                self.executions += 1
+                future = self._in_flight[key] = Future()
+        
+        if not leader:
+            return copy.deepcopy(future.result())
+        
+        try:
+            result = function()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+class AsyncSingleFlight(_Stats):
+    """
+    Coalescing of identical coroutine calls in flight on one event loop
+    
+    The first caller for a key starts the coroutine as a task and every caller awaits
+    it; callers other than the first get a deep copy of the result. A caller that is
+    cancelled stops waiting without cancelling the shared request.
+    """
+    
+    async def do(self, key, coroutine_function):
+        """
+        Run a coroutine function, or wait for the identical call already running
+        
+        Args:
+            key (hashable): Identity of the call, e.g. from request_key
+            coroutine_function (callable): Coroutine function called without arguments
+        
+        Returns:
+            Any: The coroutine's result, or a deep copy of it for callers that joined the flight
+        
+        Raises:
+            Exception: Whatever the coroutine raised
+        """
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            self.executions += 1
+            task = self._in_flight[key] = asyncio.ensure_future(coroutine_function())
+            task.add_done_callback(lambda done: self._in_flight.pop(key, None))
+            return await asyncio.shield(task)
+        return copy.deepcopy(await asyncio.shield(task))
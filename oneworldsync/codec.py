@@ -0,0 +1,225 @@
+"""
+JSON codecs for the 1WorldSync Content1 API
+
+This module encodes request bodies and decodes responses with the fastest JSON library
+that is installed: orjson, msgspec or ujson, falling back to the standard library.
+Install one with ``pip install oneworldsync[fast-json]``. Every codec produces and
+accepts UTF-8 encoded bytes, so the choice of library never changes the output type.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    msgspec = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    ujson = None
+
+
+class JSONCodec:
+    """
+    JSON codec based on the standard library
+    
+    Subclasses wrap faster libraries with the same interface.
+    """
+    
+    name = 'json'
+    
+    def loads(self, data) -> Any:
+        """
+        Decode a JSON document
+        
+        Args:
+            data (bytes or str): JSON document
+        
+        Returns:
+            Any: Decoded value
+        
+        Raises:
+            ValueError: If the document is not valid JSON
+        """
+        return json.loads(data)
+    
+    def dumps(self, value, indent=False) -> bytes:
+        """
+        Encode a value as JSON
+        
+        Args:
+            value: Value to encode
+            indent (bool, optional): Indent nested values by two spaces. Defaults to False.
+        
+        Returns:
+            bytes: UTF-8 encoded JSON document
+        
+        Raises:
+            TypeError: If the value cannot be encoded
+        """
+        if indent:
+            return json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+        return json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    
+    def dump(self, value, fp, indent=False):
+        """
+        Encode a value as JSON into a binary file
+        
+        Args:
+            value: Value to encode
+            fp (file): File opened in binary mode
+            indent (bool, optional): Indent nested values by two spaces. Defaults to False.
+        """
+        fp.write(self.dumps(value, indent))
+    
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    JSON codec based on orjson
+    
+    orjson decodes integers beyond 64 bits as floats and cannot encode them; such
+    values are encoded with the standard library.
+    """
+    
+    name = 'orjson'
+    
+    def loads(self, data):
+        return orjson.loads(data)
+    
+    def dumps(self, value, indent=False):
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            return super().dumps(value, indent)
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec based on msgspec"""
+    
+    name = 'msgspec'
+    
+    def __init__(self):
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+    
+    def loads(self, data):
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from None
+    
+    def dumps(self, value, indent=False):
+        encoded = self._encoder.encode(value)
+        return msgspec.json.format(encoded, indent=2) if indent else encoded
+
+
+class UjsonCodec(JSONCodec):
+    """JSON codec based on ujson"""
+    
+    name = 'ujson'
+    
+    def loads(self, data):
+        return ujson.loads(data)
+    
+    def dumps(self, value, indent=False):
+        return ujson.dumps(value, indent=2 if indent else 0, ensure_ascii=False,
+                           escape_forward_slashes=False).encode('utf-8')
+
+
+# Preferred order when no codec is requested
+_CODECS = (
+    ('orjson', orjson, OrjsonCodec),
+    ('msgspec', msgspec, MsgspecCodec),
+    ('ujson', ujson, UjsonCodec),
+    ('json', json, JSONCodec)
+)
+
+
+def available_codecs():
+    """
+    Get the names of the codecs whose library is installed
+    
+    Returns:
+        list: Codec names in order of preference
+    """
+    return [name for name, module, codec_class in _CODECS if module is not None]
+
+
+def get_codec(name=None) -> JSONCodec:
+    """
+    Create a JSON codec
+    
+    Args:
+        name (str, optional): 'orjson', 'msgspec', 'ujson' or 'json'. Defaults to the
+                              fastest installed library.
+    
+    Returns:
+        JSONCodec: Codec instance
+    
+    Raises:
+        ValueError: If the codec name is unknown
+        ImportError: If the requested library is not installed
+    """
+    for codec_name, module, codec_class in _CODECS:
+        if name is None and module is not None or name == codec_name:
+            if module is None:
+                raise ImportError(f"{codec_name} is not installed. Install it with: pip install {codec_name}")
+            return codec_class()
+    raise ValueError(f"Unknown JSON codec: {name}")
+
+
+_default_codec = get_codec()
+
+
+def resolve_codec(codec=None) -> JSONCodec:
+    """
+    Get the codec for a codec argument
+    
+    Args:
+        codec (JSONCodec or str, optional): Codec, codec name, or None for the default codec
+    
+    Returns:
+        JSONCodec: Codec instance
+    """
+    if codec is None:
+        return _default_codec
+    if isinstance(codec, JSONCodec):
+        return codec
+    return get_codec(codec)
+
+
+def loads(data):
+    """
+    Decode a JSON document with the default codec
+    
+    Args:
+        data (bytes or str): JSON document
+    
+    Returns:
+        Any: Decoded value
+    """
+    return _default_codec.loads(data)
+
+
+def dumps(value, indent=False) -> bytes:
+    """
+    Encode a value as UTF-8 JSON with the default codec
+    
+    Args:
+        value: Value to encode
+        indent (bool, optional): Indent nested values by two spaces. Defaults to False.
+    
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    return _default_codec.dumps(value, indent)
@@ -0,0 +1,175 @@
+"""
+Compressed transfer for the 1WorldSync Content1 API
+
+Full item documents are large, repetitive JSON and usually compress 5-20x. This module
+builds the ``Accept-Encoding`` value the sync client sends, listing every encoding the
+HTTP stack can decompress while the body is read: gzip and deflate always, brotli and
+zstd when their libraries are installed (``pip install oneworldsync[compression]``).
+It also keeps per-request accounting of bytes received on the wire against bytes
+decoded, so the effect of compression on bulk exports can be measured.
+"""
+
+import threading
+from collections import deque
+from typing import Dict, Any, Optional
+
+from urllib3.util import make_headers
+
+
+def accept_encoding() -> str:
+    """
+    Get the encodings the requests/urllib3 stack can decompress
+    
+    Returns:
+        str: Accept-Encoding value, e.g. 'gzip,deflate,br,zstd'
+    """
+    return make_headers(accept_encoding=True)['accept-encoding']
+
+
+def wire_bytes(response, default):
+    """
+    Get the number of body bytes a requests response pulled from the network
+    
+    Args:
+        response (requests.Response): Response whose body has been read
+        default (int): Value used when the transport does not report it
+    
+    Returns:
+        int: Compressed body size
+    """
+    try:
+        count = response.raw.tell()
+    except AttributeError:
+        return default
+    return count if isinstance(count, int) else default
+
+
+class TransferRecord:
+    """Bytes received and decoded for one response body"""
+    
+    __slots__ = ('path', 'encoding', 'wire_bytes', 'decoded_bytes')
+    
+    def __init__(self, path, encoding, wire_bytes, decoded_bytes):
+        """
+        Initialize the record
+        
+        Args:
+            path (str): API endpoint path
+            encoding (str): Content-Encoding of the response, 'identity' if uncompressed
+            wire_bytes (int): Body bytes received from the network
+            decoded_bytes (int): Body bytes after decompression
+        """
+        self.path = path
+        self.encoding = encoding
+        self.wire_bytes = wire_bytes
+        self.decoded_bytes = decoded_bytes
+    
+    @property
+    def ratio(self) -> float:
+        """Get the compression ratio (decoded bytes per wire byte)"""
+        return self.decoded_bytes / self.wire_bytes if self.wire_bytes else 1.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record to a dictionary
+        
+        Returns:
+            dict: Path, encoding, wire and decoded bytes and ratio
+        """
+        return {
+            'path': self.path,
+            'encoding': self.encoding,
+            'wire_bytes': self.wire_bytes,
+            'decoded_bytes': self.decoded_bytes,
+            'ratio': self.ratio
+        }
+    
+    def __repr__(self):
+        return (f"TransferRecord({self.path!r}, {self.encoding!r}, wire_bytes={self.wire_bytes}, "
+                f"decoded_bytes={self.decoded_bytes})")
+
+
+class TransferStats:
+    """
+    Thread-safe totals of wire and decoded bytes across requests
+    
+    The clients record every response body they read. Totals are kept per encoding, and
+    the most recent records are kept for inspection.
+    """
+    
+    def __init__(self, history_size=100):
+        """
+        Initialize the statistics
+        
+        Args:
+            history_size (int, optional): Number of recent records kept. Defaults to 100.
+        """
+        self._lock = threading.Lock()
+        self._history = deque(maxlen=history_size)
+        self._totals = {}
+    
+    def record(self, path, encoding, wire_bytes, decoded_bytes) -> TransferRecord:
+        """
+        Record one response body
+        
+        Args:
+            path (str): API endpoint path
+            encoding (str): Content-Encoding of the response, None or empty if uncompressed
+            wire_bytes (int): Body bytes received from the network
+            decoded_bytes (int): Body bytes after decompression
+        
+        Returns:
+            TransferRecord: The new record
+        """
+        entry = TransferRecord(path, encoding or 'identity', wire_bytes, decoded_bytes)
+        with self._lock:
+            self._history.append(entry)
+            totals = self._totals.setdefault(entry.encoding, [0, 0, 0])
+            totals[0] += 1
+            totals[1] += wire_bytes
+            totals[2] += decoded_bytes
+        return entry
+    
+    @property
+    def last(self) -> Optional[TransferRecord]:
+        """Get the most recent record, or None before the first response"""
+        with self._lock:
+            return self._history[-1] if self._history else None
+    
+    def history(self):
+        """
+        Get the most recent records
+        
+        Returns:
+            list: TransferRecord objects, oldest first
+        """
+        with self._lock:
+            return list(self._history)
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get the totals across all recorded responses
+        
+        Returns:
+            dict: Request count, wire and decoded bytes, overall ratio and the same totals per encoding
+        """
+        with self._lock:
+            by_encoding = {
+                encoding: {'requests': requests, 'wire_bytes': wire, 'decoded_bytes': decoded}
+                for encoding, (requests, wire, decoded) in self._totals.items()
+            }
+        wire = sum(totals['wire_bytes'] for totals in by_encoding.values())
+        decoded = sum(totals['decoded_bytes'] for totals in by_encoding.values())
+        return {
+            'requests': sum(totals['requests'] for totals in by_encoding.values()),
+            'wire_bytes': wire,
+            'decoded_bytes': decoded,
+            'ratio': decoded / wire if wire else 1.0,
+            'by_encoding': by_encoding
+        }
+    
+    def reset(self):
+        """Clear all totals and records"""
+        with self._lock:
+            self._history.clear()
+            self._totals = {}
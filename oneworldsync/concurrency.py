@@ -0,0 +1,322 @@
+"""
+Adaptive concurrency control for the 1WorldSync Content1 API client
+
+This module provides an AIMD (additive increase, multiplicative decrease) limiter for the
+number of requests in flight. The limit grows while p95 latency and error rate stay healthy
+and is cut back as soon as the API throttles (429) or requests time out.
+"""
+
+import math
+import time
+import asyncio
+import threading
+from collections import deque
+
+import requests
+
+
+SUCCESS = 'success'
+THROTTLED = 'throttled'
+TIMEOUT = 'timeout'
+ERROR = 'error'
+
+
+def _is_timeout(error):
+    """Check whether an exception raised by a transport is a timeout"""
+    return isinstance(error, (requests.exceptions.Timeout, asyncio.TimeoutError, TimeoutError))
+
+
+class _NullSlot:
+    """Slot used when no concurrency limiter is configured"""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+    
+    def record(self, status_code):
+        """Ignore the response status"""
+
+
+NULL_SLOT = _NullSlot()
+
+
+class ConcurrencySlot:
+    """
+    One permit to send a request, released with the request's outcome
+    
+    Use it as a context manager (``with limiter.slot() as slot`` or
+    ``async with limiter.async_slot() as slot``) and call ``record`` with the
+    response status. Exceptions leaving the block are counted as timeouts or errors.
+    """
+    
+    def __init__(self, limiter):
+        """
+        Initialize the slot
+        
+        Args:
+            limiter (AdaptiveConcurrencyLimiter): Limiter issuing the slot
+        """
+        self.limiter = limiter
+        self.outcome = None
+        self.started = None
+        self.epoch = None
+    
+    def record(self, status_code):
+        """
+        Record the response status of the request
+        
+        Args:
+            status_code (int): HTTP status code
+        """
+        if status_code == 429:
+            self.outcome = THROTTLED
+        elif status_code >= 500:
+            self.outcome = ERROR
+        else:
+            self.outcome = SUCCESS
+    
+    def _finish(self, exc_value):
+        if exc_value is not None and self.outcome is None:
+            self.outcome = TIMEOUT if _is_timeout(exc_value) else ERROR
+        self.limiter.release(self, time.monotonic() - self.started, self.outcome or SUCCESS)
+    
+    def __enter__(self):
+        self.limiter.acquire(self)
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._finish(exc_value)
+        return False
+    
+    async def __aenter__(self):
+        await self.limiter.acquire_async(self)
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self._finish(exc_value)
+        return False
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limiter for the number of requests in flight
+    
+    Every ``window_size`` completed requests the limiter looks at the window's p95 latency
+    and error rate. If both are healthy and the limit was actually reached, the limit grows
+    by ``increase_step``. A 429 or timeout immediately multiplies the limit by
+    ``decrease_factor``; requests that were already in flight before a decrease do not
+    cause a second one.
+    
+    The limiter can be shared by threads (``slot``) and by coroutines (``async_slot``).
+    """
+    
+    def __init__(self, initial_limit=4, min_limit=1, max_limit=64, increase_step=1,
+                 decrease_factor=0.5, latency_target=None, latency_tolerance=2.0,
+                 max_error_rate=0.05, window_size=20, history_size=256):
+        """
+        Initialize the limiter
+        
+        Args:
+            initial_limit (int, optional): Starting number of requests in flight. Defaults to 4.
+            min_limit (int, optional): Lowest limit. Defaults to 1.
+            max_limit (int, optional): Highest limit. Defaults to 64.
+            increase_step (int, optional): Additive increase after a healthy window. Defaults to 1.
+            decrease_factor (float, optional): Multiplier applied on 429s and timeouts. Defaults to 0.5.
+            latency_target (float, optional): Healthy p95 latency in seconds. If None, the lowest
+                                              window p95 seen times ``latency_tolerance`` is used.
+            latency_tolerance (float, optional): Allowed growth over the best observed p95. Defaults to 2.0.
+            max_error_rate (float, optional): Highest healthy share of failed requests. Defaults to 0.05.
+            window_size (int, optional): Number of completed requests per evaluation. Defaults to 20.
+            history_size (int, optional): Number of limit changes kept in the history. Defaults to 256.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.latency_tolerance = latency_tolerance
+        self.max_error_rate = max_error_rate
+        self.window_size = window_size
+        
+        self._limit = initial_limit
+        self._in_flight = 0
+        self._epoch = 0
+        self._saturated = False
+        self._best_p95 = None
+        self._last_p95 = None
+        self._last_error_rate = 0.0
+        self._window = []
+        self._counts = {SUCCESS: 0, THROTTLED: 0, TIMEOUT: 0, ERROR: 0}
+        self._history = deque(maxlen=history_size)
+        self._history.append({'time': time.time(), 'limit': initial_limit, 'reason': 'initial'})
+        
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._async_waiters = []
+    
+    @property
+    def limit(self):
+        """Get the current concurrency limit"""
+        return self._limit
+    
+    @property
+    def in_flight(self):
+        """Get the number of requests currently in flight"""
+        return self._in_flight
+    
+    def slot(self):
+        """
+        Get a slot for a request sent from a thread
+        
+        Returns:
+            ConcurrencySlot: Context manager that blocks until the request may be sent
+        """
+        return ConcurrencySlot(self)
+    
+    def async_slot(self):
+        """
+        Get a slot for a request sent from a coroutine
+        
+        Returns:
+            ConcurrencySlot: Async context manager that waits until the request may be sent
+        """
+        return ConcurrencySlot(self)
+    
+    def _try_acquire(self, slot):
+        # Must be called with the lock held
+        if self._in_flight >= self._limit:
+            return False
+        self._in_flight += 1
+        if self._in_flight >= self._limit:
+            self._saturated = True
+        slot.epoch = self._epoch
+        slot.started = time.monotonic()
+        return True
+    
+    def acquire(self, slot):
+        """
+        Block until the slot may send its request
+        
+        Args:
+            slot (ConcurrencySlot): Slot to admit
+        """
+        with self._condition:
+            while not self._try_acquire(slot):
+                self._condition.wait()
+    
+    async def acquire_async(self, slot):
+        """
+        Wait without blocking the event loop until the slot may send its request
+        
+        Args:
+            slot (ConcurrencySlot): Slot to admit
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._try_acquire(slot):
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await waiter
+    
+    def _wake_waiters(self):
+        # Must be called with the lock held
+        self._condition.notify_all()
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(self._resolve_waiter, waiter)
+    
+    @staticmethod
+    def _resolve_waiter(waiter):
+        if not waiter.done():
+            waiter.set_result(None)
+    
+    def _set_limit(self, limit, reason):
+        # Must be called with the lock held
+        limit = max(self.min_limit, min(self.max_limit, limit))
+        if limit != self._limit:
+            self._limit = limit
+            self._history.append({'time': time.time(), 'limit': limit, 'reason': reason})
+    
+    def release(self, slot, latency, outcome):
+        """
+        Release a slot and adjust the limit from the request outcome
+        
+        Args:
+            slot (ConcurrencySlot): Slot being released
+            latency (float): Seconds the request took
+            outcome (str): One of 'success', 'throttled', 'timeout' or 'error'
+        """
+        with self._lock:
+            self._in_flight -= 1
+            self._counts[outcome] += 1
+            
+            if outcome in (THROTTLED, TIMEOUT):
+                # Only the first failure from a generation of requests cuts the limit
+                if slot.epoch == self._epoch:
+                    self._epoch += 1
+                    self._set_limit(math.floor(self._limit * self.decrease_factor), outcome)
+                    self._window = []
+                    self._saturated = False
+            else:
+                self._window.append((latency, outcome))
+                if len(self._window) >= self.window_size:
+                    self._evaluate_window()
+            
+            self._wake_waiters()
+    
+    def _evaluate_window(self):
+        # Must be called with the lock held
+        latencies = sorted(latency for latency, outcome in self._window if outcome == SUCCESS)
+        errors = sum(1 for latency, outcome in self._window if outcome != SUCCESS)
+        self._last_error_rate = errors / len(self._window)
+        self._window = []
+        
+        if latencies:
+            self._last_p95 = latencies[max(0, math.ceil(0.95 * len(latencies)) - 1)]
+            if self._best_p95 is None or self._last_p95 < self._best_p95:
+                self._best_p95 = self._last_p95
+        
+        target = self.latency_target
+        if target is None and self._best_p95 is not None:
+            target = self._best_p95 * self.latency_tolerance
+        
+        healthy_latency = self._last_p95 is None or target is None or self._last_p95 <= target
+        healthy = healthy_latency and self._last_error_rate <= self.max_error_rate
+        
+        # Only grow if the current limit was actually used
+        if healthy and self._saturated:
+            self._set_limit(self._limit + self.increase_step, 'increase')
+        self._saturated = self._in_flight >= self._limit
+    
+    def metrics(self):
+        """
+        Get the current state of the limiter
+        
+        Returns:
+            dict: Current limit, requests in flight, last window p95 latency and error rate,
+                  outcome counts and the history of limit changes
+        """
+        with self._lock:
+            return {
+                'limit': self._limit,
+                'in_flight': self._in_flight,
+                'p95_latency': self._last_p95,
+                'error_rate': self._last_error_rate,
+                'counts': dict(self._counts),
+                'history': list(self._history)
+            }
@@ -0,0 +1,504 @@
+"""
+1WorldSync Content1 API Async Client
+
+This module provides an asyncio client for the 1WorldSync Content1 API, so that many
+requests can be in flight on a single event loop. It requires the optional ``aiohttp``
+dependency (``pip install oneworldsync[async]``).
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    aiohttp = None
+
+from .content1_auth import Content1HMACAuth
+from .content1_client import (
+    _build_signed_uri, _criteria_to_dict, _gtin_criteria, _is_clock_skew_error, _next_page_criteria, _resolve_settings
+)
+from .exceptions import APIError, AuthenticationError
+from .retry import RetryPolicy
+from .concurrency import NULL_SLOT
+from .codec import resolve_codec
+from .compression import TransferStats
+from .cache import cache_scope, cached_results
+from .coalesce import AsyncSingleFlight, request_key
+from .criteria import ProductCriteria, DateRangeCriteria
+from .models import Content1ProductResults, Content1HierarchyResults
+
+logger = logging.getLogger(__name__)
+
+
+def _wire_bytes(response, default):
+    """
+    Get the compressed size of an aiohttp response body from its Content-Length
+    
+    aiohttp decompresses while reading and does not count the bytes it received, so
+    chunked responses without a Content-Length are recorded at their decoded size.
+    
+    Args:
+        response (aiohttp.ClientResponse): Response whose body has been read
+        default (int): Decoded body size
+    
+    Returns:
+        int: Compressed body size
+    """
+    length = response.headers.get('Content-Length')
+    return int(length) if length and length.isdigit() else default
+
+
+class AsyncContent1Client:
+    """
+    Asyncio client for the 1WorldSync Content1 API
+    
+    This class mirrors the methods of Content1Client as coroutines. All requests share
+    one aiohttp session, and at most ``max_concurrency`` requests are in flight at once.
+    """
+    
+    def __init__(self, app_id=None, secret_key=None, gln=None, api_url=None, timeout=30,
+                 max_concurrency=100, limit_per_host=100, session=None, retry_policy=None,
+                 rate_limiter=None, concurrency_limiter=None, json_codec=None, compression=True,
+                 product_cache=None, coalesce=False):
+        """
+        Initialize the 1WorldSync Content1 API async client
+        
+        Args:
+            app_id (str, optional): The application ID provided by 1WorldSync.
+                                   If None, will try to get from ONEWORLDSYNC_APP_ID environment variable.
+            secret_key (str, optional): The secret key provided by 1WorldSync.
+                                       If None, will try to get from ONEWORLDSYNC_SECRET_KEY environment variable.
+            gln (str, optional): Global Location Number for the user.
+                               If None, will try to get from ONEWORLDSYNC_USER_GLN environment variable.
+            api_url (str, optional): The API URL to use.
+                                    If None, will try to get from ONEWORLDSYNC_CONTENT1_API_URL environment variable.
+                                    Defaults to production API if not specified.
+            timeout (int, optional): Request timeout in seconds. Defaults to 30.
+            max_concurrency (int, optional): Maximum number of requests in flight at once. Defaults to 100.
+            limit_per_host (int, optional): Maximum number of open connections to the API host. Defaults to 100.
+            session (aiohttp.ClientSession, optional): Session to use instead of creating one.
+                                                       A session passed in is not closed by close().
+            retry_policy (RetryPolicy, optional): Policy for retrying throttled and transient errors.
+                                                  Defaults to RetryPolicy(); use RetryPolicy.disabled() to turn retries off.
+            rate_limiter (RateLimiter, optional): Limiter consulted before every request. Defaults to None.
+            concurrency_limiter (AdaptiveConcurrencyLimiter, optional): Adaptive limit on requests in flight,
+                                                                        applied below max_concurrency. Defaults to None.
+            json_codec (JSONCodec or str, optional): Codec for request and response bodies, e.g. 'orjson'.
+                                                     Defaults to the fastest installed JSON library.
+            compression (bool, optional): Accept the compressed encodings aiohttp can decode. Defaults to True.
+            product_cache (ProductCache, optional): Read-through cache for fetch_products_by_gtin. Defaults to None.
+            coalesce (bool, optional): Share one request between concurrent identical calls. Defaults to False.
+        
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncContent1Client requires aiohttp. Install it with: pip install oneworldsync[async]")
+        
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        self.app_id, self.secret_key, self.gln, self.api_url = _resolve_settings(
+            app_id, secret_key, gln, api_url
+        )
+        
+        # aiohttp already asks for every encoding it can decode; only opting out needs a header
+        self.auth = Content1HMACAuth(self.app_id, self.secret_key, self.gln,
+                                     accept_encoding=None if compression else 'identity')
+        self.transfer_stats = TransferStats()
+        self.timeout = timeout
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.codec = resolve_codec(json_codec)
+        self.product_cache = product_cache
+        self.coalescer = AsyncSingleFlight() if coalesce else None
+        self.max_concurrency = max_concurrency
+        self.limit_per_host = limit_per_host
+        
+        # The session is created on first use so that it binds to the running event loop
+        self._owns_session = session is None
+        self._session = session
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+    
+    @property
+    def session(self):
+        """Get the shared aiohttp session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.limit_per_host)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._owns_session = True
+        return self._session
+    
+    async def close(self):
+        """
+        Close the underlying aiohttp session and release pooled connections
+        
+        Sessions passed in by the caller are left open.
+        """
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+    
+    async def __aenter__(self):
+        """Enter an async context that closes the client on exit"""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Close the client when leaving the async context"""
+        await self.close()
+    
+    async def _make_request(self, method, path, query_params=None, data=None):
+        """
+        Make a request to the 1WorldSync Content1 API
+        
+        With coalescing enabled, a call identical to one already in flight awaits it and
+        returns a copy of its parsed response.
+        
+        Args:
+            method (str): HTTP method (GET, POST, etc.)
+            path (str): API endpoint path
+            query_params (dict, optional): Query parameters. Defaults to None.
+            data (dict, optional): Request body data. Defaults to None.
+        
+        Returns:
+            dict: API response parsed as JSON
+        
+        Raises:
+            AuthenticationError: If authentication fails
+            APIError: If the API returns an error
+        """
+        if self.coalescer is None:
+            return await self._send_request(method, path, query_params, data)
+        return await self.coalescer.do(request_key(method, path, query_params, data),
+                                       lambda: self._send_request(method, path, query_params, data))
+    
+    async def _send_request(self, method, path, query_params=None, data=None):
+        """
+        Send a request to the 1WorldSync Content1 API, retrying as the retry policy allows
+        
+        Args:
+            method (str): HTTP method (GET, POST, etc.)
+            path (str): API endpoint path
+            query_params (dict, optional): Query parameters. Defaults to None.
+            data (dict, optional): Request body data. Defaults to None.
+        
+        Returns:
+            dict: API response parsed as JSON
+        
+        Raises:
+            AuthenticationError: If authentication fails
+            APIError: If the API returns an error
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        attempt = 0
+        resigned = False
+        body = None if data is None else self.codec.dumps(data)
+        
+        while True:
+            attempt += 1
+            delay = None
+            resign = False
+            
+            # Wait for our share of the request budget without blocking the event loop
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            
+            slot = self.concurrency_limiter.async_slot() if self.concurrency_limiter is not None else NULL_SLOT
+            try:
+                async with slot:
+                    async with self._semaphore:
+                        # Sign inside the semaphore so queued requests do not carry stale timestamps
+                        uri = _build_signed_uri(self.auth, path, query_params)
+                        headers = self.auth.generate_auth_headers(uri)
+                        url = f"{self.api_url}{uri}"
+                        
+                        # Never wait on a single attempt past the retry deadline
+                        remaining = self.retry_policy.remaining(loop.time() - started)
+                        timeout = self.timeout if remaining is None else max(0.001, min(self.timeout, remaining))
+                        
+                        sent_at = datetime.now(timezone.utc)
+                        async with self.session.request(method, url, data=body, headers=headers,
+                                                        timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                            slot.record(response.status)
+                            
+                            # Keep future timestamps in line with the server clock, measured at the
+                            # midpoint between sending the request and receiving the headers
+                            received_at = datetime.now(timezone.utc)
+                            offset_changed = self.auth.update_clock_offset(response.headers.get('Date'),
+                                                                           sent_at + (received_at - sent_at) / 2)
+                            
+                            # A 401 caused by clock skew is re-signed with the corrected clock, once
+                            if response.status == 401 and not resigned:
+                                resign = resigned = offset_changed or _is_clock_skew_error(await response.text())
+                            
+                            # Back off and retry throttled and transient server errors
+                            if self.retry_policy.is_retryable_status(response.status):
+                                delay = self.retry_policy.get_delay(method, attempt, loop.time() - started, response.headers)
+                            
+                            if delay is None and not resign:
+                                # Check for errors
+                                if response.status == 401:
+                                    text = await response.text()
+                                    raise AuthenticationError(f"Authentication failed: {text}")
+                                
+                                if response.status >= 400:
+                                    text = await response.text()
+                                    raise APIError(response.status, text, response)
+                                
+                                # Return empty dict for 204 No Content
+                                if response.status == 204:
+                                    return {}
+                                
+                                # Parse response, accounting for compressed transfer
+                                content = await response.read()
+                                self.transfer_stats.record(path, response.headers.get('Content-Encoding'),
+                                                           _wire_bytes(response, len(content)), len(content))
+                                return self.codec.loads(content)
+            
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                delay = self.retry_policy.get_delay(method, attempt, loop.time() - started)
+                if delay is None:
+                    raise APIError(0, str(e))
+            
+            except aiohttp.ClientError as e:
+                raise APIError(0, str(e))
+            
+            if resign:
+                logger.warning(f"Request to {path} was rejected, possibly due to clock skew "
+                               f"(offset {self.auth.clock_offset:+.1f}s); re-signing and retrying")
+                continue
+            
+            # Wait outside the semaphore so other requests can proceed
+            logger.warning(f"Request to {path} failed, retrying in {delay:.2f}s (attempt {attempt})")
+            await asyncio.sleep(delay)
+    
+    async def count_products(self, criteria=None):
+        """
+        Count products using the Content1 API
+        
+        Args:
+            criteria (dict or ProductCriteria, optional): Search criteria. Defaults to empty dict.
+        
+        Returns:
+            int: Count of products matching the criteria
+        """
+        criteria = _criteria_to_dict(criteria)
+        
+        response = await self._make_request('POST', '/V1/product/count', data=criteria)
+        return response.get('count', 0)
+    
+    async def fetch_products(self, criteria=None, page_size=1000):
+        """
+        Fetch products using the Content1 API
+        
+        Args:
+            criteria (dict or ProductCriteria, optional): Search criteria. Defaults to empty dict.
+            page_size (int, optional): Number of products to return per page. Defaults to 1000.
+        
+        Returns:
+            Content1ProductResults: Product fetch results
+        """
+        criteria = _criteria_to_dict(criteria)
+        
+        query_params = {'pageSize': page_size}
+        response = await self._make_request('POST', '/V1/product/fetch', query_params=query_params, data=criteria)
+        return Content1ProductResults(response)
+    
+    async def fetch_hierarchies(self, criteria=None, page_size=1000):
+        """
+        Fetch product hierarchies using the Content1 API
+        
+        Args:
+            criteria (dict or ProductCriteria, optional): Search criteria. Defaults to empty dict.
+            page_size (int, optional): Number of hierarchies to return per page. Defaults to 1000.
+        
+        Returns:
+            Content1HierarchyResults: Hierarchy fetch results
+        """
+        criteria = _criteria_to_dict(criteria)
+        
+        query_params = {'pageSize': page_size}
+        response = await self._make_request('POST', '/V1/product/hierarchy', query_params=query_params, data=criteria)
+        return Content1HierarchyResults(response)
+    
+    async def fetch_products_by_gtin(self, gtins, page_size=1000, target_market=None, ip_gln=None, fields=None):
+        """
+        Fetch products by GTIN
+        
+        With a product_cache, cached GTINs are answered locally and the others are fetched
+        in one request, following every page.
+        
+        Args:
+            gtins (list): List of GTINs to fetch
+            page_size (int, optional): Number of products to return per page. Defaults to 1000.
+            target_market (str, optional): Target market. Defaults to None.
+            ip_gln (str, optional): Information Provider GLN. Defaults to None.
+            fields (dict, optional): Field projection with include/exclude lists. Defaults to None.
+        
+        Returns:
+            Content1ProductResults: Product fetch results
+        """
+        criteria = _gtin_criteria(gtins, target_market, ip_gln, fields)
+        if self.product_cache is None:
+            return await self.fetch_products(criteria, page_size)
+        
+        scope = cache_scope(target_market, ip_gln, fields)
+        products, missing = self.product_cache.lookup(gtins, scope)
+        if missing:
+            criteria['gtin'] = missing
+            fetched = []
+            results = await self.fetch_products(criteria, page_size)
+            fetched.extend(results)
+            while len(results) and results.search_after:
+                results = await self.fetch_next_page(results, page_size, criteria)
+                fetched.extend(results)
+            self.product_cache.store(missing, scope, fetched)
+            products.extend(fetched)
+        return cached_results(products)
+    
+    async def fetch_products_by_ip_gln(self, ip_gln, page_size=1000):
+        """
+        Fetch products by Information Provider GLN
+        
+        Args:
+            ip_gln (str): Information Provider GLN
+            page_size (int, optional): Number of products to return per page. Defaults to 1000.
+        
+        Returns:
+            Content1ProductResults: Product fetch results
+        """
+        return await self.fetch_products({'ipGln': ip_gln}, page_size)
+    
+    async def fetch_products_by_target_market(self, target_market, page_size=1000):
+        """
+        Fetch products by target market
+        
+        Args:
+            target_market (str): Target market code (e.g., 'US')
+            page_size (int, optional): Number of products to return per page. Defaults to 1000.
+        
+        Returns:
+            Content1ProductResults: Product fetch results
+        """
+        return await self.fetch_products({'targetMarket': target_market}, page_size)
+    
+    async def fetch_next_page(self, previous_response, page_size=1000, original_criteria=None):
+        """
+        Fetch the next page of products using the searchAfter value from a previous response
+        
+        Args:
+            previous_response (dict or Content1ProductResults): Previous response from fetch_products
+            page_size (int, optional): Number of products to return per page. Defaults to 1000.
+            original_criteria (dict or ProductCriteria, optional): Original search criteria to preserve. Defaults to None.
+        
+        Returns:
+            Content1ProductResults: Next page of product fetch results
+        """
+        criteria = _next_page_criteria(previous_response, original_criteria)
+        
+        return await self.fetch_products(criteria, page_size)
+    
+    async def fetch_products_by_date_range(self, from_date, to_date, target_market=None, page_size=1000):
+        """
+        Fetch products by last modified date range
+        
+        Args:
+            from_date (str): Start date in YYYY-MM-DD format
+            to_date (str): End date in YYYY-MM-DD format
+            target_market (str, optional): Target market code (e.g., 'US'). Defaults to None.
+            page_size (int, optional): Number of products to return per page. Defaults to 1000.
+        
+        Returns:
+            Content1ProductResults: Product fetch results
+        """
+        criteria = ProductCriteria()
+        criteria.with_last_modified_date(DateRangeCriteria.between(from_date, to_date))
+        
+        if target_market:
+            criteria.with_target_market(target_market)
+        
+        return await self.fetch_products(criteria, page_size)
+    
+    async def fetch_products_last_30_days(self, target_market=None, page_size=1000):
+        """
+        Fetch products modified in the last 30 days
+        
+        Args:
+            target_market (str, optional): Target market code (e.g., 'US'). Defaults to None.
+            page_size (int, optional): Number of products to return per page. Defaults to 1000.
+        
+        Returns:
+            Content1ProductResults: Product fetch results
+        """
+        criteria = ProductCriteria()
+        criteria.with_last_modified_date(DateRangeCriteria.last_30_days())
+        
+        if target_market:
+            criteria.with_target_market(target_market)
+        
+        return await self.fetch_products(criteria, page_size)
+    
+    async def fetch_products_by_brand(self, brand_name, target_market=None, page_size=1000):
+        """
+        Fetch products by brand name
+        
+        Args:
+            brand_name (str): Brand name to search for
+            target_market (str, optional): Target market code (e.g., 'US'). Defaults to None.
+            page_size (int, optional): Number of products to return per page. Defaults to 1000.
+        
+        Returns:
+            Content1ProductResults: Product fetch results
+        """
+        criteria = ProductCriteria().with_brand_name(brand_name)
+        
+        if target_market:
+            criteria.with_target_market(target_market)
+        
+        return await self.fetch_products(criteria, page_size)
+    
+    async def fetch_products_by_gpc_code(self, gpc_code, target_market=None, page_size=1000):
+        """
+        Fetch products by GPC code
+        
+        Args:
+            gpc_code (str): GPC code to search for
+            target_market (str, optional): Target market code (e.g., 'US'). Defaults to None.
+            page_size (int, optional): Number of products to return per page. Defaults to 1000.
+        
+        Returns:
+            Content1ProductResults: Product fetch results
+        """
+        criteria = ProductCriteria().with_gpc_code(gpc_code)
+        
+        if target_market:
+            criteria.with_target_market(target_market)
+        
+        return await self.fetch_products(criteria, page_size)
+    
+    async def fetch_products_by_upc(self, upc_code, target_market=None, page_size=1000):
+        """
+        Fetch products by UPC code
+        
+        Args:
+            upc_code (str): UPC code to search for
+            target_market (str, optional): Target market code (e.g., 'US'). Defaults to None.
+            page_size (int, optional): Number of products to return per page. Defaults to 1000.
+        
+        Returns:
+            Content1ProductResults: Product fetch results
+        """
+        criteria = ProductCriteria().with_upc_code(upc_code)
+        
+        if target_market:
+            criteria.with_target_market(target_market)
+        
+        return await self.fetch_products(criteria, page_size)
@@ -9,7 +9,33 @@ import base64
 import hashlib
 import hmac
 import urllib.parse
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+
+
+def _parse_http_date(value):
+    """
+    Parse an HTTP date header value (e.g. a response Date header)
+    
+    Args:
+        value (str): Header value
+        
+    Returns:
+        datetime or None: Timezone-aware datetime, or None if the value cannot be parsed
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    
+    try:
+        parsed = parsedate_to_datetime(value.strip())
+    except (TypeError, ValueError):
+        return None
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
 
 
 class Content1HMACAuth:
@@ -18,9 +44,16 @@ class Content1HMACAuth:
     
     This class handles the HMAC authentication process required by the 1WorldSync Content1 API.
     It generates the necessary hash code based on the request parameters and secret key.
+    
+    Timestamps follow the server clock: the clients report every response's Date header
+    to ``update_clock_offset``, and the measured offset is added to the local clock.
     """
     
-    def __init__(self, app_id, secret_key, gln=None):
+    # Date headers have one-second resolution and arrive after network latency,
+    # so smaller differences are not treated as clock skew
+    CLOCK_SKEW_THRESHOLD = 2.0
+    
+    def __init__(self, app_id, secret_key, gln=None, accept_encoding=None):
         """
         Initialize the HMAC authentication with app_id and secret_key
         
@@ -28,10 +61,79 @@ class Content1HMACAuth:
             app_id (str): The application ID provided by 1WorldSync
             secret_key (str): The secret key provided by 1WorldSync
             gln (str, optional): Global Location Number for the user
+            accept_encoding (str, optional): Accept-Encoding header sent with every request,
+                                             e.g. compression.accept_encoding(). Defaults to None
+                                             (left to the HTTP library).
         """
-        self.app_id = app_id
+        self._app_id = app_id
+        self._gln = gln
+        self._accept_encoding = accept_encoding
         self.secret_key = secret_key
-        self.gln = gln
+        self.clock_offset = 0.0
+        self._build_header_template()
+    
+    @property
+    def app_id(self):
+        """Get the application ID"""
+        return self._app_id
+    
+    @app_id.setter
+    def app_id(self, value):
+        """Set the application ID and rebuild the header template"""
+        self._app_id = value
+        self._build_header_template()
+    
+    @property
+    def gln(self):
+        """Get the user GLN"""
+        return self._gln
+    
+    @gln.setter
+    def gln(self, value):
+        """Set the user GLN and rebuild the header template"""
+        self._gln = value
+        self._build_header_template()
+    
+    @property
+    def accept_encoding(self):
+        """Get the Accept-Encoding header value, or None if it is left to the HTTP library"""
+        return self._accept_encoding
+    
+    @accept_encoding.setter
+    def accept_encoding(self, value):
+        """Set the Accept-Encoding header value and rebuild the header template"""
+        self._accept_encoding = value
+        self._build_header_template()
+    
+    @property
+    def secret_key(self):
+        """Get the secret key"""
+        return self._secret_key
+    
+    @secret_key.setter
+    def secret_key(self, value):
+        """Set the secret key and precompute the keyed HMAC state"""
+        self._secret_key = value
+        # The key is encoded and the inner/outer pads are computed once; each hash copies this state
+        self._hmac = hmac.new(bytes(value, 'utf-8'), digestmod=hashlib.sha256)
+    
+    def _build_header_template(self):
+        """Build the immutable headers shared by every request; only hashCode varies"""
+        headers = {
+            'Content-Type': 'application/json',
+            'accept': 'application/json',
+            'appId': self._app_id  # Changed from 'appid' to 'appId' to match API requirements
+        }
+        
+        # Add GLN if provided
+        if self._gln:
+            headers['gln'] = self._gln
+        
+        # Ask for a compressed body the HTTP library can decode while reading it
+        if self._accept_encoding:
+            headers['Accept-Encoding'] = self._accept_encoding
+        
+        self.header_template = MappingProxyType(headers)
     
     def generate_timestamp(self):
         """
@@ -40,7 +142,49 @@ class Content1HMACAuth:
         Returns:
             str: Timestamp in ISO 8601 format (YYYY-MM-DDThh:mm:ssZ)
         """
-        return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        now = datetime.now(timezone.utc)
+        
+        # Shift to the server clock if the local clock has drifted
+        if self.clock_offset:
+            now += timedelta(seconds=self.clock_offset)
+        
+        return now.strftime('%Y-%m-%dT%H:%M:%SZ')
+    
+    def update_clock_offset(self, date_header, local_time=None):
+        """
+        Measure the local clock's offset from the server clock using a response Date header
+        
+        The header is compared with the local time at which the server produced it, so
+        the time spent downloading the body is not counted as skew. Offsets below
+        CLOCK_SKEW_THRESHOLD seconds are ignored, and the stored offset only changes
+        when a new measurement differs from it by at least the threshold.
+        
+        Args:
+            date_header (str): Value of the response Date header
+            local_time (datetime, optional): Local UTC time at which the server answered, e.g. the
+                                             midpoint between sending the request and receiving the
+                                             response headers. Defaults to now.
+            
+        Returns:
+            bool: True if the offset applied to timestamps changed
+        """
+        server_time = _parse_http_date(date_header)
+        if server_time is None:
+            return False
+        
+        if local_time is None:
+            local_time = datetime.now(timezone.utc)
+        
+        # The header is truncated to the second, so on average it is half a second behind
+        offset = (server_time - local_time).total_seconds() + 0.5
+        if abs(offset) < self.CLOCK_SKEW_THRESHOLD:
+            offset = 0.0
+        
+        if abs(offset - self.clock_offset) < self.CLOCK_SKEW_THRESHOLD:
+            return False
+        
+        self.clock_offset = offset
+        return True
     
     def generate_hash(self, uri):
         """
@@ -55,15 +199,12 @@ class Content1HMACAuth:
         # According to the error "Hashcode mismatch", we need to ensure our hash matches
         # what the server expects. Let's try without URL encoding the URI.
         
-        # Create an HMAC using SHA256 and the secret key
-        hash_obj = hmac.new(
-            bytes(self.secret_key, 'utf-8'),
-            bytes(uri, 'utf-8'),
-            hashlib.sha256
-        )
+        # Copy the precomputed keyed HMAC (SHA256 with the secret key) instead of rebuilding it
+        hash_obj = self._hmac.copy()
+        hash_obj.update(uri.encode('utf-8'))
         
         # Return the Base64-encoded hash
-        return base64.b64encode(hash_obj.digest()).decode('utf-8')
+        return base64.b64encode(hash_obj.digest()).decode('ascii')
     
     def generate_auth_headers(self, uri):
         """
@@ -82,19 +223,30 @@ class Content1HMACAuth:
         # print(f"DEBUG - URI for hash generation: {uri}")
         # print(f"DEBUG - Generated hash code: {hash_code}")
         
-        # Create headers
-        headers = {
-            'Content-Type': 'application/json',
-            'accept': 'application/json',
-            'appId': self.app_id,  # Changed from 'appid' to 'appId' to match API requirements
-            'hashCode': hash_code  # Changed from 'hashcode' to 'hashCode' to match API requirements
-        }
-        
-        # Add GLN if provided
-        if self.gln:
-            headers['gln'] = self.gln
+        # Fill the hash code into a copy of the header template
+        # hashCode changed from 'hashcode' to match API requirements
+        headers = {**self.header_template, 'hashCode': hash_code}
         
         # Debug information
         # print(f"DEBUG - Generated headers: {headers}")
         
-        return headers
\ No newline at end of file
+        return headers
+    
+    def sign_many(self, uris):
+        """
+        Generate authentication headers for many URIs at once
+        
+        Args:
+            uris (iterable): URIs (path + query parameters) to sign
+            
+        Returns:
+            list: Header dicts in the same order as the URIs
+        """
+        template = self.header_template
+        keyed = self._hmac
+        headers = []
+        for uri in uris:
+            hash_obj = keyed.copy()
+            hash_obj.update(uri.encode('utf-8'))
+            headers.append({**template, 'hashCode': base64.b64encode(hash_obj.digest()).decode('ascii')})
+        return headers
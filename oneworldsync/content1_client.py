@@ -6,13 +6,198 @@ This module provides a client for interacting with the 1WorldSync Content1 API.
 
 import os
 import json
+import time
+import queue
+import logging
+import threading
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Union
 from .content1_auth import Content1HMACAuth
 from .exceptions import APIError, AuthenticationError
-from .criteria import ProductCriteria, DateRangeCriteria, SortField
-from .models import Content1ProductResults, Content1HierarchyResults
+from .retry import RetryPolicy
+from .concurrency import NULL_SLOT
+from .codec import resolve_codec
+from .compression import TransferStats, accept_encoding, wire_bytes
+from .criteria import ProductCriteria, FrozenCriteria, DateRangeCriteria, SortField
+from .models import Content1ProductResults, Content1HierarchyResults, Content1Hierarchy
+from .streaming import StreamedResults
+from .cache import cache_scope, cached_results
+from .coalesce import SingleFlight, request_key
+
+logger = logging.getLogger(__name__)
+
+
+def _criteria_to_dict(criteria):
+    """
+    Normalize criteria passed to a fetch method into a request body dict
+    
+    Args:
+        criteria (dict, ProductCriteria, FrozenCriteria or None): Search criteria
+    
+    Returns:
+        dict: Criteria dictionary
+    """
+    if criteria is None:
+        return {}
+    if isinstance(criteria, (ProductCriteria, FrozenCriteria)):
+        return criteria.build()
+    return criteria
+
+
+def _build_signed_uri(auth, path, query_params=None):
+    """
+    Build the URI (path + query parameters) to sign, adding a fresh timestamp
+    
+    Args:
+        auth (Content1HMACAuth): Authentication used to generate the timestamp
+        path (str): API endpoint path
+        query_params (dict, optional): Query parameters. Defaults to None.
+    
+    Returns:
+        str: URI with sorted query parameters, including the timestamp
+    """
+    # Initialize parameters if None
+    query_params = dict(query_params) if query_params else {}
+    
+    # Add timestamp to query parameters
+    query_params['timestamp'] = auth.generate_timestamp()
+    
+    # Build the URI (path + query parameters) - exactly as in TypeScript implementation
+    # Sort query parameters to ensure consistent order
+    sorted_params = sorted(query_params.items())
+    query_string = '&'.join([f"{k}={v}" for k, v in sorted_params])
+    return f"{path}?{query_string}"
+
+
+def _is_clock_skew_error(text):
+    """
+    Check whether a 401 response body blames the request timestamp
+    
+    Args:
+        text (str): Response body
+    
+    Returns:
+        bool: True if the error mentions the timestamp
+    """
+    return isinstance(text, str) and 'timestamp' in text.lower()
+
+
+def _resolve_settings(app_id=None, secret_key=None, gln=None, api_url=None):
+    """
+    Resolve client settings from parameters and environment variables
+    
+    Args:
+        app_id (str, optional): The application ID, or ONEWORLDSYNC_APP_ID
+        secret_key (str, optional): The secret key, or ONEWORLDSYNC_SECRET_KEY
+        gln (str, optional): Global Location Number, or ONEWORLDSYNC_USER_GLN
+        api_url (str, optional): The API URL, or ONEWORLDSYNC_CONTENT1_API_URL
+    
+    Returns:
+        tuple: (app_id, secret_key, gln, api_url)
+    
+    Raises:
+        ValueError: If the app ID or secret key is missing
+    """
+    # Get credentials from environment variables if not provided
+    app_id = app_id or os.environ.get('ONEWORLDSYNC_APP_ID')
+    secret_key = secret_key or os.environ.get('ONEWORLDSYNC_SECRET_KEY')
+    gln = gln or os.environ.get('ONEWORLDSYNC_USER_GLN')
+    
+    # Get API URL from environment variable if not provided
+    default_api_url = 'https://content1-api.1worldsync.com'
+    api_url = api_url or os.environ.get('ONEWORLDSYNC_CONTENT1_API_URL', default_api_url)
+    
+    # Remove trailing slash if present
+    if api_url.endswith('/'):
+        api_url = api_url[:-1]
+    
+    # Validate required parameters
+    if not app_id or not secret_key:
+        raise ValueError("ONEWORLDSYNC_APP_ID and ONEWORLDSYNC_SECRET_KEY must be provided either as parameters or environment variables")
+    
+    return app_id, secret_key, gln, api_url
+
+
+def _next_page_criteria(previous_response, original_criteria=None):
+    """
+    Build the criteria for the page following a previous response
+    
+    Args:
+        previous_response (dict, Content1ProductResults, Content1HierarchyResults or StreamedResults): Previous response
+        original_criteria (dict or ProductCriteria, optional): Original search criteria to preserve. Defaults to None.
+    
+    Returns:
+        dict: Criteria including the searchAfter value of the previous response
+    
+    Raises:
+        ValueError: If the previous response does not contain a searchAfter value
+    """
+    # Handle Content1ProductResults and Content1HierarchyResults objects
+    if isinstance(previous_response, (Content1ProductResults, Content1HierarchyResults, StreamedResults)):
+        search_after = previous_response.search_after
+    else:
+        if 'searchAfter' not in previous_response:
+            raise ValueError("Previous response does not contain searchAfter value")
+        search_after = previous_response['searchAfter']
+    
+    # Handle original criteria
+    if original_criteria is None:
+        criteria = {}
+    elif isinstance(original_criteria, (ProductCriteria, FrozenCriteria)):
+        criteria = original_criteria.build()
+    else:
+        criteria = original_criteria.copy()
+    
+    # Add searchAfter parameter
+    criteria['searchAfter'] = search_after
+    
+    return criteria
+
+
+def _gtin_criteria(gtins, target_market=None, ip_gln=None, fields=None):
+    """
+    Build the criteria of a GTIN lookup
+    
+    Args:
+        gtins (list): GTINs to fetch
+        target_market (str, optional): Target market. Defaults to None.
+        ip_gln (str, optional): Information Provider GLN. Defaults to None.
+        fields (dict, optional): Field projection with include/exclude lists. Defaults to None.
+    
+    Returns:
+        dict: Search criteria
+    """
+    criteria = {'gtin': list(gtins)}
+    if target_market:
+        criteria['targetMarket'] = target_market
+    if ip_gln:
+        criteria['ipGln'] = ip_gln
+    if fields:
+        criteria['fields'] = fields
+    return criteria
+
+
+def _put_until_stopped(pages, item, stop):
+    """
+    Put an item on a bounded queue, giving up once the consumer has stopped
+    
+    Args:
+        pages (queue.Queue): Bounded queue shared with the consumer
+        item: Item to put on the queue
+        stop (threading.Event): Set by the consumer when it no longer reads the queue
+    
+    Returns:
+        bool: True if the item was queued
+    """
+    while not stop.is_set():
+        try:
+            pages.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
 
 
 class Content1Client:
@@ -23,7 +208,10 @@ class Content1Client:
     handling authentication, request construction, and response parsing.
     """
     
-    def __init__(self, app_id=None, secret_key=None, gln=None, api_url=None, timeout=30):
+    def __init__(self, app_id=None, secret_key=None, gln=None, api_url=None, timeout=30,
+                 pool_connections=10, pool_maxsize=10, keep_alive=True, session=None, retry_policy=None,
+                 rate_limiter=None, concurrency_limiter=None, json_codec=None, compression=True,
+                 product_cache=None, coalesce=False):
         """
         Initialize the 1WorldSync Content1 API client
         
@@ -38,103 +226,251 @@ class Content1Client:
                                     If None, will try to get from ONEWORLDSYNC_CONTENT1_API_URL environment variable.
                                     Defaults to production API if not specified.
             timeout (int, optional): Request timeout in seconds. Defaults to 30.
+            pool_connections (int, optional): Number of host connection pools to cache. Defaults to 10.
+            pool_maxsize (int, optional): Maximum number of connections kept open per host. Defaults to 10.
+            keep_alive (bool, optional): Reuse connections between requests. Defaults to True.
+            session (requests.Session, optional): Session to use instead of creating one.
+                                                  A session passed in is not closed by close().
+            retry_policy (RetryPolicy, optional): Policy for retrying throttled and transient errors.
+                                                  Defaults to RetryPolicy(); use RetryPolicy.disabled() to turn retries off.
+            rate_limiter (RateLimiter, optional): Limiter consulted before every request, e.g. a
+                                                  TokenBucketRateLimiter shared by several clients. Defaults to None.
+            concurrency_limiter (AdaptiveConcurrencyLimiter, optional): Limiter bounding the requests in
+                                                                        flight across threads. Defaults to None.
+            json_codec (JSONCodec or str, optional): Codec for request and response bodies, e.g. 'orjson'.
+                                                     Defaults to the fastest installed JSON library.
+            compression (bool, optional): Ask for gzip/deflate, and brotli/zstd when installed, compressed
+                                          responses. Defaults to True.
+            product_cache (ProductCache, optional): Read-through cache for fetch_products_by_gtin. Defaults to None.
+            coalesce (bool, optional): Share one request between concurrent identical calls. Defaults to False.
         """
-        # Get credentials from environment variables if not provided
-        self.app_id = app_id or os.environ.get('ONEWORLDSYNC_APP_ID')
-        self.secret_key = secret_key or os.environ.get('ONEWORLDSYNC_SECRET_KEY')
-        self.gln = gln or os.environ.get('ONEWORLDSYNC_USER_GLN')
+        self.app_id, self.secret_key, self.gln, self.api_url = _resolve_settings(
+            app_id, secret_key, gln, api_url
+        )
         
-        # Get API URL from environment variable if not provided
-        default_api_url = 'https://content1-api.1worldsync.com'
-        self.api_url = api_url or os.environ.get('ONEWORLDSYNC_CONTENT1_API_URL', default_api_url)
+        self.auth = Content1HMACAuth(self.app_id, self.secret_key, self.gln,
+                                     accept_encoding=accept_encoding() if compression else 'identity')
+        self.transfer_stats = TransferStats()
+        self.timeout = timeout
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.codec = resolve_codec(json_codec)
+        self.product_cache = product_cache
+        self.coalescer = SingleFlight() if coalesce else None
+        
+        # Share one pooled session across all requests so pages reuse the same TCP/TLS connection
+        self._owns_session = session is None
+        self.session = session if session is not None else self._create_session(
+            pool_connections, pool_maxsize, keep_alive
+        )
+        
+    @staticmethod
+    def _create_session(pool_connections, pool_maxsize, keep_alive):
+        """
+        Create a connection-pooled session for the client
         
-        # Remove trailing slash if present
-        if self.api_url.endswith('/'):
-            self.api_url = self.api_url[:-1]
+        Args:
+            pool_connections (int): Number of host connection pools to cache
+            pool_maxsize (int): Maximum number of connections kept open per host
+            keep_alive (bool): Reuse connections between requests
+    
+        Returns:
+            requests.Session: Configured session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
         
-        # Validate required parameters
-        if not self.app_id or not self.secret_key:
-            raise ValueError("ONEWORLDSYNC_APP_ID and ONEWORLDSYNC_SECRET_KEY must be provided either as parameters or environment variables")
+        if not keep_alive:
+            session.headers['Connection'] = 'close'
         
-        self.auth = Content1HMACAuth(self.app_id, self.secret_key, self.gln)
-        self.timeout = timeout
+        return session
+    
+    def close(self):
+        """
+        Close the underlying HTTP session and release pooled connections
+        
+        Sessions passed in by the caller are left open.
+        """
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self):
+        """Enter a context that closes the client on exit"""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the client when leaving the context"""
+        self.close()
+    
+    def _build_uri(self, path, query_params=None):
+        """
+        Build the URI (path + query parameters) to sign, adding a fresh timestamp
+        
+        Args:
+            path (str): API endpoint path
+            query_params (dict, optional): Query parameters. Defaults to None.
+        
+        Returns:
+            str: URI with sorted query parameters, including the timestamp
+        """
+        return _build_signed_uri(self.auth, path, query_params)
     
-    def _make_request(self, method, path, query_params=None, data=None):
+    def _make_request(self, method, path, query_params=None, data=None, stream=False):
         """
         Make a request to the 1WorldSync Content1 API
         
+        With coalescing enabled, a call identical to one already in flight waits for it
+        and returns a copy of its parsed response. Streamed requests are never coalesced.
+        
         Args:
             method (str): HTTP method (GET, POST, etc.)
             path (str): API endpoint path
             query_params (dict, optional): Query parameters. Defaults to None.
             data (dict, optional): Request body data. Defaults to None.
+            stream (bool, optional): Return the successful response with its body unread
+                                     instead of parsing it. Defaults to False.
             
         Returns:
-            dict: API response parsed as JSON
+            dict: API response parsed as JSON, or the requests.Response if stream is True
             
         Raises:
             AuthenticationError: If authentication fails
             APIError: If the API returns an error
         """
-        # Initialize parameters if None
-        if query_params is None:
-            query_params = {}
-        
-        # Add timestamp to query parameters
-        timestamp = self.auth.generate_timestamp()
-        query_params['timestamp'] = timestamp
-        
-        # Build the URI (path + query parameters) - exactly as in TypeScript implementation
-        uri = path
-        if query_params:
-            # Sort query parameters to ensure consistent order
-            sorted_params = sorted(query_params.items())
-            query_string = '&'.join([f"{k}={v}" for k, v in sorted_params])
-            uri = f"{path}?{query_string}"
-        
-        # Get authentication headers
-        headers = self.auth.generate_auth_headers(uri)
-        
-        # Build the full URL
-        url = f"{self.api_url}{uri}"
-        # Debug Print - equivalent curl command for debugging
-        # data_str = "" if data is None else f" -d '{json.dumps(data)}'"
-        # headers_str = " ".join([f"-H \"{k}: {v}\"" for k, v in headers.items()])
-        # curl_cmd = f"curl -X {method} \"{url}\" {headers_str}{data_str}"
-        # print(f"Equivalent curl command:\n{curl_cmd}")
+        if self.coalescer is None or stream:
+            return self._send_request(method, path, query_params, data, stream)
+        return self.coalescer.do(request_key(method, path, query_params, data),
+                                 lambda: self._send_request(method, path, query_params, data))
         
-        try:
-            # Make the request
-            response = requests.request(
-                method,
-                url,
-                json=data,
-                headers=headers,
-                timeout=self.timeout
-            )
+    def _send_request(self, method, path, query_params=None, data=None, stream=False):
+        """
+        Send a request to the 1WorldSync Content1 API, retrying as the retry policy allows
+        
+        Args:
+            method (str): HTTP method (GET, POST, etc.)
+            path (str): API endpoint path
+            query_params (dict, optional): Query parameters. Defaults to None.
+            data (dict, optional): Request body data. Defaults to None.
+            stream (bool, optional): Return the successful response with its body unread
+                                     instead of parsing it. Defaults to False.
+        
+        Returns:
+            dict: API response parsed as JSON, or the requests.Response if stream is True
+        
+        Raises:
+            AuthenticationError: If authentication fails
+            APIError: If the API returns an error
+        """
+        started = time.monotonic()
+        attempt = 0
+        resigned = False
+        body = None if data is None else self.codec.dumps(data)
+        
+        while True:
+            attempt += 1
+            
+            # Wait for our share of the request budget before signing
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            
+            # Every attempt gets a fresh timestamp and hash code
+            uri = self._build_uri(path, query_params)
+            
+            # Get authentication headers
+            headers = self.auth.generate_auth_headers(uri)
+            
+            # Build the full URL
+            url = f"{self.api_url}{uri}"
+            # Debug Print - equivalent curl command for debugging
+            # data_str = "" if body is None else f" -d '{body.decode()}'"
+            # headers_str = " ".join([f"-H \"{k}: {v}\"" for k, v in headers.items()])
+            # curl_cmd = f"curl -X {method} \"{url}\" {headers_str}{data_str}"
+            # print(f"Equivalent curl command:\n{curl_cmd}")
+            
+            # Never wait on a single attempt past the retry deadline
+            remaining = self.retry_policy.remaining(time.monotonic() - started)
+            timeout = self.timeout if remaining is None else max(0.001, min(self.timeout, remaining))
             
+            slot = self.concurrency_limiter.slot() if self.concurrency_limiter is not None else NULL_SLOT
+            try:
+                with slot:
+                    # Make the request on the pooled session
+                    sent_at = datetime.now(timezone.utc)
+                    response = self.session.request(
+                        method,
+                        url,
+                        data=body,
+                        headers=headers,
+                        timeout=timeout,
+                        stream=stream
+                    )
+                    slot.record(response.status_code)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                delay = self.retry_policy.get_delay(method, attempt, time.monotonic() - started)
+                if delay is None:
+                    raise APIError(0, str(e))
+                logger.warning(f"Request to {path} failed ({e}), retrying in {delay:.2f}s (attempt {attempt})")
+                time.sleep(delay)
+                continue
+            except requests.exceptions.RequestException as e:
+                raise APIError(0, str(e))
+            
+            # Keep future timestamps in line with the server clock, measured at the midpoint
+            # between sending the request and receiving the headers
+            offset_changed = self.auth.update_clock_offset(response.headers.get('Date'),
+                                                           sent_at + response.elapsed / 2)
+            
+            # A 401 caused by clock skew is re-signed with the corrected clock, once
+            if response.status_code == 401 and not resigned and (offset_changed or _is_clock_skew_error(response.text)):
+                resigned = True
+                logger.warning(f"Request to {path} was rejected, possibly due to clock skew "
+                               f"(offset {self.auth.clock_offset:+.1f}s); re-signing and retrying")
+                response.close()
+                continue
+            
+            # Back off and retry throttled and transient server errors
+            if self.retry_policy.is_retryable_status(response.status_code):
+                delay = self.retry_policy.get_delay(method, attempt, time.monotonic() - started, response.headers)
+                if delay is not None:
+                    logger.warning(f"Request to {path} returned {response.status_code}, retrying in {delay:.2f}s (attempt {attempt})")
+                    response.close()
+                    time.sleep(delay)
+                    continue
+            
+            break
+        
+        try:
             # Check for errors
             if response.status_code == 401:
                 error_message = f"Authentication failed: {response.text}"
-                print(f"Authentication error details: Status {response.status_code}, Response: {response.text}")
-                print(f"Request URL: {url}")
-                print(f"Request headers: {headers}")
+                logger.error(f"Authentication error details: Status {response.status_code}, "
+                             f"Response: {response.text}, Request URL: {url}")
                 raise AuthenticationError(error_message)
             
             if response.status_code >= 400:
-                print(f"API error details: Status {response.status_code}, Response: {response.text}")
+                logger.error(f"API error details: Status {response.status_code}, Response: {response.text}")
                 raise APIError(
                     response.status_code,
                     response.text,
                     response
                 )
             
+            # Leave the body to be read incrementally by the caller
+            if stream:
+                return response
+            
             # Return empty dict for 204 No Content
             if response.status_code == 204:
                 return {}
             
-            # Parse response
-            return response.json()
+            # Parse response, accounting for compressed transfer
+            content = response.content
+            self.transfer_stats.record(path, response.headers.get('Content-Encoding'),
+                                       wire_bytes(response, len(content)), len(content))
+            return self.codec.loads(content)
         
         except requests.exceptions.RequestException as e:
             raise APIError(0, str(e))
@@ -149,10 +485,7 @@ class Content1Client:
         Returns:
             int: Count of products matching the criteria
         """
-        if criteria is None:
-            criteria = {}
-        elif isinstance(criteria, ProductCriteria):
-            criteria = criteria.build()
+        criteria = _criteria_to_dict(criteria)
         
         response = self._make_request('POST', '/V1/product/count', data=criteria)
         return response.get('count', 0)
@@ -168,10 +501,7 @@ class Content1Client:
         Returns:
             Content1ProductResults: Product fetch results
         """
-        if criteria is None:
-            criteria = {}
-        elif isinstance(criteria, ProductCriteria):
-            criteria = criteria.build()
+        criteria = _criteria_to_dict(criteria)
         
         query_params = {'pageSize': page_size}
         response = self._make_request('POST', '/V1/product/fetch', query_params=query_params, data=criteria)
@@ -188,30 +518,117 @@ class Content1Client:
         Returns:
             Content1HierarchyResults: Hierarchy fetch results
         """
-        if criteria is None:
-            criteria = {}
-        elif isinstance(criteria, ProductCriteria):
-            criteria = criteria.build()
+        criteria = _criteria_to_dict(criteria)
         
         query_params = {'pageSize': page_size}
         response = self._make_request('POST', '/V1/product/hierarchy', query_params=query_params, data=criteria)
         return Content1HierarchyResults(response)
     
-    def fetch_products_by_gtin(self, gtins, page_size=1000):
+    def stream_products(self, criteria=None, page_size=1000, chunk_size=65536):
+        """
+        Fetch one page of products, parsing the response while it is being received
+        
+        Unlike fetch_products, the page is never held in memory as a whole: each product
+        is yielded as soon as its JSON is complete. Iterate the results once; their
+        search_after is available after iteration and can be passed to fetch_next_page
+        or stream_next_page.
+        
+        Args:
+            criteria (dict or ProductCriteria, optional): Search criteria. Defaults to empty dict.
+            page_size (int, optional): Number of products to return per page. Defaults to 1000.
+            chunk_size (int, optional): Bytes read from the response at a time. Defaults to 65536.
+        
+        Returns:
+            StreamedResults: Products of the page, parsed on iteration
+        """
+        criteria = _criteria_to_dict(criteria)
+        
+        query_params = {'pageSize': page_size}
+        response = self._make_request('POST', '/V1/product/fetch', query_params=query_params,
+                                      data=criteria, stream=True)
+        return StreamedResults(response, chunk_size=chunk_size, transfer_stats=self.transfer_stats,
+                               path='/V1/product/fetch')
+    
+    def stream_hierarchies(self, criteria=None, page_size=1000, chunk_size=65536):
+        """
+        Fetch one page of hierarchies, parsing the response while it is being received
+        
+        Args:
+            criteria (dict or ProductCriteria, optional): Search criteria. Defaults to empty dict.
+            page_size (int, optional): Number of hierarchies to return per page. Defaults to 1000.
+            chunk_size (int, optional): Bytes read from the response at a time. Defaults to 65536.
+        
+        Returns:
+            StreamedResults: Hierarchies of the page, parsed on iteration
+        """
+        criteria = _criteria_to_dict(criteria)
+        
+        query_params = {'pageSize': page_size}
+        response = self._make_request('POST', '/V1/product/hierarchy', query_params=query_params,
+                                      data=criteria, stream=True)
+        return StreamedResults(response, Content1Hierarchy, 'hierarchies', chunk_size, self.transfer_stats,
+                               '/V1/product/hierarchy')
+    
+    def fetch_products_by_gtin(self, gtins, page_size=1000, target_market=None, ip_gln=None, fields=None):
         """
         Fetch products by GTIN
         
+        With a product_cache, cached GTINs are answered locally and the others are fetched
+        in one request, following every page; the results then hold all products for the
+        GTINs and no searchAfter value.
+        
         Args:
             gtins (list): List of GTINs to fetch
             page_size (int, optional): Number of products to return per page. Defaults to 1000.
+            target_market (str, optional): Target market. Defaults to None.
+            ip_gln (str, optional): Information Provider GLN. Defaults to None.
+            fields (dict, optional): Field projection with include/exclude lists. Defaults to None.
             
         Returns:
-            dict: Product fetch results
+            Content1ProductResults: Product fetch results
         """
-        criteria = {
-            'gtin': gtins
-        }
-        return self.fetch_products(criteria, page_size)
+        criteria = _gtin_criteria(gtins, target_market, ip_gln, fields)
+        if self.product_cache is None:
+            return self.fetch_products(criteria, page_size)
+        
+        scope = cache_scope(target_market, ip_gln, fields)
+        products, missing = self.product_cache.lookup(gtins, scope)
+        if missing:
+            criteria['gtin'] = missing
+            fetched = []
+            results = self.fetch_products(criteria, page_size)
+            fetched.extend(results)
+            while len(results) and results.search_after:
+                results = self.fetch_next_page(results, page_size, criteria)
+                fetched.extend(results)
+            self.product_cache.store(missing, scope, fetched)
+            products.extend(fetched)
+        return cached_results(products)
+    
+    def bulk_fetch_by_gtin(self, gtins, chunk_size=100, max_workers=4, page_size=1000,
+                           target_market=None, ip_gln=None, fields=None):
+        """
+        Fetch the products of a long GTIN list in concurrent chunks
+        
+        GTINs are padded to 14 digits and de-duplicated, split into chunks of chunk_size,
+        and the chunks are fetched with every page on max_workers threads. The client's
+        connection pool should allow at least max_workers connections per host.
+        
+        Args:
+            gtins (iterable): GTINs to fetch
+            chunk_size (int, optional): Number of GTINs per request. Defaults to 100.
+            max_workers (int, optional): Number of chunks fetched concurrently. Defaults to 4.
+            page_size (int, optional): Number of products per page. Defaults to 1000.
+            target_market (str, optional): Target market. Defaults to None.
+            ip_gln (str, optional): Information Provider GLN. Defaults to None.
+            fields (dict, optional): Field projection with include/exclude lists. Defaults to None.
+        
+        Returns:
+            BulkGtinFetch: Iterable of products in arrival order; its not_found list holds the
+                           GTINs without products once iteration has finished
+        """
+        from .batch import BulkGtinFetch
+        return BulkGtinFetch(self, gtins, chunk_size, max_workers, page_size, target_market, ip_gln, fields)
     
     def fetch_products_by_ip_gln(self, ip_gln, page_size=1000):
         """
@@ -257,26 +674,148 @@ class Content1Client:
         Returns:
             Content1ProductResults: Next page of product fetch results
         """
-        # Handle Content1ProductResults object
-        if isinstance(previous_response, Content1ProductResults):
-            search_after = previous_response.search_after
-        else:
-            if 'searchAfter' not in previous_response:
-                raise ValueError("Previous response does not contain searchAfter value")
-            search_after = previous_response['searchAfter']
-        
-        # Handle original criteria
-        if original_criteria is None:
-            criteria = {}
-        elif isinstance(original_criteria, ProductCriteria):
-            criteria = original_criteria.build()
-        else:
-            criteria = original_criteria.copy()
-        
-        # Add searchAfter parameter
-        criteria['searchAfter'] = search_after
+        criteria = _next_page_criteria(previous_response, original_criteria)
         
         return self.fetch_products(criteria, page_size)
+    
+    def stream_next_page(self, previous_response, page_size=1000, original_criteria=None):
+        """
+        Stream the page of products following a previous response
+        
+        Args:
+            previous_response (dict, Content1ProductResults or StreamedResults): Previous response.
+                                                                             Streamed results must have been iterated.
+            page_size (int, optional): Number of products to return per page. Defaults to 1000.
+            original_criteria (dict or ProductCriteria, optional): Original search criteria to preserve. Defaults to None.
+        
+        Returns:
+            StreamedResults: Next page of products, parsed on iteration
+        """
+        criteria = _next_page_criteria(previous_response, original_criteria)
+        
+        return self.stream_products(criteria, page_size)
+    
+    def _iter_streamed(self, stream, criteria=None, page_size=1000):
+        """
+        Iterate over every element of a searchAfter chain, parsing each page as it arrives
+        
+        Args:
+            stream (callable): Stream method taking (criteria, page_size), e.g. stream_products
+            criteria (dict or ProductCriteria, optional): Search criteria. Defaults to empty dict.
+            page_size (int, optional): Number of results per page. Defaults to 1000.
+        
+        Yields:
+            Content1Product or Content1Hierarchy: Each element in the result set
+        """
+        criteria = dict(_criteria_to_dict(criteria))
+        page_criteria = criteria
+        while True:
+            results = stream(page_criteria, page_size)
+            yield from results
+            if not results.count or not results.search_after:
+                return
+            page_criteria = _next_page_criteria(results, criteria)
+    
+    def _iter_pages(self, fetch, criteria=None, page_size=1000, prefetch=1):
+        """
+        Iterate over the pages of a searchAfter chain, fetching ahead on a background thread
+        
+        Args:
+            fetch (callable): Fetch method taking (criteria, page_size), e.g. fetch_products
+            criteria (dict or ProductCriteria, optional): Search criteria. Defaults to empty dict.
+            page_size (int, optional): Number of results per page. Defaults to 1000.
+            prefetch (int, optional): Number of pages fetched ahead of the consumer.
+                                      0 fetches each page only when it is needed. Defaults to 1.
+        
+        Yields:
+            Content1ProductResults or Content1HierarchyResults: Each page of results
+        """
+        criteria = dict(_criteria_to_dict(criteria))
+        
+        def walk():
+            page_criteria = criteria
+            while True:
+                results = fetch(page_criteria, page_size)
+                yield results
+                if not len(results) or not results.search_after:
+                    return
+                page_criteria = _next_page_criteria(results, criteria)
+        
+        if prefetch < 1:
+            yield from walk()
+            return
+        
+        pages = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        done = object()
+        
+        def produce():
+            try:
+                for results in walk():
+                    if not _put_until_stopped(pages, results, stop):
+                        return
+                _put_until_stopped(pages, done, stop)
+            except Exception as e:
+                _put_until_stopped(pages, e, stop)
+        
+        producer = threading.Thread(target=produce, name='oneworldsync-prefetch', daemon=True)
+        producer.start()
+        try:
+            while True:
+                results = pages.get()
+                if results is done:
+                    return
+                if isinstance(results, Exception):
+                    raise results
+                yield results
+        finally:
+            stop.set()
+    
+    def iter_products(self, criteria=None, page_size=1000, prefetch=1, stream=False):
+        """
+        Iterate lazily over all products matching the criteria, across every page
+        
+        The next page is fetched on a background thread while the current one is
+        being consumed, so network latency overlaps with processing. With ``stream=True``
+        each page is instead parsed while it is received, so only one product is held
+        in memory at a time; pages are then fetched one after the other.
+        
+        Args:
+            criteria (dict or ProductCriteria, optional): Search criteria. Defaults to empty dict.
+            page_size (int, optional): Number of products to fetch per page. Defaults to 1000.
+            prefetch (int, optional): Number of pages fetched ahead of the consumer. Defaults to 1.
+            stream (bool, optional): Parse responses incrementally. Ignores prefetch. Defaults to False.
+        
+        Yields:
+            Content1Product: Each product in the result set
+        """
+        if stream:
+            yield from self._iter_streamed(self.stream_products, criteria, page_size)
+            return
+        
+        for results in self._iter_pages(self.fetch_products, criteria, page_size, prefetch):
+            yield from results
+    
+    def iter_hierarchies(self, criteria=None, page_size=1000, prefetch=1, stream=False):
+        """
+        Iterate lazily over all hierarchies matching the criteria, across every page
+        
+        Args:
+            criteria (dict or ProductCriteria, optional): Search criteria. Defaults to empty dict.
+            page_size (int, optional): Number of hierarchies to fetch per page. Defaults to 1000.
+            prefetch (int, optional): Number of pages fetched ahead of the consumer. Defaults to 1.
+            stream (bool, optional): Parse responses incrementally. Ignores prefetch. Defaults to False.
+        
+        Yields:
+            Content1Hierarchy: Each hierarchy in the result set
+        """
+        if stream:
+            yield from self._iter_streamed(self.stream_hierarchies, criteria, page_size)
+            return
+        
+        for results in self._iter_pages(self.fetch_hierarchies, criteria, page_size, prefetch):
+            yield from results
+    
     def fetch_products_by_date_range(self, from_date, to_date, target_market=None, page_size=1000):
         """
         Fetch products by last modified date range
@@ -4,7 +4,13 @@ Criteria builders for the 1WorldSync Content1 API
 This module provides classes to build search criteria for the 1WorldSync Content1 API.
 """
 
-from datetime import datetime, timedelta
+import re
+import copy
+import json
+import hashlib
+from collections.abc import Mapping
+from datetime import date, datetime, time, timedelta, timezone
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional, Union
 
 
@@ -273,6 +279,161 @@ class ProductCriteria:
         Build the criteria dictionary
         
         Returns:
-            dict: Complete criteria dictionary
+            dict: Copy of the complete criteria dictionary, which can be changed without
+                  affecting this builder
         """
-        return self._criteria
\ No newline at end of file
+        return copy.deepcopy(self._criteria)
+    
+    def freeze(self) -> 'FrozenCriteria':
+        """
+        Build an immutable, hashable criteria value
+        
+        Returns:
+            FrozenCriteria: Frozen copy of the criteria
+        """
+        return FrozenCriteria(self._criteria)
+
+
+# Criteria whose list values are sets, so their order does not change the criteria
+_SET_VALUED = frozenset(('gtin', 'include', 'exclude'))
+
+# Criteria echoed back to the API exactly as it returned them
+_OPAQUE = frozenset(('searchAfter',))
+
+# ISO 8601 dates and date-times, e.g. 2024-01-01, 2024-01-01T00:00:00 or 2024-01-01T12:00:00Z
+_ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?')
+
+
+def _canonical_datetime(value):
+    """Get the ISO form of a date-time: a plain date at midnight, UTC when it has a time zone"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).isoformat()
+    if value.time() == time(0):
+        return value.date().isoformat()
+    return value.isoformat()
+
+
+def _canonical(value, key=None):
+    """Convert a criteria value to plain JSON types with normalized dates and GTIN sets"""
+    if key in _OPAQUE:
+        return value
+    if isinstance(value, Mapping):
+        return {str(k): _canonical(v, k) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_canonical(item) for item in value]
+        if key in _SET_VALUED:
+            return sorted(set(items), key=str)
+        return items
+    if isinstance(value, datetime):
+        return _canonical_datetime(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, str):
+        if key in _SET_VALUED:
+            return [value]
+        if _ISO_DATE.fullmatch(value):
+            try:
+                return _canonical_datetime(datetime.fromisoformat(value))
+            except ValueError:
+                return value
+    return value
+
+
+def _freeze(value):
+    """Convert a canonical criteria value to read-only containers"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class FrozenCriteria(Mapping):
+    """
+    Immutable, hashable search criteria
+    
+    Criteria are normalized when frozen: GTINs and field projections are sorted sets,
+    dates, date-times and ISO date strings share one ISO form (a plain date at midnight,
+    UTC for times with a zone), and nested values become read-only. searchAfter tokens
+    are kept as returned by the API. The canonical byte form (compact JSON with sorted
+    keys) and its SHA-256 digest are computed once, so equal criteria built in any order
+    hash and compare in O(1) and can key response caches, request coalescing and
+    checkpoint files.
+    """
+    
+    __slots__ = ('_criteria', '_canonical', '_digest', '_hash')
+    
+    def __init__(self, criteria=None):
+        """
+        Freeze search criteria
+        
+        Args:
+            criteria (dict, ProductCriteria or FrozenCriteria, optional): Criteria to freeze. Defaults to empty criteria.
+        """
+        if isinstance(criteria, ProductCriteria):
+            criteria = criteria._criteria
+        canonical = _canonical(criteria or {})
+        self._criteria = _freeze(canonical)
+        self._canonical = json.dumps(canonical, sort_keys=True, separators=(',', ':'),
+                                     ensure_ascii=False).encode('utf-8')
+        self._digest = hashlib.sha256(self._canonical).hexdigest()
+        self._hash = hash(self._canonical)
+    
+    @property
+    def canonical(self) -> bytes:
+        """Get the canonical JSON encoding of the criteria"""
+        return self._canonical
+    
+    @property
+    def digest(self) -> str:
+        """Get the hex SHA-256 digest of the canonical encoding"""
+        return self._digest
+    
+    def build(self) -> Dict[str, Any]:
+        """
+        Build a mutable criteria dictionary, e.g. for a request body
+        
+        Returns:
+            dict: Criteria dictionary with lists instead of tuples
+        """
+        return json.loads(self._canonical)
+    
+    def replace(self, **changes) -> 'FrozenCriteria':
+        """
+        Get a copy with some criteria changed or, when set to None, removed
+        
+        Args:
+            **changes: Criteria keys and their new values
+        
+        Returns:
+            FrozenCriteria: New frozen criteria
+        """
+        criteria = self.build()
+        for key, value in changes.items():
+            if value is None:
+                criteria.pop(key, None)
+            else:
+                criteria[key] = value
+        return FrozenCriteria(criteria)
+    
+    def __getitem__(self, key):
+        return self._criteria[key]
+    
+    def __iter__(self):
+        return iter(self._criteria)
+    
+    def __len__(self):
+        return len(self._criteria)
+    
+    def __hash__(self):
+        return self._hash
+    
+    def __eq__(self, other):
+        if isinstance(other, FrozenCriteria):
+            return self._hash == other._hash and self._canonical == other._canonical
+        if isinstance(other, (Mapping, ProductCriteria)):
+            return self._canonical == FrozenCriteria(other)._canonical
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"FrozenCriteria({self._canonical.decode('utf-8')})"
\ No newline at end of file
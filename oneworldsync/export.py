@@ -0,0 +1,275 @@
+"""
+Bulk export for the 1WorldSync Content1 API
+
+This module provides a partitioned exporter that splits a lastModifiedDate range into
+disjoint windows of similar size and walks each window's searchAfter chain concurrently.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+
+from .content1_client import _criteria_to_dict, _put_until_stopped
+from .criteria import DateRangeCriteria
+
+
+def _to_date(value):
+    """
+    Convert a YYYY-MM-DD string, date or datetime to a date
+    
+    Args:
+        value (str, date or datetime): Date value
+    
+    Returns:
+        date: Parsed date
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+def product_key(product):
+    """
+    Get the identity of a product used to de-duplicate merged exports
+    
+    Args:
+        product (Content1Product): Product from a fetch response
+    
+    Returns:
+        tuple: (gtin, information provider GLN, target market)
+    """
+    return (product.gtin, product.information_provider_gln, product.target_market)
+
+
+def window_criteria(criteria, from_date, to_date):
+    """
+    Build the criteria for one lastModifiedDate window
+    
+    Args:
+        criteria (dict or ProductCriteria): Base search criteria
+        from_date (str or date): First day of the window (inclusive)
+        to_date (str or date): Last day of the window (inclusive)
+    
+    Returns:
+        dict: Copy of the base criteria restricted to the window
+    """
+    windowed = dict(_criteria_to_dict(criteria))
+    windowed.pop('searchAfter', None)
+    windowed['lastModifiedDate'] = DateRangeCriteria.between(
+        _to_date(from_date).isoformat(), _to_date(to_date).isoformat()
+    )
+    return windowed
+
+
+def split_date_range(client, criteria, from_date, to_date, partitions):
+    """
+    Split a date range into disjoint windows holding a similar number of products
+    
+    Window boundaries are found by binary search over cumulative counts from
+    ``count_products``, so planning costs roughly ``partitions * log2(days)`` count calls.
+    Windows are whole days and never overlap: each one starts the day after the
+    previous one ends.
+    
+    Args:
+        client (Content1Client): Client used to count products
+        criteria (dict or ProductCriteria): Base search criteria
+        from_date (str or date): First day of the range (inclusive)
+        to_date (str or date): Last day of the range (inclusive)
+        partitions (int): Desired number of windows
+    
+    Returns:
+        list: List of dicts with ``from_date``, ``to_date`` (YYYY-MM-DD) and estimated ``count``
+    """
+    start = _to_date(from_date)
+    end = _to_date(to_date)
+    if end < start:
+        raise ValueError("to_date must not be before from_date")
+    if partitions < 1:
+        raise ValueError("partitions must be at least 1")
+    
+    days = (end - start).days + 1
+    cumulative_counts = {}
+    
+    def cumulative(offset):
+        # Number of products modified between start and start + offset days (inclusive)
+        if offset < 0:
+            return 0
+        if offset not in cumulative_counts:
+            cumulative_counts[offset] = client.count_products(
+                window_criteria(criteria, start, start + timedelta(days=offset))
+            )
+        return cumulative_counts[offset]
+    
+    total = cumulative(days - 1)
+    
+    # Find the last day of each window by binary search over cumulative counts
+    boundaries = []
+    for k in range(1, min(partitions, days)):
+        target = total * k / partitions
+        low = boundaries[-1] + 1 if boundaries else 0
+        high = days - 1
+        while low < high:
+            middle = (low + high) // 2
+            if cumulative(middle) >= target:
+                high = middle
+            else:
+                low = middle + 1
+        if low < days - 1 and (not boundaries or low > boundaries[-1]):
+            boundaries.append(low)
+    boundaries.append(days - 1)
+    
+    windows = []
+    previous = -1
+    for boundary in boundaries:
+        windows.append({
+            'from_date': (start + timedelta(days=previous + 1)).isoformat(),
+            'to_date': (start + timedelta(days=boundary)).isoformat(),
+            'count': cumulative(boundary) - cumulative(previous)
+        })
+        previous = boundary
+    
+    return windows
+
+
+class PartitionedExporter:
+    """
+    Parallel exporter over disjoint lastModifiedDate windows
+    
+    Each window's searchAfter chain is walked on its own worker thread. Pages are merged
+    into a single stream of products, identified by GTIN, information provider GLN and
+    target market. Only products that can be returned twice are remembered: those
+    modified on a window's first or last day, where adjacent windows meet, and those
+    modified since the export started, which move into a later window. Memory therefore
+    follows the number of such products rather than the size of the export. A product
+    modified while the export is running is yielded once if its new version arrives
+    first; if its old version was already yielded, the new version follows it.
+    
+    The client is shared by all workers, so its connection pool should allow at least
+    ``max_workers`` connections per host (``Content1Client(pool_maxsize=...)``). To let
+    the number of requests in flight adapt to the API instead of staying at
+    ``max_workers``, give the client an AdaptiveConcurrencyLimiter.
+    """
+    
+    def __init__(self, client, from_date, to_date, criteria=None, partitions=4,
+                 max_workers=None, page_size=1000, max_pending_pages=None):
+        """
+        Initialize the exporter
+        
+        Args:
+            client (Content1Client): Client used for all requests
+            from_date (str or date): First day of the export (inclusive)
+            to_date (str or date): Last day of the export (inclusive)
+            criteria (dict or ProductCriteria, optional): Base search criteria, e.g. a target market.
+                                                         Defaults to None.
+            partitions (int, optional): Number of date windows. Defaults to 4.
+            max_workers (int, optional): Number of windows fetched concurrently. Defaults to partitions.
+            page_size (int, optional): Number of products per page. Defaults to 1000.
+            max_pending_pages (int, optional): Pages buffered ahead of the consumer. Defaults to 2 * max_workers.
+        """
+        self.client = client
+        self.from_date = from_date
+        self.to_date = to_date
+        self.criteria = _criteria_to_dict(criteria)
+        self.partitions = partitions
+        self.max_workers = max_workers or partitions
+        self.page_size = page_size
+        self.max_pending_pages = max_pending_pages or 2 * self.max_workers
+        
+        self.windows = None
+        self.stats = {
+            'pages': 0,
+            'items': 0,
+            'duplicates': 0,
+            'tracked': 0
+        }
+    
+    def plan(self):
+        """
+        Split the date range into windows of similar size
+        
+        Returns:
+            list: Windows as returned by split_date_range
+        """
+        if self.windows is None:
+            self.windows = split_date_range(
+                self.client, self.criteria, self.from_date, self.to_date, self.partitions
+            )
+        return self.windows
+    
+    def _walk_window(self, window, pages, stop):
+        """
+        Walk one window's searchAfter chain, putting each page on the queue
+        
+        Args:
+            window (dict): Window to export
+            pages (queue.Queue): Queue receiving (window, results) pairs
+            stop (threading.Event): Set when the consumer stops early
+        """
+        criteria = window_criteria(self.criteria, window['from_date'], window['to_date'])
+        results = self.client.fetch_products(criteria, self.page_size)
+        
+        while _put_until_stopped(pages, (window, results), stop):
+            if not len(results) or not results.search_after:
+                break
+            results = self.client.fetch_next_page(results, self.page_size, original_criteria=criteria)
+    
+    def _run_window(self, window, pages, stop):
+        """Run a window walk and report completion or failure on the queue"""
+        try:
+            self._walk_window(window, pages, stop)
+            _put_until_stopped(pages, (window, None), stop)
+        except Exception as e:
+            _put_until_stopped(pages, (window, e), stop)
+    
+    def __iter__(self):
+        """
+        Export all windows concurrently, yielding each product once
+        
+        Yields:
+            Content1Product: Exported products in arrival order
+        """
+        windows = [window for window in self.plan() if window['count']]
+        if not windows:
+            return
+        
+        pages = queue.Queue(maxsize=self.max_pending_pages)
+        stop = threading.Event()
+        seen = set()
+        boundary_days = {window[edge] for window in windows for edge in ('from_date', 'to_date')}
+        # A day earlier than the start, as lastModifiedDate may carry another UTC offset
+        recent_day = (datetime.now(timezone.utc) - timedelta(days=1)).date().isoformat()
+        remaining = len(windows)
+        
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(windows)))
+        try:
+            for window in windows:
+                executor.submit(self._run_window, window, pages, stop)
+            
+            while remaining:
+                window, results = pages.get()
+                
+                if results is None:
+                    remaining -= 1
+                    continue
+                if isinstance(results, Exception):
+                    raise results
+                
+                self.stats['pages'] += 1
+                for product in results:
+                    key = product_key(product)
+                    if key in seen:
+                        self.stats['duplicates'] += 1
+                        continue
+                    day = product.last_modified_date[:10]
+                    if day in boundary_days or day >= recent_day:
+                        seen.add(key)
+                        self.stats['tracked'] += 1
+                    self.stats['items'] += 1
+                    yield product
+        finally:
+            # Workers stop at their next page boundary once the consumer is done
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,374 @@
+"""
+Columnar product container for the 1WorldSync Content1 API
+
+This module provides ProductFrame, which stores product fields column by column instead
+of as one dict per product. Every column is dictionary-encoded: each distinct value is
+stored once and rows hold small integer codes in an ``array``. Filters, group-bys and
+counts work on the codes, so a condition is evaluated once per distinct value rather
+than once per product. With NumPy installed the codes are scanned as NumPy arrays, and
+columns can be exported to NumPy arrays or an Arrow table when those optional
+dependencies are installed (``pip install oneworldsync[frame]``).
+"""
+
+import math
+from array import array
+from collections import Counter
+from typing import List, Dict, Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    np = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    pa = None
+
+from .models import Content1ProductResults
+
+
+# Unsigned 32-bit codes, which is also the index type used for Arrow dictionaries
+_CODE_TYPE = 'I' if array('I').itemsize == 4 else 'L'
+
+DEFAULT_COLUMNS = (
+    'gtin',
+    'information_provider_gln',
+    'target_market',
+    'last_modified_date',
+    'brand_name',
+    'gpc_category',
+    'gpc_category_name',
+    'gtin_name',
+    'alternate_classification_code'
+)
+
+
+def _code_array(codes):
+    """View an array of codes as a NumPy uint32 array without copying"""
+    return np.frombuffer(codes, dtype=np.uint32)
+
+
+class _Column:
+    """Dictionary-encoded column: distinct values plus one integer code per row"""
+    
+    __slots__ = ('values', 'index', 'codes')
+    
+    def __init__(self, values=None, codes=None):
+        self.values = list(values) if values is not None else []
+        self.index = {value: code for code, value in enumerate(self.values)}
+        self.codes = codes if codes is not None else array(_CODE_TYPE)
+    
+    def append(self, value):
+        code = self.index.get(value)
+        if code is None:
+            code = len(self.values)
+            self.index[value] = code
+            self.values.append(value)
+        self.codes.append(code)
+    
+    def matching_codes(self, condition):
+        """
+        Get the codes of the distinct values that satisfy a condition
+        
+        Args:
+            condition: A value, a set/list/tuple of values, or a callable taking a value
+        
+        Returns:
+            set: Matching codes
+        """
+        if callable(condition):
+            return {code for code, value in enumerate(self.values) if condition(value)}
+        if isinstance(condition, (set, frozenset, list, tuple)):
+            return {self.index[value] for value in condition if value in self.index}
+        if condition in self.index:
+            return {self.index[condition]}
+        return set()
+    
+    def take(self, rows):
+        """Get a new column holding the given rows"""
+        if np is not None and isinstance(rows, np.ndarray):
+            codes = array(_CODE_TYPE)
+            codes.frombytes(_code_array(self.codes)[rows].tobytes())
+            return _Column(self.values, codes)
+        codes = self.codes
+        return _Column(self.values, array(_CODE_TYPE, [codes[row] for row in rows]))
+    
+    def to_list(self):
+        values = self.values
+        return [values[code] for code in self.codes]
+
+
+class ProductFrame:
+    """
+    Columnar, dictionary-encoded table of products
+    
+    Products are appended from fetch results or any iterable of products, e.g.
+    ``ProductFrame(client.iter_products(criteria))``. Only the configured columns are
+    kept; the product objects and raw response data are not retained.
+    
+    Each column is a Content1Product property returning a hashable value (usually a string).
+    """
+    
+    def __init__(self, products=None, columns=DEFAULT_COLUMNS):
+        """
+        Initialize the frame
+        
+        Args:
+            products (iterable, optional): Products or Content1ProductResults pages to append. Defaults to None.
+            columns (tuple, optional): Content1Product property names to store. Defaults to DEFAULT_COLUMNS.
+        """
+        self._columns = {name: _Column() for name in columns}
+        self._length = 0
+        
+        if products is not None:
+            self.extend(products)
+    
+    @classmethod
+    def _from_columns(cls, columns, length):
+        frame = cls(columns=())
+        frame._columns = columns
+        frame._length = length
+        return frame
+    
+    @property
+    def columns(self) -> List[str]:
+        """Get the column names"""
+        return list(self._columns)
+    
+    def __len__(self):
+        """Get the number of rows"""
+        return self._length
+    
+    def append(self, product):
+        """
+        Append one product as a row
+        
+        Args:
+            product (Content1Product): Product to append
+        """
+        for name, column in self._columns.items():
+            column.append(getattr(product, name))
+        self._length += 1
+    
+    def extend(self, products):
+        """
+        Append many products
+        
+        Args:
+            products (iterable): Products, or Content1ProductResults pages from fetch_products
+        """
+        if isinstance(products, Content1ProductResults):
+            products = products.products
+        
+        for product in products:
+            if isinstance(product, Content1ProductResults):
+                self.extend(product)
+            else:
+                self.append(product)
+    
+    def column(self, name) -> List[Any]:
+        """
+        Get the values of a column
+        
+        Args:
+            name (str): Column name
+        
+        Returns:
+            list: One value per row
+        """
+        return self._get_column(name).to_list()
+    
+    def _get_column(self, name):
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise KeyError(f"Unknown column: {name}") from None
+    
+    def _matching_rows(self, conditions):
+        """Get the indices of the rows satisfying every condition"""
+        if np is not None and conditions:
+            mask = None
+            for name, condition in conditions.items():
+                column = self._get_column(name)
+                matching = np.fromiter(column.matching_codes(condition), dtype=np.uint32)
+                rows = np.isin(_code_array(column.codes), matching)
+                mask = rows if mask is None else mask & rows
+            return np.flatnonzero(mask)
+        
+        rows = None
+        for name, condition in conditions.items():
+            column = self._get_column(name)
+            codes = column.codes
+            matching = column.matching_codes(condition)
+            if rows is None:
+                rows = [row for row, code in enumerate(codes) if code in matching]
+            else:
+                rows = [row for row in rows if codes[row] in matching]
+        return rows if rows is not None else range(self._length)
+    
+    def _take(self, rows):
+        columns = {name: column.take(rows) for name, column in self._columns.items()}
+        return self._from_columns(columns, len(rows))
+    
+    def filter(self, **conditions) -> 'ProductFrame':
+        """
+        Get the rows matching all conditions
+        
+        Each condition is a column name mapped to a value, a set/list/tuple of values,
+        or a callable evaluated once per distinct value, e.g.
+        ``frame.filter(target_market='US', gpc_category={'10000043', '10000044'})``.
+        
+        Args:
+            **conditions: Column conditions
+        
+        Returns:
+            ProductFrame: New frame with the matching rows
+        """
+        return self._take(self._matching_rows(conditions))
+    
+    def count(self, **conditions) -> int:
+        """
+        Count the rows matching all conditions
+        
+        Args:
+            **conditions: Column conditions, as for filter. Without conditions every row is counted.
+        
+        Returns:
+            int: Number of matching rows
+        """
+        if not conditions:
+            return self._length
+        return len(self._matching_rows(conditions))
+    
+    def _group_keys(self, columns):
+        """
+        Get the distinct values of the group-by columns and one code key per row
+        
+        With NumPy the keys are an integer array, the codes of several columns being
+        combined into one number; otherwise they are codes or tuples of codes.
+        """
+        selected = [self._get_column(name) for name in columns]
+        if len(selected) == 1:
+            values = selected[0].values
+            codes = selected[0].codes
+            return (lambda key: values[key]), (_code_array(codes) if np is not None else codes)
+        
+        radices = [len(column.values) or 1 for column in selected]
+        if np is not None and math.prod(radices) < 2 ** 63:
+            keys = np.zeros(self._length, dtype=np.int64)
+            for column, radix in zip(selected, radices):
+                keys = keys * radix + _code_array(column.codes)
+            
+            def decode_number(key):
+                codes = []
+                for radix in reversed(radices):
+                    key, code = divmod(int(key), radix)
+                    codes.append(code)
+                return tuple(column.values[code] for column, code in zip(selected, reversed(codes)))
+            return decode_number, keys
+        
+        def decode(key):
+            return tuple(column.values[code] for column, code in zip(selected, key))
+        return decode, zip(*(column.codes for column in selected))
+    
+    def count_by(self, *columns) -> Dict[Any, int]:
+        """
+        Count rows per distinct value of one or more columns
+        
+        Args:
+            *columns: Column names
+        
+        Returns:
+            dict: Value (or tuple of values for several columns) to row count, largest first
+        """
+        if not columns:
+            raise ValueError("count_by needs at least one column")
+        
+        decode, keys = self._group_keys(columns)
+        if np is not None and isinstance(keys, np.ndarray):
+            if len(columns) == 1:
+                # Codes are numbered in order of first appearance, so they are already dense
+                counts = np.bincount(keys)
+                present = np.flatnonzero(counts)
+                counts = counts[present]
+            else:
+                distinct, first, counts = np.unique(keys, return_index=True, return_counts=True)
+                appearance = np.argsort(first)
+                present, counts = distinct[appearance], counts[appearance]
+            # Largest first, ties in order of first appearance as with Counter
+            return {decode(present[i]): int(counts[i]) for i in np.argsort(-counts, kind='stable')}
+        return {decode(key): count for key, count in Counter(keys).most_common()}
+    
+    def group_by(self, *columns) -> Dict[Any, 'ProductFrame']:
+        """
+        Split the frame by the distinct values of one or more columns
+        
+        Args:
+            *columns: Column names
+        
+        Returns:
+            dict: Value (or tuple of values for several columns) to a frame holding its rows
+        """
+        if not columns:
+            raise ValueError("group_by needs at least one column")
+        
+        decode, keys = self._group_keys(columns)
+        if np is not None and isinstance(keys, np.ndarray):
+            # Rows sorted by group, split into one run per group, in order of first appearance
+            distinct, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+            runs = np.split(np.argsort(inverse, kind='stable'), np.cumsum(np.bincount(inverse))[:-1])
+            return {decode(distinct[group]): self._take(runs[group]) for group in np.argsort(first)}
+        
+        groups = {}
+        for row, key in enumerate(keys):
+            groups.setdefault(key, []).append(row)
+        return {decode(key): self._take(rows) for key, rows in groups.items()}
+    
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """
+        Convert the frame to a dictionary of columns
+        
+        Returns:
+            dict: Column name to list of values
+        """
+        return {name: column.to_list() for name, column in self._columns.items()}
+    
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Convert the columns to NumPy arrays
+        
+        Returns:
+            dict: Column name to NumPy array of values
+        
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if np is None:
+            raise ImportError("numpy is required for ProductFrame.to_numpy(). Install it with: pip install numpy")
+        
+        arrays = {}
+        for name, column in self._columns.items():
+            arrays[name] = np.array(column.values, dtype=object)[_code_array(column.codes)]
+        return arrays
+    
+    def to_arrow(self):
+        """
+        Convert the frame to an Arrow table with dictionary-encoded columns
+        
+        The integer codes become the dictionary indices, so values are not re-encoded.
+        
+        Returns:
+            pyarrow.Table: Table with one dictionary<uint32, value> column per frame column
+        
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if pa is None:
+            raise ImportError("pyarrow is required for ProductFrame.to_arrow(). Install it with: pip install pyarrow")
+        
+        arrays = []
+        for column in self._columns.values():
+            indices = pa.Array.from_buffers(pa.uint32(), len(column.codes), [None, pa.py_buffer(column.codes.tobytes())])
+            arrays.append(pa.DictionaryArray.from_arrays(indices, pa.array(column.values)))
+        return pa.table(arrays, names=list(self._columns))
@@ -0,0 +1,316 @@
+"""
+Local SQLite mirror of 1WorldSync Content1 API products
+
+This module bulk-loads fetched items into a SQLite database so that lookups are served
+locally instead of by an API round trip. Each item is stored as its raw JSON next to
+indexed columns (gtin, information provider GLN, target market, lastModifiedDate, brand
+name and GPC category). Writes are batched into one transaction per batch in WAL mode,
+and each reading thread has its own connection, so readers are never blocked by a load.
+Reads return the usual Content1Product model.
+"""
+
+import sqlite3
+import threading
+from typing import List, Optional
+
+from .codec import resolve_codec
+from .models import Content1Product
+from .sync import ProductStore, parse_modified_date
+
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS products (
+        gtin TEXT NOT NULL,
+        ip_gln TEXT NOT NULL,
+        target_market TEXT NOT NULL,
+        last_modified_date TEXT NOT NULL,
+        brand_name TEXT NOT NULL,
+        gpc_category TEXT NOT NULL,
+        data BLOB NOT NULL,
+        PRIMARY KEY (gtin, ip_gln, target_market)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS products_ip_gln ON products (ip_gln)",
+    "CREATE INDEX IF NOT EXISTS products_target_market ON products (target_market)",
+    "CREATE INDEX IF NOT EXISTS products_last_modified_date ON products (last_modified_date)",
+    "CREATE INDEX IF NOT EXISTS products_brand_name ON products (brand_name)",
+    "CREATE INDEX IF NOT EXISTS products_gpc_category ON products (gpc_category)"
+)
+
+# A stored product is only replaced by a version that is at least as recent
+_UPSERT = """
+    INSERT INTO products (gtin, ip_gln, target_market, last_modified_date, brand_name, gpc_category, data)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (gtin, ip_gln, target_market) DO UPDATE SET
+        last_modified_date = excluded.last_modified_date,
+        brand_name = excluded.brand_name,
+        gpc_category = excluded.gpc_category,
+        data = excluded.data
+    WHERE excluded.last_modified_date >= products.last_modified_date
+"""
+
+# Number of GTINs bound per query, below SQLite's host parameter limit
+_LOOKUP_CHUNK = 500
+
+# Databases that exist only inside their connection and cannot be opened by a reader
+_PRIVATE_PATHS = ('', ':memory:')
+
+
+def _normalized_date(value):
+    """Get a lastModifiedDate in a form that sorts chronologically"""
+    parsed = parse_modified_date(value)
+    return parsed.isoformat() if parsed is not None else (value or '')
+
+
+class ProductMirror(ProductStore):
+    """
+    SQLite database of products keyed by (gtin, information provider GLN, target market)
+    
+    A mirror can be shared by several threads. Writes are serialized on one connection,
+    while every thread reads on a connection of its own, so lookups run concurrently
+    with each other and with a load. An in-memory database has a single connection,
+    which reads share with writes. A mirror is also a ProductStore, so DeltaSync can
+    keep it up to date.
+    """
+    
+    def __init__(self, path, codec=None, batch_size=1000):
+        """
+        Open or create the mirror
+        
+        Args:
+            path (str): Database file, or ':memory:' for a temporary database
+            codec (JSONCodec or str, optional): JSON codec for the stored items. Defaults to the
+                                                fastest installed library.
+            batch_size (int, optional): Number of products written per transaction by load. Defaults to 1000.
+        """
+        self.path = str(path)
+        self.codec = resolve_codec(codec)
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+        
+        # Transactions are managed explicitly, see _write
+        self._connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._connection.execute(statement)
+    
+    def close(self):
+        """Close the write connection and the connection of every reading thread"""
+        with self._readers_lock:
+            for reader in self._readers:
+                reader.close()
+            self._readers = []
+        with self._lock:
+            self._connection.close()
+    
+    def _reader(self):
+        """Get the calling thread's read connection, or None to read on the write connection"""
+        if self.path in _PRIVATE_PATHS:
+            return None
+        reader = getattr(self._local, 'reader', None)
+        if reader is None:
+            # Closed by close() from whichever thread calls it
+            reader = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            reader.execute("PRAGMA query_only=ON")
+            with self._readers_lock:
+                self._readers.append(reader)
+            self._local.reader = reader
+        return reader
+    
+    def _read(self, sql, parameters=()):
+        reader = self._reader()
+        if reader is not None:
+            return reader.execute(sql, parameters).fetchall()
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+    
+    def __enter__(self):
+        """Enter a context that closes the mirror on exit"""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the mirror when leaving the context"""
+        self.close()
+    
+    def _row(self, product):
+        return (
+            product.gtin,
+            product.information_provider_gln,
+            product.target_market,
+            _normalized_date(product.last_modified_date),
+            product.brand_name,
+            product.gpc_category,
+            self.codec.dumps(product.data)
+        )
+    
+    def _write(self, rows):
+        with self._lock:
+            connection = self._connection
+            before = connection.total_changes
+            connection.execute("BEGIN")
+            try:
+                connection.executemany(_UPSERT, rows)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return connection.total_changes - before
+    
+    def upsert(self, products) -> int:
+        """
+        Insert or replace products in a single transaction
+        
+        A stored product is kept if the new version has an older lastModifiedDate.
+        
+        Args:
+            products (list): Content1Product objects
+        
+        Returns:
+            int: Number of products inserted or replaced
+        """
+        return self._write([self._row(product) for product in products])
+    
+    def load(self, products) -> int:
+        """
+        Bulk-load products, e.g. from Content1Client.iter_products, in batched transactions
+        
+        Args:
+            products (iterable): Content1Product objects
+        
+        Returns:
+            int: Number of products inserted or replaced
+        """
+        changed = 0
+        rows = []
+        for product in products:
+            rows.append(self._row(product))
+            if len(rows) >= self.batch_size:
+                changed += self._write(rows)
+                rows = []
+        if rows:
+            changed += self._write(rows)
+        return changed
+    
+    def _query(self, sql, parameters=()):
+        rows = self._read(sql, parameters)
+        loads = self.codec.loads
+        return [Content1Product(loads(data)) for (data,) in rows]
+    
+    def get(self, gtin, information_provider_gln=None, target_market=None) -> Optional[Content1Product]:
+        """
+        Look up one product by GTIN
+        
+        Args:
+            gtin (str): GTIN
+            information_provider_gln (str, optional): Information provider GLN. Defaults to any.
+            target_market (str, optional): Target market. Defaults to any.
+        
+        Returns:
+            Content1Product or None: The most recently modified match, or None if there is none
+        """
+        conditions, parameters = self._conditions(information_provider_gln, target_market)
+        products = self._query(
+            f"SELECT data FROM products WHERE gtin = ?{conditions} ORDER BY last_modified_date DESC LIMIT 1",
+            (gtin,) + parameters
+        )
+        return products[0] if products else None
+    
+    def get_many(self, gtins, information_provider_gln=None, target_market=None) -> List[Content1Product]:
+        """
+        Look up the products of several GTINs
+        
+        Args:
+            gtins (list): GTINs
+            information_provider_gln (str, optional): Information provider GLN. Defaults to any.
+            target_market (str, optional): Target market. Defaults to any.
+        
+        Returns:
+            list: Content1Product objects for the GTINs that are stored
+        """
+        gtins = list(dict.fromkeys(gtins))
+        conditions, parameters = self._conditions(information_provider_gln, target_market)
+        products = []
+        for start in range(0, len(gtins), _LOOKUP_CHUNK):
+            chunk = tuple(gtins[start:start + _LOOKUP_CHUNK])
+            placeholders = ','.join('?' * len(chunk))
+            products.extend(self._query(
+                f"SELECT data FROM products WHERE gtin IN ({placeholders}){conditions}",
+                chunk + parameters
+            ))
+        return products
+    
+    def find(self, information_provider_gln=None, target_market=None, brand_name=None, gpc_category=None,
+             modified_since=None, limit=None) -> List[Content1Product]:
+        """
+        Find products by their indexed columns
+        
+        Args:
+            information_provider_gln (str, optional): Information provider GLN. Defaults to any.
+            target_market (str, optional): Target market. Defaults to any.
+            brand_name (str, optional): Brand name. Defaults to any.
+            gpc_category (str, optional): GPC category code. Defaults to any.
+            modified_since (str, optional): Earliest lastModifiedDate (inclusive). Defaults to any.
+            limit (int, optional): Maximum number of products. Defaults to no limit.
+        
+        Returns:
+            list: Matching Content1Product objects, most recently modified first
+        """
+        conditions, parameters = self._conditions(information_provider_gln, target_market)
+        if brand_name is not None:
+            conditions += " AND brand_name = ?"
+            parameters += (brand_name,)
+        if gpc_category is not None:
+            conditions += " AND gpc_category = ?"
+            parameters += (gpc_category,)
+        if modified_since is not None:
+            conditions += " AND last_modified_date >= ?"
+            parameters += (_normalized_date(modified_since),)
+        sql = f"SELECT data FROM products WHERE 1{conditions} ORDER BY last_modified_date DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters += (limit,)
+        return self._query(sql, parameters)
+    
+    @staticmethod
+    def _conditions(information_provider_gln, target_market):
+        conditions = ''
+        parameters = ()
+        if information_provider_gln is not None:
+            conditions += " AND ip_gln = ?"
+            parameters += (information_provider_gln,)
+        if target_market is not None:
+            conditions += " AND target_market = ?"
+            parameters += (target_market,)
+        return conditions, parameters
+    
+    def delete(self, gtin, information_provider_gln, target_market) -> bool:
+        """
+        Remove a product
+        
+        Args:
+            gtin (str): GTIN
+            information_provider_gln (str): Information provider GLN
+            target_market (str): Target market
+        
+        Returns:
+            bool: True if the product was stored
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM products WHERE gtin = ? AND ip_gln = ? AND target_market = ?",
+                (gtin, information_provider_gln, target_market)
+            )
+            return cursor.rowcount > 0
+    
+    def __len__(self):
+        """Get the number of stored products"""
+        return self._read("SELECT COUNT(*) FROM products")[0][0]
+    
+    def __contains__(self, gtin):
+        """Check whether a GTIN is stored"""
+        return bool(self._read("SELECT 1 FROM products WHERE gtin = ? LIMIT 1", (gtin,)))
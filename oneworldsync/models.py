@@ -6,6 +6,7 @@ This module defines data models for the 1WorldSync Content1 API responses.
 
 from typing import Dict, List, Any, Optional, Union
 from .utils import extract_product_data, get_primary_image, format_dimensions
+from .codec import resolve_codec
 
 
 class Content1Product:
@@ -13,6 +14,9 @@ class Content1Product:
     Model representing a product from the 1WorldSync Content1 API
     """
     
+    # Slots instead of a per-instance __dict__ keep large exports and mirrors compact
+    __slots__ = ('data', 'item', 'gtin', '_extracted_data')
+    
     def __init__(self, data):
         """
         Initialize a product from API data
@@ -24,8 +28,35 @@ class Content1Product:
         self.item = data.get('item', {})
         self.gtin = self.item.get('gtin', data.get('gtin', ''))
         
-        # Extract structured data for easier access
-        self._extracted_data = extract_product_data(data)
+        # Structured data is extracted on first access, see extracted_data
+        self._extracted_data = None
+    
+    @property
+    def extracted_data(self) -> Dict[str, Any]:
+        """
+        Get the structured product data from utils.extract_product_data
+        
+        The data is extracted the first time this property is read and cached afterwards,
+        so products that are only passed through (e.g. in exports) never pay for it.
+        
+        Returns:
+            dict: Extracted product data
+        """
+        if self._extracted_data is None:
+            self._extracted_data = extract_product_data(self.data)
+        return self._extracted_data
+    
+    def extract(self, schema) -> Dict[str, Any]:
+        """
+        Extract fields from the product item with a declarative schema
+        
+        Args:
+            schema (Schema): Compiled extraction schema, e.g. schema.PRODUCT_SCHEMA.select('gtin', 'brand_name')
+            
+        Returns:
+            dict: Extracted fields
+        """
+        return schema.extract(self.item)
     
     @property
     def information_provider_gln(self) -> str:
@@ -132,6 +163,19 @@ class Content1Product:
             'allergen_statement': self.allergen_statement
         }
     
+    def to_json(self, indent=False, codec=None) -> bytes:
+        """
+        Encode the product dictionary from to_dict as JSON
+        
+        Args:
+            indent (bool, optional): Indent nested values by two spaces. Defaults to False.
+            codec (JSONCodec or str, optional): JSON codec. Defaults to the fastest installed library.
+            
+        Returns:
+            bytes: UTF-8 encoded JSON
+        """
+        return resolve_codec(codec).dumps(self.to_dict(), indent)
+    
     def __str__(self):
         """String representation of the product"""
         return f"{self.brand_name} - {self.gtin} ({self.target_market})"
@@ -142,6 +186,8 @@ class Content1ProductResults:
     Model representing product results from the 1WorldSync Content1 API
     """
     
+    __slots__ = ('data', 'search_after', 'products')
+    
     def __init__(self, data):
         """
         Initialize product results from API data
@@ -169,6 +215,19 @@ class Content1ProductResults:
         """Get a product by index"""
         return self.products[index]
     
+    def to_frame(self, columns=None):
+        """
+        Convert the product results to a columnar ProductFrame
+        
+        Args:
+            columns (tuple, optional): Content1Product property names to store. Defaults to frame.DEFAULT_COLUMNS.
+            
+        Returns:
+            ProductFrame: Frame with one row per product
+        """
+        from .frame import ProductFrame, DEFAULT_COLUMNS
+        return ProductFrame(self.products, columns=columns or DEFAULT_COLUMNS)
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the product results to a dictionary
@@ -183,12 +242,27 @@ class Content1ProductResults:
             'products': [product.to_dict() for product in self.products]
         }
 
+    def to_json(self, indent=False, codec=None) -> bytes:
+        """
+        Encode the product results dictionary from to_dict as JSON
+        
+        Args:
+            indent (bool, optional): Indent nested values by two spaces. Defaults to False.
+            codec (JSONCodec or str, optional): JSON codec. Defaults to the fastest installed library.
+            
+        Returns:
+            bytes: UTF-8 encoded JSON
+        """
+        return resolve_codec(codec).dumps(self.to_dict(), indent)
+
 
 class Content1Hierarchy:
     """
     Model representing a product hierarchy from the 1WorldSync Content1 API
     """
     
+    __slots__ = ('data', 'gtin', 'information_provider_gln', 'target_market', 'hierarchy')
+    
     def __init__(self, data):
         """
         Initialize a hierarchy from API data
@@ -216,6 +290,19 @@ class Content1Hierarchy:
             'hierarchy': self.hierarchy
         }
     
+    def to_json(self, indent=False, codec=None) -> bytes:
+        """
+        Encode the hierarchy dictionary from to_dict as JSON
+        
+        Args:
+            indent (bool, optional): Indent nested values by two spaces. Defaults to False.
+            codec (JSONCodec or str, optional): JSON codec. Defaults to the fastest installed library.
+            
+        Returns:
+            bytes: UTF-8 encoded JSON
+        """
+        return resolve_codec(codec).dumps(self.to_dict(), indent)
+    
     def __str__(self):
         """String representation of the hierarchy"""
         return f"Hierarchy for GTIN {self.gtin} in {self.target_market}"
@@ -226,6 +313,8 @@ class Content1HierarchyResults:
     Model representing hierarchy results from the 1WorldSync Content1 API
     """
     
+    __slots__ = ('data', 'search_after', 'hierarchies')
+    
     def __init__(self, data):
         """
         Initialize hierarchy results from API data
@@ -265,4 +354,17 @@ class Content1HierarchyResults:
                 'search_after': self.search_after
             },
             'hierarchies': [hierarchy.to_dict() for hierarchy in self.hierarchies]
-        }
\ No newline at end of file
+        }
+    
+    def to_json(self, indent=False, codec=None) -> bytes:
+        """
+        Encode the hierarchy results dictionary from to_dict as JSON
+        
+        Args:
+            indent (bool, optional): Indent nested values by two spaces. Defaults to False.
+            codec (JSONCodec or str, optional): JSON codec. Defaults to the fastest installed library.
+            
+        Returns:
+            bytes: UTF-8 encoded JSON
+        """
+        return resolve_codec(codec).dumps(self.to_dict(), indent)
@@ -0,0 +1,190 @@
+"""
+Client-side rate limiting for the 1WorldSync Content1 API
+
+This module provides token bucket rate limiters that the clients consult before
+every request. TokenBucketRateLimiter is shared between threads of one process;
+FileTokenBucketRateLimiter keeps the bucket in a locked local file so several
+processes using the same appId share one budget.
+"""
+
+import os
+import json
+import time
+import threading
+from abc import ABC, abstractmethod
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+def _take(tokens, updated, now, rate, burst, count):
+    """
+    Refill a token bucket and take tokens from it
+    
+    The bucket may go into debt: the caller then waits until the debt is repaid,
+    which reserves its slot so concurrent callers queue up fairly.
+    
+    Args:
+        tokens (float): Tokens in the bucket at ``updated``
+        updated (float): Time of the last update
+        now (float): Current time
+        rate (float): Tokens added per second
+        burst (float): Bucket capacity
+        count (float): Tokens to take
+    
+    Returns:
+        tuple: (tokens left, seconds to wait before proceeding)
+    """
+    tokens = min(burst, tokens + max(0.0, now - updated) * rate)
+    tokens -= count
+    wait = -tokens / rate if tokens < 0 else 0.0
+    return tokens, wait
+
+
+class RateLimiter(ABC):
+    """Base class for rate limiters used by the clients"""
+    
+    @abstractmethod
+    def reserve(self, tokens=1):
+        """
+        Reserve tokens and get the time to wait before using them
+        
+        Args:
+            tokens (int, optional): Number of tokens to reserve. Defaults to 1.
+        
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+    
+    def acquire(self, tokens=1):
+        """
+        Block until tokens are available
+        
+        Args:
+            tokens (int, optional): Number of tokens to acquire. Defaults to 1.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """
+    Thread-safe token bucket rate limiter for a single process
+    """
+    
+    def __init__(self, rate, burst=None):
+        """
+        Initialize the rate limiter
+        
+        Args:
+            rate (float): Sustained requests per second
+            burst (float, optional): Maximum number of requests sent back to back. Defaults to max(1, rate).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(1.0, self.rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, tokens=1):
+        """
+        Reserve tokens and get the time to wait before using them
+        
+        Args:
+            tokens (int, optional): Number of tokens to reserve. Defaults to 1.
+        
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = _take(self._tokens, self._updated, now, self.rate, self.burst, tokens)
+            self._updated = now
+            return wait
+
+
+class FileTokenBucketRateLimiter(RateLimiter):
+    """
+    Token bucket rate limiter shared between processes through a locked local file
+    
+    Every process that creates a limiter with the same ``path`` draws from the same
+    bucket. The file holds the token count and the wall-clock time it was updated,
+    and is protected by an exclusive ``flock`` while it is read and rewritten.
+    """
+    
+    def __init__(self, path, rate, burst=None):
+        """
+        Initialize the rate limiter
+        
+        Args:
+            path (str): Path of the shared state file, created if missing
+            rate (float): Sustained requests per second across all processes
+            burst (float, optional): Maximum number of requests sent back to back. Defaults to max(1, rate).
+        
+        Raises:
+            RuntimeError: If file locking is not available on this platform
+        """
+        if fcntl is None:
+            raise RuntimeError("FileTokenBucketRateLimiter requires POSIX file locking (fcntl)")
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        
+        self.path = str(path)
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(1.0, self.rate)
+        self._lock = threading.Lock()
+    
+    def reserve(self, tokens=1):
+        """
+        Reserve tokens from the shared bucket and get the time to wait before using them
+        
+        Args:
+            tokens (int, optional): Number of tokens to reserve. Defaults to 1.
+        
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                try:
+                    now = time.time()
+                    state = self._read_state(fd)
+                    if state is None:
+                        state = {'tokens': self.burst, 'updated': now}
+                    
+                    remaining, wait = _take(state['tokens'], state['updated'], now, self.rate, self.burst, tokens)
+                    
+                    payload = json.dumps({'tokens': remaining, 'updated': now}).encode('utf-8')
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    os.ftruncate(fd, 0)
+                    os.write(fd, payload)
+                    return wait
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+    
+    @staticmethod
+    def _read_state(fd):
+        """Read the bucket state from the locked file, or None if it is empty or invalid"""
+        os.lseek(fd, 0, os.SEEK_SET)
+        raw = b''
+        while True:
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break
+            raw += chunk
+        
+        try:
+            state = json.loads(raw.decode('utf-8'))
+            return {'tokens': float(state['tokens']), 'updated': float(state['updated'])}
+        except (ValueError, KeyError, TypeError):
+            return None
@@ -0,0 +1,153 @@
+"""
+Retry policy for the 1WorldSync Content1 API client
+
+This module defines when and how long the clients wait before retrying a request
+that was throttled (429), failed with a transient server error, or could not connect.
+"""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy:
+    """
+    Exponential backoff retry policy with jitter, a per-call deadline and Retry-After support
+
+    The Content1 search endpoints are read-only, so POST is treated as idempotent by default.
+    """
+
+    DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    DEFAULT_RETRY_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'POST'})
+
+    def __init__(self, max_retries=5, backoff_factor=0.5, max_backoff=60.0, jitter=True,
+                 deadline=300.0, retry_statuses=None, retry_methods=None, respect_retry_after=True):
+        """
+        Initialize the retry policy
+
+        Args:
+            max_retries (int, optional): Maximum number of retries after the first attempt. Defaults to 5.
+            backoff_factor (float, optional): Base delay in seconds, doubled on every retry. Defaults to 0.5.
+            max_backoff (float, optional): Upper bound for a single delay in seconds. Defaults to 60.
+            jitter (bool, optional): Randomize delays ("full jitter") so clients do not retry in lockstep.
+                                     Defaults to True.
+            deadline (float, optional): Total seconds a call may spend including retries. None for no limit.
+                                        Defaults to 300.
+            retry_statuses (set, optional): HTTP status codes to retry. Defaults to 429, 500, 502, 503 and 504.
+            retry_methods (set, optional): HTTP methods that are safe to retry. Defaults to GET, HEAD, OPTIONS and POST.
+            respect_retry_after (bool, optional): Honour the Retry-After response header. Defaults to True.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses) if retry_statuses is not None else self.DEFAULT_RETRY_STATUSES
+        self.retry_methods = frozenset(
+            method.upper() for method in (retry_methods if retry_methods is not None else self.DEFAULT_RETRY_METHODS)
+        )
+        self.respect_retry_after = respect_retry_after
+
+    @classmethod
+    def disabled(cls):
+        """
+        Create a policy that never retries
+
+        Returns:
+            RetryPolicy: Policy with no retries
+        """
+        return cls(max_retries=0)
+
+    def is_retryable_status(self, status_code):
+        """
+        Check whether a response status should be retried
+
+        Args:
+            status_code (int): HTTP status code
+
+        Returns:
+            bool: True if the status is retryable
+        """
+        return status_code in self.retry_statuses
+
+    def backoff(self, attempt):
+        """
+        Get the backoff delay before the given retry
+
+        Args:
+            attempt (int): Number of attempts already made (1 for the first retry)
+
+        Returns:
+            float: Delay in seconds
+        """
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value):
+        """
+        Parse a Retry-After header value
+
+        Args:
+            value (str): Header value, either delay seconds or an HTTP date
+
+        Returns:
+            float or None: Delay in seconds, or None if the value cannot be parsed
+        """
+        if not isinstance(value, str) or not value.strip():
+            return None
+
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def get_delay(self, method, attempt, elapsed, headers=None):
+        """
+        Decide whether to retry and how long to wait first
+
+        Args:
+            method (str): HTTP method of the request
+            attempt (int): Number of attempts already made
+            elapsed (float): Seconds spent on the call so far
+            headers (Mapping, optional): Response headers, used for Retry-After. Defaults to None.
+
+        Returns:
+            float or None: Delay in seconds before the next attempt, or None to stop retrying
+        """
+        if method.upper() not in self.retry_methods or attempt > self.max_retries:
+            return None
+
+        delay = self.backoff(attempt)
+        if self.respect_retry_after and headers is not None:
+            retry_after = self.parse_retry_after(headers.get('Retry-After'))
+            if retry_after is not None:
+                delay = retry_after
+
+        if self.deadline is not None and elapsed + delay >= self.deadline:
+            return None
+
+        return delay
+
+    def remaining(self, elapsed):
+        """
+        Get the time left before the deadline
+
+        Args:
+            elapsed (float): Seconds spent on the call so far
+
+        Returns:
+            float or None: Seconds left, or None if there is no deadline
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - elapsed)
@@ -0,0 +1,580 @@
+"""
+Declarative extraction schemas for 1WorldSync Content1 product data
+
+This module lets you describe the fields you want from a product item instead of
+walking the nested item structure by hand. A Schema maps output names to Field
+definitions. Each field has a path into the item, with list wildcards and filters,
+and a rule saying how matches are combined. All paths of a schema are compiled
+once into a shared tree and extracted in a single pass over the item, so a schema
+only pays for the fields it declares.
+
+Path syntax:
+
+* ``a.b.c`` looks up nested dictionary keys.
+* ``a.0.b`` indexes into a list (as in ``utils.get_nested_dict_value``).
+* ``a[]`` iterates over every element of the list at ``a``.
+* ``a[first]`` iterates over the list but stops at the first element under which
+  a value matched.
+* ``a[x.y=VALUE]`` iterates over the elements whose ``x.y`` equals ``VALUE``;
+  several conditions are separated by commas (``a[first,x=1,y=2]``).
+
+Rules:
+
+* ``first``: the first matching value.
+* ``last``: the last matching value.
+* ``collect``: a list of all matching values.
+* ``map``: a dict built from every matching node, with ``key`` and ``value``
+  taken from the node by a path or a callable.
+
+None, empty strings and empty lists or dicts never count as matches.
+"""
+
+from .utils import compile_path
+
+
+FIRST = 'first'
+LAST = 'last'
+COLLECT = 'collect'
+MAP = 'map'
+
+RULES = (FIRST, LAST, COLLECT, MAP)
+
+
+class _Omit:
+    """Marker for fields left out of the output when nothing matched"""
+    
+    def __repr__(self):
+        return 'OMIT'
+
+
+OMIT = _Omit()
+
+_NOT_SET = object()
+
+# Step kinds of a compiled path
+_KEY = 'key'
+_INDEX = 'index'
+_EACH = 'each'
+
+
+def _is_empty(value):
+    """Check whether a value does not count as a match (None, '', [] or {}; 0 and False do count)"""
+    return not value and not value == 0
+
+
+def _copier(default):
+    """Get the function copying a mutable default, or None for immutable ones"""
+    if isinstance(default, list):
+        return list
+    if isinstance(default, dict):
+        return dict
+    if isinstance(default, set):
+        return set
+    return None
+
+
+def _accessor(spec):
+    """Turn a path string or callable into a function of a node"""
+    if spec is None or callable(spec):
+        return spec
+    return compile_path(spec)
+
+
+def _split_path(path):
+    """
+    Split a schema path on dots that are not inside brackets
+    
+    Args:
+        path (str): Schema path
+    
+    Returns:
+        list: Path segments
+    """
+    segments = []
+    current = []
+    depth = 0
+    for char in path:
+        if char == '[':
+            depth += 1
+        elif char == ']':
+            depth -= 1
+            if depth < 0:
+                raise ValueError(f"Unbalanced ']' in path: {path}")
+        elif char == '.' and depth == 0:
+            segments.append(''.join(current))
+            current = []
+            continue
+        current.append(char)
+    
+    if depth:
+        raise ValueError(f"Unbalanced '[' in path: {path}")
+    segments.append(''.join(current))
+    return segments
+
+
+def compile_steps(path):
+    """
+    Compile a schema path into steps
+    
+    Args:
+        path (str): Schema path, e.g. ``"itemIdentifier[itemIdType.value=GTIN].itemId"``
+    
+    Returns:
+        tuple: Steps; each step is hashable so equal steps of different fields can be shared
+    
+    Raises:
+        ValueError: If the path is malformed
+    """
+    steps = []
+    for segment in _split_path(path):
+        name, bracket, rest = segment.partition('[')
+        if not name and not bracket:
+            raise ValueError(f"Empty segment in path: {path}")
+        
+        if name:
+            if name.isdigit():
+                steps.append((_INDEX, int(name), name))
+            else:
+                steps.append((_KEY, name))
+        
+        if bracket:
+            if not rest.endswith(']') or '[' in rest:
+                raise ValueError(f"Malformed wildcard in path segment: {segment}")
+            
+            first = False
+            conditions = []
+            for part in rest[:-1].split(','):
+                part = part.strip()
+                if not part:
+                    continue
+                if part == 'first':
+                    first = True
+                    continue
+                key, equals, expected = part.partition('=')
+                if not equals or not key:
+                    raise ValueError(f"Malformed condition '{part}' in path: {path}")
+                conditions.append((key.strip(), expected.strip()))
+            
+            steps.append((_EACH, first, tuple(conditions)))
+    
+    return tuple(steps)
+
+
+class Field:
+    """
+    Definition of one output field of a Schema
+    """
+    
+    __slots__ = ('path', 'rule', 'default', 'where', 'convert', 'key', 'value', 'steps')
+    
+    def __init__(self, path=None, rule=FIRST, default=_NOT_SET, where=None, convert=None, key=None, value=None):
+        """
+        Initialize the field
+        
+        Args:
+            path (str, optional): Schema path of the values. A field without a path always
+                                  has its default value. Defaults to None.
+            rule (str, optional): 'first', 'last', 'collect' or 'map'. Defaults to 'first'.
+            default (optional): Value when nothing matched, or OMIT to leave the field out.
+                                Defaults to None, [] for 'collect' and {} for 'map'.
+            where (callable, optional): Predicate a matching node must satisfy. Defaults to None.
+            convert (callable, optional): Function applied to each matching node (to each value
+                                          for 'map'). Defaults to None.
+            key (str or callable, optional): For 'map', path or function giving the key of a node.
+            value (str or callable, optional): For 'map', path or function giving the value of a node.
+        
+        Raises:
+            ValueError: If the rule is unknown or a 'map' field has no key
+        """
+        if rule not in RULES:
+            raise ValueError(f"Unknown rule '{rule}', expected one of {', '.join(RULES)}")
+        if rule == MAP and key is None:
+            raise ValueError("A 'map' field needs a key")
+        
+        if default is _NOT_SET:
+            default = [] if rule == COLLECT else {} if rule == MAP else None
+        
+        self.path = path
+        self.rule = rule
+        self.default = default
+        self.where = where
+        self.convert = convert
+        self.key = _accessor(key)
+        self.value = _accessor(value)
+        self.steps = compile_steps(path) if path else None
+    
+    def __repr__(self):
+        return f"Field({self.path!r}, rule={self.rule!r})"
+
+
+class _Node:
+    """Node of the compiled path tree shared by the fields of a schema"""
+    
+    __slots__ = ('fields', 'children', 'below', 'first_only')
+    
+    def __init__(self):
+        self.fields = []
+        self.children = {}
+        self.below = ()
+        self.first_only = False
+    
+    def finalize(self, rules):
+        """Record the fields under this node, for pruning finished 'first' fields"""
+        below = set(self.fields)
+        for child in self.children.values():
+            below |= child.finalize(rules)
+        self.below = tuple(sorted(below))
+        self.first_only = all(rules[index] == FIRST for index in below)
+        return below
+
+
+def _visitor(node, recorders, guard=None):
+    """
+    Build the function visiting a node of a compiled path tree
+    
+    Args:
+        node (_Node): Node to visit
+        recorders (list): Function record(node, state) of each field, by field index
+        guard (tuple, optional): Fields whose pending check already covers this node. Defaults to None.
+    
+    Returns:
+        callable: Function visit(value, state) returning whether any field below the node matched
+    """
+    records = tuple(recorders[index] for index in node.fields)
+    edges = tuple(_edge(step, child, recorders, guard) for step, child in node.children.items())
+    visitors = records + edges
+    if len(visitors) == 1:
+        # Most nodes record one field or follow one step, which needs no wrapper
+        return visitors[0]
+    
+    def visit(value, state):
+        matched = False
+        for visitor in visitors:
+            if visitor(value, state):
+                matched = True
+        return matched
+    return visit
+
+
+def _edge(step, child, recorders, guard):
+    """Build the function following one step of a compiled path tree from a value"""
+    pending = None
+    if child.first_only and child.below != guard:
+        # Skip subtrees whose fields all take the first match and already have it
+        pending = guard = child.below
+    kind = step[0]
+    
+    if kind == _KEY:
+        # Follow chains of plain keys and indices with a single compiled path
+        parts = [step[1]]
+        while not child.fields and len(child.children) == 1 and not child.first_only:
+            (next_step, next_child), = child.children.items()
+            if next_step[0] == _EACH:
+                break
+            parts.append(next_step[1] if next_step[0] == _KEY else next_step[2])
+            child = next_child
+        visit = _visitor(child, recorders, guard)
+        
+        if len(parts) == 1:
+            key = parts[0]
+            
+            def follow(value, state):
+                target = value.get(key) if isinstance(value, dict) else None
+                return target is not None and visit(target, state)
+        else:
+            lookup = compile_path('.'.join(parts))
+            
+            def follow(value, state):
+                target = lookup(value)
+                return target is not None and visit(target, state)
+    
+    elif kind == _INDEX:
+        position, key = step[1], step[2]
+        visit = _visitor(child, recorders, guard)
+        
+        def follow(value, state):
+            if isinstance(value, list):
+                target = value[position] if position < len(value) else None
+            elif isinstance(value, dict):
+                target = value.get(key)
+            else:
+                return False
+            return target is not None and visit(target, state)
+    
+    else:
+        first = step[1]
+        conditions = tuple((compile_path(key), expected) for key, expected in step[2])
+        visit = _visitor(child, recorders, guard)
+        
+        def follow(value, state):
+            # A single object where a list is expected is treated as a list of one
+            if isinstance(value, dict):
+                elements = (value,)
+            elif isinstance(value, list):
+                elements = value
+            else:
+                return False
+            
+            matched = False
+            for element in elements:
+                if element is None:
+                    continue
+                for accessor, expected in conditions:
+                    if accessor(element) != expected:
+                        break
+                else:
+                    if visit(element, state):
+                        matched = True
+                        if first:
+                            break
+            return matched
+    
+    if pending is None:
+        return follow
+    
+    def follow_pending(value, state):
+        for index in pending:
+            if state[index] is _NOT_SET:
+                return follow(value, state)
+        return False
+    return follow_pending
+
+
+class Schema:
+    """
+    Compiled set of fields extracted together in a single pass
+    
+    Example:
+        >>> schema = Schema({
+        ...     'gtin': Field('itemIdentificationInformation.itemIdentifier[itemIdType.value=GTIN].itemId'),
+        ...     'image_urls': Field('tradeItemInformation[].referencedFileDetailInformationModule'
+        ...                         '.referencedFileHeader[].uniformResourceIdentifier', rule=COLLECT),
+        ... })
+        >>> schema.extract(product.item)
+    
+    Output names containing dots produce nested dictionaries (``'dimensions.height'``).
+    """
+    
+    def __init__(self, fields):
+        """
+        Initialize and compile the schema
+        
+        Args:
+            fields (dict): Output name to Field, in output order
+        """
+        self.fields = dict(fields)
+        self._names = list(self.fields)
+        self._field_list = [self.fields[name] for name in self._names]
+        
+        # Output plan: leaf name, parent dict names for dotted names, default and how to copy it
+        outputs = [name.split('.') for name in self._names]
+        self._leaves = [parts[-1] for parts in outputs]
+        self._parents = [tuple(parts[:-1]) for parts in outputs]
+        self._defaults = [field.default for field in self._field_list]
+        self._copiers = [_copier(default) for default in self._defaults]
+        self._walk = self._compile()
+    
+    def _compile(self):
+        """Merge the field paths into one tree and build the function walking it"""
+        root = _Node()
+        for index, field in enumerate(self._field_list):
+            if field.steps is None:
+                continue
+            node = root
+            for step in field.steps:
+                child = node.children.get(step)
+                if child is None:
+                    child = node.children[step] = _Node()
+                node = child
+            node.fields.append(index)
+        
+        root.finalize([field.rule for field in self._field_list])
+        return _visitor(root, [self._recorder(index) for index in range(len(self._field_list))])
+    
+    def select(self, *names):
+        """
+        Get a schema with only some of the fields
+        
+        Args:
+            *names: Output names to keep
+        
+        Returns:
+            Schema: New compiled schema
+        
+        Raises:
+            KeyError: If a name is not part of the schema
+        """
+        return Schema({name: self.fields[name] for name in names})
+    
+    def _recorder(self, index):
+        """Compile a field into a function record(node, state) that returns True on a match"""
+        field = self._field_list[index]
+        rule, where, convert = field.rule, field.where, field.convert
+        key_of, value_of = field.key, field.value
+        
+        if rule == MAP:
+            def record(node, state):
+                if (not node and not node == 0) or (where is not None and not where(node)):
+                    return False
+                key = key_of(node)
+                value = value_of(node) if value_of is not None else node
+                if convert is not None:
+                    value = convert(value)
+                if key is None or _is_empty(value):
+                    return False
+                if state[index] is _NOT_SET:
+                    state[index] = {}
+                state[index][key] = value
+                return True
+            return record
+        
+        if where is None and convert is None:
+            # Plain values: the common case, kept as short as possible
+            if rule == FIRST:
+                def record(node, state):
+                    if not node and not node == 0:
+                        return False
+                    if state[index] is _NOT_SET:
+                        state[index] = node
+                    return True
+            elif rule == LAST:
+                def record(node, state):
+                    if not node and not node == 0:
+                        return False
+                    state[index] = node
+                    return True
+            else:
+                def record(node, state):
+                    if not node and not node == 0:
+                        return False
+                    if state[index] is _NOT_SET:
+                        state[index] = [node]
+                    else:
+                        state[index].append(node)
+                    return True
+            return record
+        
+        def record(node, state):
+            if (not node and not node == 0) or (where is not None and not where(node)):
+                return False
+            
+            value = convert(node) if convert is not None else node
+            if _is_empty(value):
+                return False
+            
+            if rule == FIRST:
+                if state[index] is _NOT_SET:
+                    state[index] = value
+            elif rule == LAST:
+                state[index] = value
+            elif state[index] is _NOT_SET:
+                state[index] = [value]
+            else:
+                state[index].append(value)
+            return True
+        return record
+    
+    def extract(self, data):
+        """
+        Extract the schema's fields from a dictionary (usually a product item)
+        
+        Args:
+            data (dict): Data to extract from
+        
+        Returns:
+            dict: Output name to extracted value
+        """
+        state = [_NOT_SET] * len(self._field_list)
+        if isinstance(data, dict):
+            self._walk(data, state)
+        
+        result = {}
+        for name, parents, value, default, copier in zip(self._leaves, self._parents, state, self._defaults, self._copiers):
+            if value is _NOT_SET:
+                if default is OMIT:
+                    if parents:
+                        self._container(result, parents)
+                    continue
+                # Mutable defaults are copied so results never share them
+                value = copier(default) if copier is not None else default
+            
+            if parents:
+                self._container(result, parents)[name] = value
+            else:
+                result[name] = value
+        
+        return result
+    
+    @staticmethod
+    def _container(result, parents):
+        """Get (creating if needed) the nested dict for a dotted output name"""
+        target = result
+        for part in parents:
+            target = target.setdefault(part, {})
+        return target
+    
+    def extract_many(self, items):
+        """
+        Extract the schema's fields from many dictionaries
+        
+        Args:
+            items (iterable): Data to extract from
+        
+        Returns:
+            list: One result dict per item
+        """
+        return [self.extract(item) for item in items]
+
+
+def _image(file_header):
+    """Convert a referenced file header to an image entry"""
+    return {
+        'url': file_header.get('uniformResourceIdentifier', ''),
+        'is_primary': _is_primary_file(file_header, '') == 'true'
+    }
+
+
+def _dimension(measurement):
+    """Convert a measurement to a value/unit pair"""
+    return {
+        'value': measurement.get('value', ''),
+        'unit': measurement.get('qual', '')
+    }
+
+
+_is_primary_file = compile_path('isPrimaryFile.value')
+
+_TRADE_ITEM = 'tradeItemInformation[]'
+_DESCRIPTION = _TRADE_ITEM + '.tradeItemDescriptionModule.tradeItemDescriptionInformation[]'
+_FILE_HEADERS = _TRADE_ITEM + '.referencedFileDetailInformationModule.referencedFileHeader'
+_MEASUREMENTS = (_TRADE_ITEM + '.tradeItemMeasurementsModuleGroup[]'
+                 '.tradeItemMeasurementsModule.tradeItemMeasurements')
+_GPC_CODES = 'productCategory[productCategoryScheme.value=GPC].productCategoryCodes'
+
+# Fields of utils.extract_product_data, applied to a product's item
+PRODUCT_SCHEMA = Schema({
+    'gtin': Field('itemIdentificationInformation.itemIdentifier[itemIdType.value=GTIN].itemId', default=''),
+    'brand_name': Field(_DESCRIPTION + '.brandNameInformation.brandName', rule=LAST, default=''),
+    'product_name': Field(_DESCRIPTION + '.regulatedProductName[].statement.values[first].value',
+                          rule=LAST, default=''),
+    'description': Field(_DESCRIPTION + '.additionalTradeItemDescription.values[first].value',
+                         rule=LAST, default=''),
+    'manufacturer': Field(default=''),
+    'image_url': Field(_FILE_HEADERS + '[referencedFileTypeCode.value=PRODUCT_IMAGE,isPrimaryFile.value=true]'
+                       '.uniformResourceIdentifier', rule=LAST, default=''),
+    'category': Field(_GPC_CODES + '[productCategoryComponent.value=BRICK].productCategoryCode.value',
+                      rule=LAST, default=''),
+    'subcategory': Field(_GPC_CODES + '[productCategoryComponent.value=SEGMENT].productCategoryCode.value',
+                         rule=LAST, default=''),
+    'gpc_code': Field(_GPC_CODES + '[].productCategoryCode.value', rule=LAST, default=''),
+    'ingredients': Field(_TRADE_ITEM + '.foodAndBeverageIngredientModule[].ingredientStatement[]'
+                         '.statement.values[first].value', rule=LAST, default=''),
+    'dimensions.height': Field(_MEASUREMENTS + '.height', rule=LAST, convert=_dimension, default=OMIT),
+    'dimensions.width': Field(_MEASUREMENTS + '.width', rule=LAST, convert=_dimension, default=OMIT),
+    'dimensions.depth': Field(_MEASUREMENTS + '.depth', rule=LAST, convert=_dimension, default=OMIT),
+    'country_of_origin': Field(_TRADE_ITEM + '.placeOfItemActivityModule.placeOfProductActivity'
+                               '.countryOfOrigin[first].countryCode.value', rule=LAST, default=''),
+    'allergen_info': Field(default=[]),
+    'item_id': Field('itemIdentificationInformation.itemReferenceIdInformation.itemReferenceId', default=''),
+    'images': Field(_FILE_HEADERS + '[referencedFileTypeCode.value=PRODUCT_IMAGE]', rule=COLLECT, convert=_image)
+})
@@ -0,0 +1,318 @@
+"""
+Incremental parsing of 1WorldSync Content1 API responses
+
+This module parses a fetch response body chunk by chunk and yields each element of its
+``items`` (or ``hierarchies``) array as soon as the element is complete. Only the
+element being read is held as text, and each parsed element can be released by the
+consumer before the next one arrives, so peak memory follows the size of one item
+rather than one page. Other top-level values such as ``searchAfter`` and ``totalCount``
+are parsed whole and kept in ``metadata``.
+"""
+
+import re
+import json
+import codecs
+from typing import Dict, Any
+
+from .models import Content1Product
+from .compression import wire_bytes
+
+
+DEFAULT_ARRAY_KEYS = ('items', 'hierarchies')
+
+_NON_WHITESPACE = re.compile(r'[^ \t\n\r]')
+
+# An incomplete value fails to decode within a few characters of the end of the buffer
+# (a cut \uXXXX escape, literal or number), or at the start of an unterminated string
+_INCOMPLETE_MARGIN = 16
+
+# Characters that continue a number which decoded completely up to them
+_NUMBER_CONTINUATION = frozenset('.eE+-')
+
+# Parser states for the top-level object
+_START = 'start'
+_KEY_OR_END = 'key_or_end'
+_COLON = 'colon'
+_VALUE = 'value'
+_AFTER_VALUE = 'after_value'
+_KEY = 'key'
+_ELEMENT_OR_END = 'element_or_end'
+_ELEMENT = 'element'
+_AFTER_ELEMENT = 'after_element'
+_DONE = 'done'
+
+# Single characters accepted in each state and the state they lead to
+_TRANSITIONS = {
+    (_START, '{'): _KEY_OR_END,
+    (_KEY_OR_END, '}'): _DONE,
+    (_COLON, ':'): _VALUE,
+    (_AFTER_VALUE, ','): _KEY,
+    (_AFTER_VALUE, '}'): _DONE,
+    (_ELEMENT_OR_END, ']'): _AFTER_VALUE,
+    (_AFTER_ELEMENT, ','): _ELEMENT,
+    (_AFTER_ELEMENT, ']'): _AFTER_VALUE
+}
+
+
+class JSONStreamParser:
+    """
+    Push parser for a JSON object whose large arrays are read one element at a time
+    
+    Feed the response body in chunks of any size; ``feed`` returns the array elements
+    completed by each chunk as ``(key, element)`` pairs. Values of other top-level keys
+    are collected in ``metadata``.
+    
+    Each value is decoded by the C accelerated ``json`` decoder as soon as it is complete.
+    A value that is still incomplete is retried once the buffer has doubled, so an
+    element spread over many chunks is decoded a bounded number of times.
+    """
+    
+    def __init__(self, array_keys=DEFAULT_ARRAY_KEYS):
+        """
+        Initialize the parser
+        
+        Args:
+            array_keys (tuple, optional): Top-level keys whose arrays are streamed element by element.
+                                          Defaults to ('items', 'hierarchies').
+        """
+        self.array_keys = frozenset(array_keys)
+        self.metadata = {}
+        self.bytes_read = 0
+        
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._scan = json.JSONDecoder().raw_decode
+        self._buffer = ''
+        self._state = _START
+        self._key = None
+        self._retry_length = 0
+    
+    @property
+    def done(self) -> bool:
+        """Check whether the whole document has been parsed"""
+        return self._state == _DONE
+    
+    def feed(self, chunk):
+        """
+        Parse the next chunk of the document
+        
+        Args:
+            chunk (bytes): Next bytes of the response body
+        
+        Returns:
+            list: (key, element) pairs for the array elements completed by this chunk
+        
+        Raises:
+            ValueError: If the document is not a JSON object or is malformed
+        """
+        self.bytes_read += len(chunk)
+        self._buffer += self._decoder.decode(chunk)
+        return self._parse(final=False)
+    
+    def close(self):
+        """
+        Parse what is left of the document and check that it was complete
+        
+        Returns:
+            list: (key, element) pairs for the array elements completed at the end
+        
+        Raises:
+            ValueError: If the document is malformed or ended early
+        """
+        self._buffer += self._decoder.decode(b'', final=True)
+        elements = self._parse(final=True)
+        if self._state != _DONE:
+            raise ValueError("Response body ended before the JSON document was complete")
+        return elements
+    
+    def parse(self, chunks):
+        """
+        Parse a document from an iterable of chunks
+        
+        Args:
+            chunks (iterable): Byte chunks of the response body
+        
+        Yields:
+            tuple: (key, element) for each array element, in document order
+        
+        Raises:
+            ValueError: If the document is malformed or ends early
+        """
+        for chunk in chunks:
+            if chunk:
+                yield from self.feed(chunk)
+        yield from self.close()
+    
+    def _parse(self, final):
+        buffer = self._buffer
+        length = len(buffer)
+        pos = 0
+        elements = []
+        
+        while True:
+            match = _NON_WHITESPACE.search(buffer, pos)
+            if match is None:
+                pos = length
+                break
+            pos = match.start()
+            state = self._state
+            
+            if state in (_VALUE, _ELEMENT, _ELEMENT_OR_END, _KEY, _KEY_OR_END):
+                char = buffer[pos]
+                if state == _VALUE and char == '[' and self._key in self.array_keys:
+                    self._state = _ELEMENT_OR_END
+                    pos += 1
+                    continue
+                if state == _ELEMENT_OR_END and char == ']' or state == _KEY_OR_END and char != '"':
+                    self._state = _TRANSITIONS.get((state, char)) or self._unexpected(char, pos)
+                    pos += 1
+                    continue
+                
+                # Wait until the buffer has doubled before retrying an incomplete value
+                if not final and length - pos < self._retry_length:
+                    break
+                try:
+                    value, end = self._scan(buffer, pos)
+                except json.JSONDecodeError as e:
+                    if final or not (e.msg.startswith('Unterminated string') or e.pos >= length - _INCOMPLETE_MARGIN):
+                        raise
+                    self._retry_length = 2 * (length - pos)
+                    break
+                # A number at the end of the buffer, or cut inside its fraction or exponent,
+                # may continue in the next chunk
+                if (not final and isinstance(value, (int, float))
+                        and (end == length or buffer[end] in _NUMBER_CONTINUATION)):
+                    self._retry_length = length - pos + 1
+                    break
+                self._retry_length = 0
+                pos = end
+                
+                if state in (_ELEMENT, _ELEMENT_OR_END):
+                    elements.append((self._key, value))
+                    self._state = _AFTER_ELEMENT
+                elif state == _VALUE:
+                    self.metadata[self._key] = value
+                    self._state = _AFTER_VALUE
+                elif isinstance(value, str):
+                    self._key = value
+                    self._state = _COLON
+                else:
+                    self._unexpected(buffer[match.start()], match.start())
+                continue
+            
+            char = buffer[pos]
+            self._state = _TRANSITIONS.get((state, char)) or self._unexpected(char, pos)
+            pos += 1
+        
+        # Keep only the value being read
+        self._buffer = buffer[pos:]
+        return elements
+    
+    def _unexpected(self, char, pos):
+        raise ValueError(f"Unexpected {char!r} in the response body near character {pos}")
+
+
+class StreamedResults:
+    """
+    One page of fetch results, parsed while the response body is being read
+    
+    Iterate the results once to get each product (or hierarchy) as soon as it has been
+    received. ``search_after`` and ``total_count`` are read from the response metadata,
+    which may follow the items in the body, so they are only reliable once iteration
+    has finished. The HTTP response is closed when iteration ends or the results are closed.
+    """
+    
+    def __init__(self, response, model=Content1Product, array_key='items', chunk_size=65536, transfer_stats=None, path=''):
+        """
+        Initialize the streamed results
+        
+        Args:
+            response (requests.Response): Response opened with ``stream=True``
+            model (type, optional): Model built from each element. Defaults to Content1Product.
+            array_key (str, optional): Top-level key of the streamed array. Defaults to 'items'.
+            chunk_size (int, optional): Bytes read from the response at a time. Defaults to 65536.
+            transfer_stats (TransferStats, optional): Statistics receiving the wire and decoded
+                                                      size of the body once it has been read. Defaults to None.
+            path (str, optional): API endpoint path used in the transfer statistics. Defaults to ''.
+        """
+        self.response = response
+        self.model = model
+        self.array_key = array_key
+        self.chunk_size = chunk_size
+        self.count = 0
+        self.transfer_stats = transfer_stats
+        self.path = path
+        
+        self._parser = JSONStreamParser((array_key,))
+        self._iterated = False
+        self._closed = False
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Get the top-level values other than the streamed array"""
+        return self._parser.metadata
+    
+    @property
+    def search_after(self):
+        """Get the searchAfter value of the page, or None if it has not been received"""
+        return self._parser.metadata.get('searchAfter')
+    
+    @property
+    def total_count(self):
+        """Get the totalCount value of the page, or None if it has not been received"""
+        return self._parser.metadata.get('totalCount')
+    
+    @property
+    def bytes_read(self) -> int:
+        """Get the number of body bytes parsed so far"""
+        return self._parser.bytes_read
+    
+    def __iter__(self):
+        """
+        Iterate through the page, building one model per element as it arrives
+        
+        Raises:
+            RuntimeError: If the results are iterated a second time
+            ValueError: If the response body is not a complete JSON object
+        """
+        if self._iterated:
+            raise RuntimeError("Streamed results can only be iterated once")
+        self._iterated = True
+        
+        model = self.model
+        array_key = self.array_key
+        try:
+            for key, element in self._elements():
+                if key == array_key:
+                    self.count += 1
+                    yield model(element)
+        finally:
+            self.close()
+    
+    def _elements(self):
+        parser = self._parser
+        for chunk in self.response.iter_content(chunk_size=self.chunk_size):
+            if chunk:
+                yield from parser.feed(chunk)
+        
+        # A 204 No Content response has no body and no results
+        if parser.bytes_read:
+            yield from parser.close()
+    
+    def close(self):
+        """Release the HTTP response and record how many bytes were transferred"""
+        if self._closed:
+            return
+        self._closed = True
+        
+        if self.transfer_stats is not None and self._parser.bytes_read:
+            self.transfer_stats.record(self.path, self.response.headers.get('Content-Encoding'),
+                                       wire_bytes(self.response, self.bytes_read), self.bytes_read)
+        self.response.close()
+    
+    def __enter__(self):
+        """Enter a context that closes the response on exit"""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the response when leaving the context"""
+        self.close()
@@ -0,0 +1,338 @@
+"""
+Incremental synchronization for the 1WorldSync Content1 API
+
+This module keeps a local product store up to date by pulling only the items modified
+since the previous sync. A high-water mark, the latest ``lastModifiedDate`` received, is
+saved per (target market, information provider GLN, criteria) scope; the next sync asks
+for items modified since that mark minus an overlap window, so updates that reach the
+API's index late are still picked up. The mark only advances once every changed item has
+been upserted into the store, so an interrupted sync is simply repeated.
+"""
+
+import json
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional
+
+from .checkpoint import _write_atomic
+from .content1_client import _criteria_to_dict
+from .criteria import DateRangeCriteria, FrozenCriteria
+from .export import product_key
+
+
+# Serializes read-modify-write of watermark files shared by several syncs
+_STATE_LOCK = threading.Lock()
+
+
+def parse_modified_date(value) -> Optional[datetime]:
+    """
+    Parse a lastModifiedDate value into a timezone-aware datetime
+    
+    Args:
+        value (str): Date or timestamp such as '2024-01-31' or '2024-01-31T12:00:00Z'
+    
+    Returns:
+        datetime or None: UTC datetime, or None if the value is empty or not a date
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def sync_scope(criteria) -> str:
+    """
+    Get the key under which the watermark of a sync is saved
+    
+    The key combines the target market, information provider GLN and the remaining
+    criteria in canonical form. lastModifiedDate and searchAfter are set by the sync
+    itself and are not part of the scope.
+    
+    Args:
+        criteria (dict or ProductCriteria): Search criteria of the sync
+    
+    Returns:
+        str: Scope key
+    """
+    rest = dict(_criteria_to_dict(criteria))
+    target_market = rest.pop('targetMarket', '')
+    ip_gln = rest.pop('ipGln', '')
+    rest.pop('lastModifiedDate', None)
+    rest.pop('searchAfter', None)
+    return json.dumps([target_market, ip_gln, FrozenCriteria(rest).build()], sort_keys=True, separators=(',', ':'))
+
+
+class ProductStore(ABC):
+    """
+    Interface of the local store updated by DeltaSync
+    
+    Subclasses implement ``upsert``, which inserts new products and replaces stored
+    products of the same (gtin, information provider GLN, target market) with a version
+    that is at least as recent.
+    """
+    
+    @abstractmethod
+    def upsert(self, products) -> int:
+        """
+        Insert or replace products
+        
+        Args:
+            products (list): Content1Product objects
+        
+        Returns:
+            int: Number of products inserted or replaced
+        """
+    
+    def close(self):
+        """Release the store's resources"""
+
+
+class MemoryProductStore(ProductStore):
+    """In-memory product store keyed by (gtin, information provider GLN, target market)"""
+    
+    def __init__(self):
+        """Initialize an empty store"""
+        self._lock = threading.Lock()
+        self.products = {}
+    
+    def upsert(self, products) -> int:
+        """
+        Insert or replace products, keeping the more recent version of each
+        
+        Args:
+            products (list): Content1Product objects
+        
+        Returns:
+            int: Number of products inserted or replaced
+        """
+        changed = 0
+        with self._lock:
+            for product in products:
+                key = product_key(product)
+                stored = self.products.get(key)
+                if stored is not None and _is_older(product, stored):
+                    continue
+                self.products[key] = product
+                changed += 1
+        return changed
+    
+    def get(self, gtin, information_provider_gln, target_market):
+        """
+        Get a stored product
+        
+        Args:
+            gtin (str): GTIN
+            information_provider_gln (str): Information provider GLN
+            target_market (str): Target market
+        
+        Returns:
+            Content1Product or None: The product, or None if it is not stored
+        """
+        return self.products.get((gtin, information_provider_gln, target_market))
+    
+    def __len__(self):
+        """Get the number of stored products"""
+        return len(self.products)
+    
+    def __iter__(self):
+        """Iterate through the stored products"""
+        return iter(list(self.products.values()))
+
+
+def _is_older(product, stored):
+    """Check whether a product is an older version than the stored one"""
+    new = parse_modified_date(product.last_modified_date)
+    old = parse_modified_date(stored.last_modified_date)
+    return new is not None and old is not None and new < old
+
+
+class SyncResult:
+    """
+    Outcome of one DeltaSync run
+    
+    Attributes:
+        scope (str): Scope key of the sync
+        since (datetime): Start of the pulled lastModifiedDate range, None for a full pull
+        items (int): Number of items received
+        upserted (int): Number of items inserted or replaced in the store
+        watermark (datetime): High-water mark after the sync
+    """
+    
+    __slots__ = ('scope', 'since', 'items', 'upserted', 'watermark')
+    
+    def __init__(self, scope, since, items, upserted, watermark):
+        """
+        Initialize the result
+        
+        Args:
+            scope (str): Scope key of the sync
+            since (datetime): Start of the pulled range, None for a full pull
+            items (int): Number of items received
+            upserted (int): Number of items inserted or replaced
+            watermark (datetime): High-water mark after the sync
+        """
+        self.scope = scope
+        self.since = since
+        self.items = items
+        self.upserted = upserted
+        self.watermark = watermark
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the result to a dictionary
+        
+        Returns:
+            dict: Dictionary representation of the result
+        """
+        return {
+            'scope': self.scope,
+            'since': self.since.isoformat() if self.since else None,
+            'items': self.items,
+            'upserted': self.upserted,
+            'watermark': self.watermark.isoformat() if self.watermark else None
+        }
+    
+    def __repr__(self):
+        return (f"SyncResult(items={self.items}, upserted={self.upserted}, "
+                f"since={self.since}, watermark={self.watermark})")
+
+
+class DeltaSync:
+    """
+    Pull the products changed since the previous sync into a local store
+    
+    The first sync of a scope pulls every matching product, or those modified since
+    ``initial_since``. Later syncs only pull products modified on or after the saved
+    watermark minus ``overlap``. The API filters lastModifiedDate by whole days, so the
+    pulled range always starts at midnight UTC; items received again are upserted again,
+    which the store treats as a no-op or a refresh.
+    
+    Watermarks are kept in a JSON file that several DeltaSync objects with different
+    scopes can share.
+    """
+    
+    def __init__(self, client, store, state_path, criteria=None, overlap=timedelta(days=1),
+                 initial_since=None, page_size=1000, batch_size=1000):
+        """
+        Initialize the sync
+        
+        Args:
+            client (Content1Client): Client used for all requests
+            store (ProductStore): Store receiving the changed products
+            state_path (str): JSON file holding the watermarks
+            criteria (dict or ProductCriteria, optional): Search criteria, typically a target
+                                                          market and information provider GLN. Defaults to None.
+            overlap (timedelta, optional): Period before the watermark that is pulled again. Defaults to one day.
+            initial_since (str, date or datetime, optional): Start of the first sync. Defaults to a full pull.
+            page_size (int, optional): Number of products per page. Defaults to 1000.
+            batch_size (int, optional): Number of products upserted at a time. Defaults to 1000.
+        """
+        self.client = client
+        self.store = store
+        self.state_path = str(state_path)
+        self.criteria = dict(_criteria_to_dict(criteria))
+        self.criteria.pop('lastModifiedDate', None)
+        self.criteria.pop('searchAfter', None)
+        self.overlap = overlap
+        self.initial_since = initial_since
+        self.page_size = page_size
+        self.batch_size = batch_size
+        self.scope = sync_scope(self.criteria)
+    
+    def _load_state(self):
+        try:
+            with open(self.state_path, 'rb') as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            return {}
+    
+    def watermark(self) -> Optional[datetime]:
+        """
+        Get the saved high-water mark of this sync's scope
+        
+        Returns:
+            datetime or None: Latest lastModifiedDate received, or None before the first sync
+        """
+        return parse_modified_date(self._load_state().get(self.scope))
+    
+    def set_watermark(self, watermark):
+        """
+        Save the high-water mark of this sync's scope
+        
+        Args:
+            watermark (datetime or None): New mark, or None to force a full pull next time
+        """
+        with _STATE_LOCK:
+            state = self._load_state()
+            if watermark is None:
+                state.pop(self.scope, None)
+            else:
+                state[self.scope] = watermark.isoformat()
+            _write_atomic(self.state_path, json.dumps(state, indent=2, sort_keys=True).encode('utf-8'))
+    
+    def since(self) -> Optional[datetime]:
+        """
+        Get the start of the range the next sync pulls
+        
+        Returns:
+            datetime or None: Watermark minus the overlap, or None for a full pull
+        """
+        watermark = self.watermark()
+        if watermark is not None:
+            return watermark - self.overlap
+        if self.initial_since is None:
+            return None
+        return parse_modified_date(str(self.initial_since))
+    
+    def criteria_since(self, since) -> Dict[str, Any]:
+        """
+        Build the criteria pulling the products modified since a point in time
+        
+        Args:
+            since (datetime or None): Start of the range, None for every product
+        
+        Returns:
+            dict: Copy of the sync criteria with a lastModifiedDate range up to today
+        """
+        criteria = dict(self.criteria)
+        if since is not None:
+            today = datetime.now(timezone.utc).date()
+            criteria['lastModifiedDate'] = DateRangeCriteria.between(
+                since.date().isoformat(), max(today, since.date()).isoformat()
+            )
+        return criteria
+    
+    def run(self) -> SyncResult:
+        """
+        Pull the changed products, upsert them and advance the watermark
+        
+        Returns:
+            SyncResult: Counts, pulled range and new watermark
+        """
+        previous = self.watermark()
+        since = self.since()
+        watermark = previous
+        items = upserted = 0
+        
+        batch = []
+        for product in self.client.iter_products(self.criteria_since(since), self.page_size):
+            items += 1
+            modified = parse_modified_date(product.last_modified_date)
+            if modified is not None and (watermark is None or modified > watermark):
+                watermark = modified
+            batch.append(product)
+            if len(batch) >= self.batch_size:
+                upserted += self.store.upsert(batch)
+                batch = []
+        if batch:
+            upserted += self.store.upsert(batch)
+        
+        if watermark != previous:
+            self.set_watermark(watermark)
+        return SyncResult(self.scope, since, items, upserted, watermark)
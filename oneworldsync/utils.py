@@ -4,6 +4,7 @@ Utility functions for the 1WorldSync Content1 API client
 
 import json
 import logging
+from functools import lru_cache
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional, Union
 
@@ -11,6 +12,19 @@ from typing import Dict, List, Any, Optional, Union
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def normalize_gtin(gtin) -> str:
+    """
+    Normalize a GTIN to the 14 digits the API expects
+    
+    Args:
+        gtin (str or int): GTIN-8, GTIN-12 (UPC), GTIN-13 (EAN) or GTIN-14
+    
+    Returns:
+        str: GTIN padded with leading zeros to 14 digits
+    """
+    return str(gtin).strip().zfill(14)
+
+
 def format_timestamp(dt=None):
     """
     Format a datetime object as a timestamp for the 1WorldSync API
@@ -81,10 +95,71 @@ def extract_nested_value(data, path, default=None):
         return default
 
 
+@lru_cache(maxsize=1024)
+def compile_path(path: str):
+    """
+    Compile a dot-separated path into an accessor function
+    
+    The path is split and its list indices are parsed once, so the accessor can be
+    applied to many dictionaries cheaply. The accessor behaves exactly like
+    get_nested_dict_value: numeric parts index into lists, other parts look up
+    dictionary keys, and a missing key, out-of-range index, type mismatch or None
+    value returns the default. Compiled paths are cached, so compiling the same
+    path again is cheap.
+    
+    Args:
+        path (str): Dot-separated path (e.g., "tradeItemDescriptionModule.tradeItemDescriptionInformation")
+        
+    Returns:
+        callable: Function accessor(data, default=None) returning the value at the path
+    """
+    parts = path.split('.')
+    
+    if not any(part.isdigit() for part in parts):
+        # Dictionary keys only: the common case, with a tighter loop
+        keys = tuple(parts)
+        
+        def accessor(data, default=None):
+            if not data or not isinstance(data, dict):
+                return default
+            current = data
+            for key in keys:
+                if not isinstance(current, dict):
+                    return default
+                current = current.get(key)
+                if current is None:
+                    return default
+            return current
+    else:
+        steps = tuple((part, int(part) if part.isdigit() else None) for part in parts)
+        
+        def accessor(data, default=None):
+            if not data or not isinstance(data, dict):
+                return default
+            current = data
+            for key, index in steps:
+                if index is not None and isinstance(current, list):
+                    if index >= len(current):
+                        return default
+                    current = current[index]
+                elif isinstance(current, dict):
+                    current = current.get(key)
+                else:
+                    return default
+                if current is None:
+                    return default
+            return current
+    
+    accessor.path = path
+    return accessor
+
+
 def get_nested_dict_value(data: Dict, path: str, default: Any = None) -> Any:
     """
     Extract a value from a nested dictionary using a dot-separated path
     
+    For repeated lookups of the same path, compile it once with compile_path.
+    
     Args:
         data (dict): Dictionary to extract from
         path (str): Dot-separated path (e.g., "item.tradeItemInformation.0.tradeItemDescriptionModule")
@@ -93,195 +168,30 @@ def get_nested_dict_value(data: Dict, path: str, default: Any = None) -> Any:
     Returns:
         The value at the path or the default value
     """
-    if not data or not isinstance(data, dict):
-        return default
-        
-    parts = path.split('.')
-    current = data
-    
-    for part in parts:
-        # Handle array indices
-        if part.isdigit() and isinstance(current, list):
-            index = int(part)
-            if 0 <= index < len(current):
-                current = current[index]
-            else:
-                return default
-        elif isinstance(current, dict):
-            current = current.get(part)
-        else:
-            return default
-            
-        if current is None:
-            return default
-            
-    return current
+    return compile_path(path)(data, default)
 
 
 def extract_product_data(product_data: Dict) -> Dict:
     """
     Extract relevant product data from a 1WorldSync product object based on the Swagger Search schema.
     
+    The fields are defined declaratively by schema.PRODUCT_SCHEMA; build your own Schema
+    (or use PRODUCT_SCHEMA.select()) to extract other or fewer fields.
+    
     Args:
         product_data (dict): A product data dictionary from the 1WorldSync Search REST API
         
     Returns:
         dict: A dictionary with structured product data
     """
-    # Initialize with default values
-    extracted_data = {
-        'gtin': '',
-        'brand_name': '',
-        'product_name': '',
-        'description': '',
-        'manufacturer': '',
-        'image_url': '',
-        'category': '',
-        'subcategory': '',
-        'gpc_code': '',
-        'ingredients': '',
-        'dimensions': {},
-        'country_of_origin': '',
-        'allergen_info': [],
-        'item_id': '',
-        'images': []
-    }
+    # Imported here because the schema module builds on compile_path
+    from .schema import PRODUCT_SCHEMA
     
     try:
-        item = product_data.get('item', {})
-        
-        # Extract GTIN (item identifier)
-        identifiers = get_nested_dict_value(item, 'itemIdentificationInformation.itemIdentifier', [])
-        for identifier in identifiers:
-            if identifier.get('itemIdType', {}).get('value') == 'GTIN':
-                extracted_data['gtin'] = identifier.get('itemId', '')
-                break
-        
-        # Extract item reference ID
-        item_ref_info = get_nested_dict_value(item, 'itemIdentificationInformation.itemReferenceIdInformation', {})
-        extracted_data['item_id'] = item_ref_info.get('itemReferenceId', '')
-        
-        # Extract trade item information
-        trade_item_info = get_nested_dict_value(item, 'tradeItemInformation', [])
-        if trade_item_info:
-            # Extract brand name and product name
-            for info in trade_item_info:
-                desc_info = get_nested_dict_value(info, 'tradeItemDescriptionModule.tradeItemDescriptionInformation', [])
-                for desc in desc_info:
-                    # Brand name
-                    brand_info = desc.get('brandNameInformation', {})
-                    if brand_info:
-                        extracted_data['brand_name'] = brand_info.get('brandName', '')
-                    
-                    # Product name
-                    reg_names = desc.get('regulatedProductName', [])
-                    for reg_name in reg_names:
-                        values = get_nested_dict_value(reg_name, 'statement.values', [])
-                        for value in values:
-                            if value.get('value'):
-                                extracted_data['product_name'] = value.get('value')
-                                break
-                    
-                    # Description
-                    add_desc = get_nested_dict_value(desc, 'additionalTradeItemDescription.values', [])
-                    for desc_val in add_desc:
-                        if desc_val.get('value'):
-                            extracted_data['description'] = desc_val.get('value')
-                            break
-                
-                # Extract images
-                file_module = get_nested_dict_value(info, 'referencedFileDetailInformationModule', {})
-                file_headers = file_module.get('referencedFileHeader', [])
-                
-                for file_header in file_headers:
-                    file_type = get_nested_dict_value(file_header, 'referencedFileTypeCode.value', '')
-                    if file_type == 'PRODUCT_IMAGE':
-                        uri = file_header.get('uniformResourceIdentifier', '')
-                        is_primary = get_nested_dict_value(file_header, 'isPrimaryFile.value', '') == 'true'
-                        
-                        image_data = {
-                            'url': uri,
-                            'is_primary': is_primary
-                        }
-                        
-                        extracted_data['images'].append(image_data)
-                        
-                        # Set primary image as the main image URL
-                        if is_primary and uri:
-                            extracted_data['image_url'] = uri
-                
-                # Extract dimensions
-                measurement_groups = get_nested_dict_value(info, 'tradeItemMeasurementsModuleGroup', [])
-                for group in measurement_groups:
-                    measurements = get_nested_dict_value(group, 'tradeItemMeasurementsModule.tradeItemMeasurements', {})
-                    if measurements:
-                        # Height
-                        height = measurements.get('height', {})
-                        if height:
-                            extracted_data['dimensions']['height'] = {
-                                'value': height.get('value', ''),
-                                'unit': height.get('qual', '')
-                            }
-                        
-                        # Width
-                        width = measurements.get('width', {})
-                        if width:
-                            extracted_data['dimensions']['width'] = {
-                                'value': width.get('value', ''),
-                                'unit': width.get('qual', '')
-                            }
-                        
-                        # Depth
-                        depth = measurements.get('depth', {})
-                        if depth:
-                            extracted_data['dimensions']['depth'] = {
-                                'value': depth.get('value', ''),
-                                'unit': depth.get('qual', '')
-                            }
-                
-                # Extract ingredients
-                ingredient_modules = get_nested_dict_value(info, 'foodAndBeverageIngredientModule', [])
-                for module in ingredient_modules:
-                    statements = get_nested_dict_value(module, 'ingredientStatement', [])
-                    for statement in statements:
-                        values = get_nested_dict_value(statement, 'statement.values', [])
-                        for value in values:
-                            if value.get('value'):
-                                extracted_data['ingredients'] = value.get('value')
-                                break
-                
-                # Extract country of origin
-                place_module = get_nested_dict_value(info, 'placeOfItemActivityModule', {})
-                countries = get_nested_dict_value(place_module, 'placeOfProductActivity.countryOfOrigin', [])
-                for country in countries:
-                    country_code = get_nested_dict_value(country, 'countryCode.value', '')
-                    if country_code:
-                        extracted_data['country_of_origin'] = country_code
-                        break
-        
-        # Extract GPC code and category
-        product_categories = get_nested_dict_value(item, 'productCategory', [])
-        for category in product_categories:
-            scheme = get_nested_dict_value(category, 'productCategoryScheme.value', '')
-            if scheme == 'GPC':
-                category_codes = category.get('productCategoryCodes', [])
-                for code in category_codes:
-                    gpc_code = get_nested_dict_value(code, 'productCategoryCode.value', '')
-                    if gpc_code:
-                        extracted_data['gpc_code'] = gpc_code
-                        
-                        # Try to get category component
-                        component = get_nested_dict_value(code, 'productCategoryComponent.value', '')
-                        if component:
-                            if component == 'BRICK':
-                                extracted_data['category'] = gpc_code
-                            elif component == 'SEGMENT':
-                                extracted_data['subcategory'] = gpc_code
-    
+        return PRODUCT_SCHEMA.extract(product_data.get('item', {}))
     except Exception as e:
         logger.error(f"Error extracting product data: {e}")
-    
-    return extracted_data
+        return PRODUCT_SCHEMA.extract({})
 
 
 def extract_search_results(search_results: Dict) -> Dict:
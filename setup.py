@@ -9,6 +9,12 @@ setup(
         "python-dotenv>=0.15.0",
         "click>=8.0.0",  # Added for CLI support
     ],
+    extras_require={
+        "async": ["aiohttp>=3.8"],
+        "frame": ["numpy>=1.20", "pyarrow>=8.0"],
+        "fast-json": ["orjson>=3.6"],
+        "compression": ["brotli>=1.0", "backports.zstd>=1.0; python_version < '3.14'"],
+    },
     entry_points={
         'console_scripts': [
             'ows=oneworldsync.cli:cli',
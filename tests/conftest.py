@@ -3,8 +3,11 @@ Pytest configuration for 1WorldSync Content1 API tests
 """
 
 import os
+import threading
 import pytest
 from unittest.mock import patch
+from oneworldsync.content1_client import _next_page_criteria
+from oneworldsync.models import Content1ProductResults
 
 
 @pytest.fixture
@@ -83,4 +86,94 @@ def mock_content1_hierarchy_response():
             }
         ],
         'searchAfter': 'next_hierarchy_token'
-    }
\ No newline at end of file
+    }
+
+
+class PagingClient:
+    """
+    In-memory stand-in for Content1Client paging with integer searchAfter tokens
+    
+    Items are filtered by the gtin, targetMarket and lastModifiedDate day of the criteria.
+    Fetch numbers in ``fail_on`` (counted from 1) raise ConnectionError, ``error`` is raised
+    by every fetch, and ``page_limit`` caps the pages the server returns.
+    """
+    
+    def __init__(self, items, page_limit=None, fail_on=None, error=None):
+        self.items = items
+        self.page_limit = page_limit
+        self.fail_on = set(fail_on or ())
+        self.error = error
+        self.requests = []
+        self.fetches = 0
+        self.count_calls = 0
+        self.fetch_threads = set()
+        self._lock = threading.Lock()
+    
+    def _matching(self, criteria):
+        criteria = criteria or {}
+        gtins = {gtin.zfill(14) for gtin in criteria['gtin']} if 'gtin' in criteria else None
+        market = criteria.get('targetMarket')
+        date_range = criteria.get('lastModifiedDate')
+        matching = []
+        for item in self.items:
+            if gtins is not None and item['gtin'] not in gtins:
+                continue
+            if market and item['targetMarket'] != market:
+                continue
+            if date_range and not (date_range['from']['date'] <= item['lastModifiedDate'][:10] <= date_range['to']['date']):
+                continue
+            matching.append(item)
+        return matching
+    
+    def count_products(self, criteria=None):
+        self.count_calls += 1
+        return len(self._matching(criteria))
+    
+    def fetch_products(self, criteria=None, page_size=1000):
+        criteria = criteria or {}
+        with self._lock:
+            self.requests.append(criteria)
+            self.fetches += 1
+            fetch = self.fetches
+            self.fetch_threads.add(threading.current_thread().name)
+        if self.error:
+            raise self.error
+        if fetch in self.fail_on:
+            raise ConnectionError("connection lost")
+        
+        matching = self._matching(criteria)
+        size = min(page_size, self.page_limit or page_size)
+        offset = criteria.get('searchAfter', [0])[0]
+        response = {'items': matching[offset:offset + size]}
+        if offset + size < len(matching):
+            response['searchAfter'] = [offset + size]
+        return Content1ProductResults(response)
+    
+    def fetch_next_page(self, previous_response, page_size=1000, original_criteria=None):
+        return self.fetch_products(_next_page_criteria(previous_response, original_criteria), page_size)
+    
+    def fetch_products_by_gtin(self, gtins, page_size=1000, target_market=None, ip_gln=None, fields=None):
+        criteria = {'gtin': list(gtins)}
+        if target_market:
+            criteria['targetMarket'] = target_market
+        return self.fetch_products(criteria, page_size)
+    
+    def iter_products(self, criteria=None, page_size=1000):
+        results = self.fetch_products(criteria, page_size)
+        while True:
+            yield from results
+            if not results.search_after:
+                return
+            results = self.fetch_next_page(results, page_size, criteria)
+
+
+def make_item(gtin, modified='2024-01-01T12:00:00Z', market='US', name='Product'):
+    """Create a raw product item as returned by the fetch endpoint"""
+    return {'gtin': gtin, 'informationProviderGLN': '1234567890123', 'targetMarket': market,
+            'lastModifiedDate': modified, 'item': {'gtin': gtin, 'brandName': name}}
+
+
+def make_items(days, per_day):
+    """Create items spread over the first days of January 2024"""
+    return [make_item(f"{day:07d}{n:07d}", f"2024-01-{day:02d}T12:00:00Z")
+            for day in range(1, days + 1) for n in range(per_day)]
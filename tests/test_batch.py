@@ -0,0 +1,169 @@
+"""
+Tests for the batch module
+"""
+
+import queue
+import time
+import pytest
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import patch
+from conftest import PagingClient, make_item
+from oneworldsync.batch import GtinBatcher, BulkGtinFetch, _STOP
+from oneworldsync.content1_client import Content1Client
+from oneworldsync.models import Content1ProductResults
+
+
+def catalog(count):
+    return [make_item(f"{n:014d}") for n in range(count)]
+
+
+def test_concurrent_lookups_share_requests():
+    """Test lookups made at the same time are fetched together and routed by GTIN"""
+    client = PagingClient(catalog(50))
+    
+    with GtinBatcher(client, max_wait=0.05, max_batch=100) as batcher:
+        with ThreadPoolExecutor(max_workers=50) as pool:
+            results = list(pool.map(lambda n: batcher.lookup(f"{n:014d}", timeout=5), range(50)))
+    
+    assert [result[0].gtin for result in results] == [f"{n:014d}" for n in range(50)]
+    assert len(client.requests) < 10
+    assert batcher.stats()['lookups'] == 50
+
+
+def test_batch_size_limit_and_duplicates():
+    """Test batches hold at most max_batch distinct GTINs and duplicates are fetched once"""
+    client = PagingClient(catalog(10))
+    
+    with GtinBatcher(client, max_wait=0.2, max_batch=3) as batcher:
+        futures = [batcher.submit(f"{n // 2:014d}") for n in range(10)]
+        results = [future.result(timeout=5) for future in futures]
+    
+    assert all(len(criteria['gtin']) <= 3 for criteria in client.requests)
+    assert sorted(gtin for criteria in client.requests for gtin in criteria['gtin']) == [f"{n:014d}" for n in range(5)]
+    assert [result[0].gtin for result in results] == [f"{n // 2:014d}" for n in range(10)]
+
+
+class EndlessDuplicates(queue.Queue):
+    """Queue always holding another lookup of the same GTIN, then the stop marker after a while"""
+    
+    def __init__(self):
+        super().__init__()
+        self.until = time.monotonic() + 0.5
+    
+    def get(self, block=True, timeout=None):
+        if time.monotonic() >= self.until:
+            return _STOP
+        return (f"{0:014d}", Future())
+
+
+def test_full_batch_is_not_held_back_by_duplicates():
+    """Test a steady stream of duplicate lookups cannot delay a full batch past max_wait"""
+    client = PagingClient(catalog(1))
+    
+    with patch('oneworldsync.batch.queue.Queue', EndlessDuplicates):
+        batcher = GtinBatcher(client, max_wait=0.01, max_batch=1)
+    batcher.close()
+    
+    assert len(client.requests) > 5
+
+
+def test_not_found_and_short_gtins():
+    """Test unknown GTINs resolve to no products and short GTINs match padded items"""
+    client = PagingClient(catalog(3))
+    
+    with GtinBatcher(client, max_wait=0.01, target_market='US') as batcher:
+        missing = batcher.submit('99999999999999')
+        short = batcher.submit('2')
+        assert missing.result(timeout=5) == []
+        assert short.result(timeout=5)[0].gtin == '00000000000002'
+    
+    assert client.requests[0]['targetMarket'] == 'US'
+
+
+def test_batches_follow_pages():
+    """Test every page of a batch is fetched before its futures resolve"""
+    client = PagingClient(catalog(6), page_limit=2)
+    
+    with GtinBatcher(client, max_wait=0.05) as batcher:
+        futures = [batcher.submit(f"{n:014d}") for n in range(6)]
+        results = [future.result(timeout=5) for future in futures]
+    
+    assert all(len(result) == 1 for result in results)
+    assert batcher.stats()['requests'] == 3
+
+
+def test_errors_reach_every_caller():
+    """Test a failed batch request fails the futures of the whole batch"""
+    client = PagingClient([], error=ConnectionError("connection lost"))
+    
+    with GtinBatcher(client, max_wait=0.05) as batcher:
+        futures = [batcher.submit(str(n)) for n in range(3)]
+        for future in futures:
+            with pytest.raises(ConnectionError):
+                future.result(timeout=5)
+
+
+def test_close_flushes_and_rejects():
+    """Test closing fetches queued lookups and rejects new ones"""
+    client = PagingClient(catalog(2))
+    batcher = GtinBatcher(client, max_wait=10)
+    future = batcher.submit('00000000000001')
+    
+    batcher.close()
+    
+    assert future.result(timeout=0)[0].gtin == '00000000000001'
+    with pytest.raises(RuntimeError):
+        batcher.submit('00000000000001')
+
+
+def test_bulk_fetch_normalizes_dedups_and_chunks():
+    """Test GTINs are padded, de-duplicated and fetched in chunks of chunk_size"""
+    client = PagingClient(catalog(20))
+    gtins = [str(n) for n in range(25)] + [f"{n:014d}" for n in range(10)] + ['  ']
+    
+    fetch = BulkGtinFetch(client, gtins, chunk_size=10, max_workers=3)
+    products = list(fetch)
+    
+    assert len(fetch.gtins) == 25
+    assert sorted(product.gtin for product in products) == [f"{n:014d}" for n in range(20)]
+    assert sorted(len(criteria['gtin']) for criteria in client.requests) == [5, 10, 10]
+    assert fetch.not_found == [f"{n:014d}" for n in range(20, 25)]
+    assert fetch.stats == {'gtins': 25, 'chunks': 3, 'pages': 3, 'items': 20}
+
+
+def test_bulk_fetch_follows_pages():
+    """Test every page of each chunk is fetched"""
+    client = PagingClient(catalog(9), page_limit=2)
+    
+    fetch = BulkGtinFetch(client, [str(n) for n in range(9)], chunk_size=5, max_workers=2)
+    
+    assert len(list(fetch)) == 9
+    assert fetch.stats['pages'] == 5
+    assert fetch.not_found == []
+    with pytest.raises(RuntimeError):
+        list(fetch)
+
+
+def test_bulk_fetch_raises_worker_errors():
+    """Test a failed chunk stops the fetch with its error"""
+    client = PagingClient([], error=ConnectionError("connection lost"))
+    fetch = BulkGtinFetch(client, ['1', '2'], chunk_size=1)
+    
+    with pytest.raises(ConnectionError):
+        list(fetch)
+    assert fetch.not_found is None
+
+
+def test_client_bulk_fetch_by_gtin():
+    """Test the client method fetches through fetch_products"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    
+    def fetch_products(criteria, page_size=1000):
+        return Content1ProductResults({'items': [{'gtin': gtin} for gtin in criteria['gtin'] if gtin != '00000000000003']})
+    
+    with patch.object(client, 'fetch_products', side_effect=fetch_products):
+        fetch = client.bulk_fetch_by_gtin(['1', '2', '3', '1'], chunk_size=2, target_market='US')
+        gtins = sorted(product.gtin for product in fetch)
+    
+    assert gtins == ['00000000000001', '00000000000002']
+    assert fetch.not_found == ['00000000000003']
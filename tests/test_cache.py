@@ -0,0 +1,170 @@
+"""
+Tests for the cache module
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+from oneworldsync.cache import ProductCache, cache_scope, cached_results
+from oneworldsync.content1_client import Content1Client
+from oneworldsync.models import Content1Product, Content1ProductResults
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def make_item(gtin, market='US'):
+    return {'gtin': gtin, 'targetMarket': market, 'item': {'gtin': gtin, 'brandName': f"Brand {gtin}"}}
+
+
+def products(*gtins):
+    return [Content1Product(make_item(gtin)) for gtin in gtins]
+
+
+def test_cache_scope_is_canonical():
+    """Test field projections in any key order share a scope"""
+    assert cache_scope('US', None, {'include': ['a'], 'exclude': ['b']}) == \
+        cache_scope('US', '', {'exclude': ['b'], 'include': ['a']})
+    assert cache_scope('US') != cache_scope('CA')
+
+
+def test_lookup_and_store():
+    """Test cached GTINs are hits, others are misses and not-found GTINs are cached"""
+    cache = ProductCache()
+    scope = cache_scope('US')
+    
+    cache.store(['1', '2', '3'], scope, products('1', '2'))
+    found, missing = cache.lookup(['1', '3', '4', '1'], scope)
+    
+    assert [product.gtin for product in found] == ['1']
+    assert missing == ['4']
+    assert cache.stats()['hits'] == 2
+    assert cache.stats()['misses'] == 1
+    assert cache.lookup(['1'], cache_scope('CA'))[1] == ['1']
+
+
+def test_store_matches_zero_padded_gtins():
+    """Test a returned 14-digit GTIN answers the shorter GTIN that was requested"""
+    cache = ProductCache()
+    cache.store(['12345678905'], (), products('00012345678905'))
+    
+    assert [product.gtin for product in cache.lookup(['12345678905'], ())[0]] == ['00012345678905']
+
+
+def test_store_without_gtins_caches_no_misses():
+    """Test products projected without a GTIN do not mark the requested GTINs as not found"""
+    cache = ProductCache()
+    scope = cache_scope('US', fields={'include': ['brandName']})
+    unnamed = Content1Product({'targetMarket': 'US', 'item': {'brandName': 'Acme'}})
+    
+    cache.store(['1', '2', '3'], scope, products('1') + [unnamed])
+    found, missing = cache.lookup(['1', '2', '3'], scope)
+    
+    assert [product.gtin for product in found] == ['1']
+    assert missing == ['2', '3']
+
+
+def test_ttl_expiry():
+    """Test entries expire after the time to live"""
+    clock = FakeClock()
+    cache = ProductCache(ttl=10, clock=clock)
+    cache.store(['1'], (), products('1'))
+    
+    clock.now = 9.9
+    assert cache.lookup(['1'], ())[1] == []
+    clock.now = 10
+    assert cache.lookup(['1'], ())[1] == ['1']
+    assert cache.stats()['expirations'] == 1
+    assert cache.stats()['memory_bytes'] == 0
+
+
+def test_lru_eviction():
+    """Test the least recently used entry is evicted first"""
+    cache = ProductCache(max_entries=2)
+    cache.store(['1', '2'], (), products('1', '2'))
+    cache.lookup(['1'], ())
+    cache.store(['3'], (), products('3'))
+    
+    assert cache.lookup(['1', '2', '3'], ())[1] == ['2']
+    assert cache.stats()['evictions'] == 1
+    assert len(cache) == 2
+
+
+def test_memory_and_invalidate():
+    """Test memory accounting follows stores and invalidation"""
+    cache = ProductCache()
+    cache.store(['1', '2'], (), products('1', '2'))
+    assert cache.stats()['memory_bytes'] > 0
+    
+    cache.invalidate('1')
+    assert cache.lookup(['1', '2'], ())[1] == ['1']
+    cache.invalidate()
+    assert cache.stats()['memory_bytes'] == 0
+    assert len(cache) == 0
+
+
+def test_cached_results():
+    """Test cached products are returned as one results object"""
+    results = cached_results(products('1', '2'))
+    
+    assert isinstance(results, Content1ProductResults)
+    assert [product.gtin for product in results] == ['1', '2']
+    assert results.search_after is None
+    assert len(results.data['items']) == 2
+
+
+def test_client_fetches_only_misses():
+    """Test the client sends only uncached GTINs, in one request per page"""
+    cache = ProductCache()
+    client = Content1Client('test_app_id', 'test_secret_key', product_cache=cache)
+    pages = [Content1ProductResults({'items': [make_item('1'), make_item('2')], 'searchAfter': ['2']}),
+             Content1ProductResults({'items': [make_item('2', 'CA')]})]
+    
+    with patch.object(client, 'fetch_products', side_effect=pages) as fetch:
+        first = client.fetch_products_by_gtin(['1', '2', '3'], page_size=2, target_market='US')
+    
+    assert fetch.call_count == 2
+    assert fetch.call_args_list[0].args[0] == {'gtin': ['1', '2', '3'], 'targetMarket': 'US'}
+    assert fetch.call_args_list[1].args[0]['searchAfter'] == ['2']
+    assert len(first) == 3
+    
+    response = Content1ProductResults({'items': [make_item('4')]})
+    with patch.object(client, 'fetch_products', return_value=response) as fetch:
+        second = client.fetch_products_by_gtin(['3', '2', '4', '1'], target_market='US')
+    
+    fetch.assert_called_once_with({'gtin': ['4'], 'targetMarket': 'US'}, 1000)
+    assert sorted(product.gtin for product in second) == ['1', '2', '2', '4']
+    
+    with patch.object(client, 'fetch_products') as fetch:
+        client.fetch_products_by_gtin(['1', '4'], target_market='US')
+    fetch.assert_not_called()
+    assert cache.stats()['hits'] == 5
+
+
+def test_async_client_uses_cache():
+    """Test the async client answers cached GTINs locally"""
+    pytest.importorskip('aiohttp')
+    from oneworldsync.content1_async_client import AsyncContent1Client
+    
+    calls = []
+    
+    async def fetch_products(criteria, page_size=1000):
+        calls.append(criteria)
+        return Content1ProductResults({'items': [make_item(gtin) for gtin in criteria['gtin']]})
+    
+    client = AsyncContent1Client('test_app_id', 'test_secret_key', product_cache=ProductCache())
+    client.fetch_products = fetch_products
+    
+    async def run():
+        await client.fetch_products_by_gtin(['1', '2'])
+        return await client.fetch_products_by_gtin(['2', '3'])
+    
+    results = asyncio.run(run())
+    
+    assert [criteria['gtin'] for criteria in calls] == [['1', '2'], ['3']]
+    assert [product.gtin for product in results] == ['2', '3']
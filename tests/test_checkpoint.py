@@ -0,0 +1,98 @@
+"""
+Tests for the checkpoint module
+"""
+
+import json
+import pytest
+from conftest import PagingClient, make_items
+from oneworldsync.checkpoint import CheckpointedExport, CheckpointedPartitionedExport, ExportCheckpoint
+
+
+def read_gtins(path):
+    with open(path) as f:
+        return [json.loads(line)['gtin'] for line in f]
+
+
+def test_export_commits_every_page(tmp_path):
+    """Test the state file follows the output after every page"""
+    output = tmp_path / 'out.jsonl'
+    export = CheckpointedExport(PagingClient(make_items(1, 25)), {'targetMarket': 'US'}, output, page_size=10)
+    
+    state = export.run()
+    
+    assert state.complete
+    assert (state.pages, state.items) == (3, 25)
+    assert state.offset == output.stat().st_size
+    assert read_gtins(output) == [item['gtin'] for item in make_items(1, 25)]
+    assert [product.gtin for product in export] == read_gtins(output)
+    assert ExportCheckpoint.load(export.state_path).to_dict() == state.to_dict()
+
+
+def test_export_resumes_after_failure(tmp_path):
+    """Test a failed export resumes after the last committed page without duplicates"""
+    output = tmp_path / 'out.jsonl'
+    items = make_items(1, 55)
+    client = PagingClient(items, fail_on={4})
+    export = CheckpointedExport(client, {'targetMarket': 'US'}, output, page_size=10)
+    
+    with pytest.raises(ConnectionError):
+        export.run()
+    assert export.checkpoint().pages == 3
+    
+    # A page written after the last checkpoint but never committed
+    with open(output, 'ab') as f:
+        f.write(b'{"gtin": "partial"}\n{"gti')
+    
+    state = export.run()
+    
+    assert state.complete
+    assert state.items == 55
+    assert read_gtins(output) == [item['gtin'] for item in items]
+    assert client.fetches == 4 + 3
+
+
+def test_completed_export_is_not_repeated(tmp_path):
+    """Test running a completed export does not fetch again"""
+    client = PagingClient(make_items(1, 5))
+    export = CheckpointedExport(client, {}, tmp_path / 'out.jsonl', page_size=10)
+    
+    export.run()
+    export.run()
+    
+    assert client.fetches == 1
+
+
+def test_export_rejects_other_criteria(tmp_path):
+    """Test a state file is not reused for different criteria"""
+    output = tmp_path / 'out.jsonl'
+    CheckpointedExport(PagingClient(make_items(1, 5)), {'targetMarket': 'US'}, output).run()
+    
+    with pytest.raises(ValueError):
+        CheckpointedExport(PagingClient([]), {'targetMarket': 'CA'}, output).run()
+
+
+def test_partitioned_export_resumes_per_partition(tmp_path):
+    """Test partitions keep their own checkpoints and resume to an exactly-once export"""
+    items = make_items(8, 12)
+    client = PagingClient(items, fail_on={9})
+    export = CheckpointedPartitionedExport(client, '2024-01-01', '2024-01-08', tmp_path,
+                                           criteria={'targetMarket': 'US'}, partitions=4,
+                                           max_workers=1, page_size=5)
+    
+    with pytest.raises(ConnectionError):
+        export.run()
+    
+    # Items were added after planning; the saved plan is reused
+    client.items = items + make_items(1, 1)
+    client.fail_on = set()
+    states = CheckpointedPartitionedExport(client, '2024-01-01', '2024-01-08', tmp_path,
+                                           criteria={'targetMarket': 'US'}, partitions=2,
+                                           page_size=5).run()
+    
+    gtins = [product.gtin for product in export]
+    assert len(states) == 4
+    assert all(state.complete for state in states)
+    assert sorted(gtins) == sorted(item['gtin'] for item in items)
+    
+    with pytest.raises(ValueError):
+        CheckpointedPartitionedExport(client, '2024-01-01', '2024-01-09', tmp_path).plan()
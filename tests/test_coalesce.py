@@ -0,0 +1,205 @@
+"""
+Tests for the coalesce module
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import patch
+from oneworldsync.coalesce import SingleFlight, AsyncSingleFlight, request_key
+from oneworldsync.content1_client import Content1Client
+
+
+def test_request_key_is_canonical():
+    """Test identical requests built differently share a key"""
+    a = request_key('post', '/V1/product/fetch', {'pageSize': 10}, {'gtin': ['2', '1'], 'targetMarket': 'US'})
+    b = request_key('POST', '/V1/product/fetch', {'pageSize': '10'}, {'targetMarket': 'US', 'gtin': ['1', '2']})
+    
+    assert a == b
+    assert a != request_key('POST', '/V1/product/fetch', {'pageSize': 20}, {'gtin': ['1', '2'], 'targetMarket': 'US'})
+    assert a != request_key('POST', '/V1/product/count', {'pageSize': 10}, {'gtin': ['1', '2'], 'targetMarket': 'US'})
+
+
+def run_concurrently(count, target):
+    results = [None] * count
+    
+    def run(index):
+        results[index] = target()
+    
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_single_flight_shares_result():
+    """Test concurrent calls with one key run the function once"""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    executions = []
+    
+    def slow():
+        executions.append(1)
+        started.set()
+        release.wait(5)
+        return {'items': [{'gtin': '00000000000001'}]}
+    
+    def call():
+        return flight.do('key', slow)
+    
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    
+    followers = []
+    threads = [threading.Thread(target=lambda: followers.append(call())) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    while flight.calls < 11:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads + [leader]:
+        thread.join()
+    
+    assert len(executions) == 1
+    assert len(followers) == 10
+    # Every follower gets its own copy to modify
+    assert all(result == {'items': [{'gtin': '00000000000001'}]} for result in followers)
+    assert len({id(result['items'][0]) for result in followers}) == 10
+    assert flight.stats() == {'calls': 11, 'executions': 1, 'coalesced': 10, 'in_flight': 0}
+    
+    flight.do('key', slow)
+    assert len(executions) == 2
+
+
+def test_single_flight_shares_exception():
+    """Test waiting callers get the exception of the shared call"""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    
+    def failing():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+    
+    errors = []
+    
+    def call():
+        try:
+            flight.do('key', failing)
+        except ValueError as e:
+            errors.append(e)
+    
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=call)
+    follower.start()
+    while flight.calls < 2:
+        time.sleep(0.001)
+    release.set()
+    leader.join()
+    follower.join()
+    
+    assert len(errors) == 2
+    assert flight.stats()['in_flight'] == 0
+
+
+def test_client_coalesces_identical_fetches():
+    """Test concurrent identical fetches share one request"""
+    client = Content1Client('test_app_id', 'test_secret_key', coalesce=True)
+    sent = []
+    
+    def send(method, path, query_params=None, data=None, stream=False):
+        sent.append(data)
+        time.sleep(0.05)
+        return {'items': [{'gtin': g} for g in data['gtin']]}
+    
+    with patch.object(client, '_send_request', side_effect=send):
+        results = run_concurrently(8, lambda: client.fetch_products_by_gtin(['00000000000001']))
+    
+    assert len(sent) == 1
+    assert all(result[0].gtin == '00000000000001' for result in results)
+    assert client.coalescer.stats()['coalesced'] == 7
+
+
+def test_client_does_not_coalesce_by_default():
+    """Test coalescing is opt-in"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    
+    assert client.coalescer is None
+    with patch.object(client, '_send_request', return_value={'items': []}) as send:
+        client.fetch_products_by_gtin(['1'])
+        client.fetch_products_by_gtin(['1'])
+    assert send.call_count == 2
+
+
+def test_async_single_flight():
+    """Test concurrent coroutines with one key await one task"""
+    flight = AsyncSingleFlight()
+    executions = []
+    
+    async def slow(value):
+        executions.append(value)
+        await asyncio.sleep(0.01)
+        return [value]
+    
+    async def run():
+        same = await asyncio.gather(*[flight.do('a', lambda: slow('a')) for _ in range(5)])
+        other = await flight.do('b', lambda: slow('b'))
+        return same, other
+    
+    same, other = asyncio.run(run())
+    
+    assert same == [['a']] * 5
+    assert len({id(result) for result in same}) == 5
+    assert other == ['b']
+    assert executions == ['a', 'b']
+    assert flight.stats() == {'calls': 6, 'executions': 2, 'coalesced': 4, 'in_flight': 0}
+
+
+def test_async_single_flight_survives_cancelled_caller():
+    """Test cancelling one waiting caller does not cancel the shared call"""
+    flight = AsyncSingleFlight()
+    
+    async def slow():
+        await asyncio.sleep(0.02)
+        return 'done'
+    
+    async def run():
+        first = asyncio.ensure_future(flight.do('key', slow))
+        second = asyncio.ensure_future(flight.do('key', slow))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+    
+    assert asyncio.run(run()) == 'done'
+
+
+def test_async_client_coalesces_identical_fetches():
+    """Test the async client shares one request between identical fetches"""
+    pytest.importorskip('aiohttp')
+    from oneworldsync.content1_async_client import AsyncContent1Client
+    
+    client = AsyncContent1Client('test_app_id', 'test_secret_key', coalesce=True)
+    sent = []
+    
+    async def send(method, path, query_params=None, data=None):
+        sent.append(data)
+        await asyncio.sleep(0.01)
+        return {'items': [{'gtin': '1'}]}
+    
+    client._send_request = send
+    
+    async def run():
+        return await asyncio.gather(*[client.fetch_products_by_gtin(['1']) for _ in range(20)])
+    
+    results = asyncio.run(run())
+    
+    assert len(sent) == 1
+    assert len(results) == 20
@@ -0,0 +1,87 @@
+"""
+Tests for the codec module
+"""
+
+import json
+import pytest
+from oneworldsync import codec
+from oneworldsync.codec import JSONCodec, get_codec, resolve_codec, available_codecs
+from oneworldsync.models import Content1ProductResults
+
+
+DOCUMENT = {
+    'items': [{'gtin': '00012345678905', 'brandName': 'Marqué', 'url': 'https://img/1.jpg', 'n': 1.5, 'ok': True}],
+    'searchAfter': [1700000000000, '00012345678905'],
+    'empty': None
+}
+
+
+@pytest.fixture(params=available_codecs())
+def any_codec(request):
+    return get_codec(request.param)
+
+
+def test_round_trip(any_codec):
+    """Test every installed codec decodes what it encodes"""
+    encoded = any_codec.dumps(DOCUMENT)
+    
+    assert isinstance(encoded, bytes)
+    assert any_codec.loads(encoded) == DOCUMENT
+    assert json.loads(encoded) == DOCUMENT
+
+
+def test_compact_and_indented_output(any_codec):
+    """Test compact output has no whitespace and indented output uses two spaces"""
+    value = {'a': [1, 2], 'b': 'é/'}
+    
+    assert any_codec.dumps(value) == '{"a":[1,2],"b":"é/"}'.encode('utf-8')
+    assert any_codec.dumps(value, indent=True).decode('utf-8') == json.dumps(value, indent=2, ensure_ascii=False)
+
+
+def test_loads_accepts_str_and_bytes(any_codec):
+    """Test documents can be decoded from text or bytes"""
+    assert any_codec.loads('{"a": 1}') == {'a': 1}
+    assert any_codec.loads(b'{"a": 1}') == {'a': 1}
+
+
+def test_invalid_document(any_codec):
+    """Test invalid documents raise ValueError"""
+    with pytest.raises(ValueError):
+        any_codec.loads(b'{"a": ')
+
+
+def test_big_integers_are_encoded(any_codec):
+    """Test integers beyond 64 bits are encoded exactly"""
+    assert json.loads(any_codec.dumps({'n': 2 ** 70})) == {'n': 2 ** 70}
+
+
+def test_get_codec():
+    """Test codec selection by name"""
+    assert available_codecs()[-1] == 'json'
+    assert get_codec().name == available_codecs()[0]
+    assert type(get_codec('json')) is JSONCodec
+    
+    with pytest.raises(ValueError):
+        get_codec('yaml')
+
+
+def test_resolve_codec():
+    """Test codec arguments resolve to codec instances"""
+    stdlib = JSONCodec()
+    
+    assert resolve_codec(stdlib) is stdlib
+    assert resolve_codec('json').name == 'json'
+    assert resolve_codec() is resolve_codec()
+
+
+def test_module_functions():
+    """Test the module functions use the default codec"""
+    assert codec.loads(codec.dumps(DOCUMENT)) == DOCUMENT
+
+
+def test_model_to_json():
+    """Test models encode their to_dict output"""
+    results = Content1ProductResults({'items': [{'item': {'gtin': '00012345678905'}}], 'searchAfter': ['x']})
+    
+    assert json.loads(results.to_json()) == results.to_dict()
+    assert json.loads(results[0].to_json(indent=True, codec='json')) == results[0].to_dict()
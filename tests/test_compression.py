@@ -0,0 +1,118 @@
+"""
+Tests for the compression module
+"""
+
+import io
+import gzip
+import json
+import requests
+from urllib3 import HTTPResponse
+from unittest.mock import patch, MagicMock
+from oneworldsync.content1_auth import Content1HMACAuth
+from oneworldsync.content1_client import Content1Client
+from oneworldsync.compression import TransferStats, accept_encoding, wire_bytes
+
+
+PAGE = {'items': [{'item': {'gtin': f'{n:014d}', 'brandName': 'Brand'}} for n in range(50)], 'searchAfter': ['x']}
+BODY = json.dumps(PAGE).encode('utf-8')
+
+
+def make_gzip_response():
+    """Create a requests response whose body is read and decompressed by urllib3"""
+    compressed = gzip.compress(BODY)
+    response = requests.Response()
+    response.status_code = 200
+    response.headers['Content-Encoding'] = 'gzip'
+    response.raw = HTTPResponse(
+        body=io.BytesIO(compressed),
+        headers={'Content-Encoding': 'gzip'},
+        status=200,
+        preload_content=False,
+        decode_content=True
+    )
+    return response, len(compressed)
+
+
+def test_accept_encoding():
+    """Test gzip and deflate are always accepted"""
+    encodings = accept_encoding().split(',')
+    
+    assert encodings[:2] == ['gzip', 'deflate']
+
+
+def test_auth_accept_encoding_header():
+    """Test the Accept-Encoding header is only sent when configured"""
+    auth = Content1HMACAuth('test_app_id', 'test_secret_key')
+    assert 'Accept-Encoding' not in auth.generate_auth_headers('/V1/product/count')
+    
+    auth.accept_encoding = 'gzip,deflate'
+    assert auth.generate_auth_headers('/V1/product/count')['Accept-Encoding'] == 'gzip,deflate'
+
+
+def test_client_negotiates_compression():
+    """Test the client asks for compressed responses unless compression is disabled"""
+    assert Content1Client('test_app_id', 'test_secret_key').auth.header_template['Accept-Encoding'] == accept_encoding()
+    
+    client = Content1Client('test_app_id', 'test_secret_key', compression=False)
+    assert client.auth.header_template['Accept-Encoding'] == 'identity'
+
+
+def test_transfer_stats():
+    """Test records are totalled per encoding"""
+    stats = TransferStats(history_size=2)
+    stats.record('/V1/product/fetch', 'gzip', 100, 1000)
+    stats.record('/V1/product/fetch', 'gzip', 300, 2000)
+    last = stats.record('/V1/product/count', None, 50, 50)
+    
+    summary = stats.summary()
+    
+    assert last.encoding == 'identity'
+    assert stats.last is last
+    assert len(stats.history()) == 2
+    assert summary['requests'] == 3
+    assert summary['wire_bytes'] == 450
+    assert summary['decoded_bytes'] == 3050
+    assert summary['by_encoding']['gzip'] == {'requests': 2, 'wire_bytes': 400, 'decoded_bytes': 3000}
+    assert stats.history()[0].ratio == 2000 / 300
+    
+    stats.reset()
+    assert stats.summary()['requests'] == 0
+    assert stats.last is None
+
+
+def test_wire_bytes_fallback():
+    """Test transports that do not count received bytes report the decoded size"""
+    assert wire_bytes(MagicMock(raw=None), 123) == 123
+
+
+def test_client_records_compressed_fetch():
+    """Test a gzip response is decoded and its wire and decoded sizes recorded"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    response, compressed_size = make_gzip_response()
+    
+    with patch.object(client.session, 'request', return_value=response):
+        results = client.fetch_products()
+    
+    record = client.transfer_stats.last
+    assert len(results) == 50
+    assert record.path == '/V1/product/fetch'
+    assert record.encoding == 'gzip'
+    assert record.wire_bytes == compressed_size
+    assert record.decoded_bytes == len(BODY)
+
+
+def test_client_records_compressed_stream():
+    """Test a streamed gzip response is decompressed while it is parsed"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    response, compressed_size = make_gzip_response()
+    
+    with patch.object(client.session, 'request', return_value=response):
+        results = client.stream_products(chunk_size=256)
+        gtins = [product.gtin for product in results]
+    
+    record = client.transfer_stats.last
+    assert len(gtins) == 50
+    assert record.encoding == 'gzip'
+    assert record.wire_bytes == compressed_size
+    assert record.decoded_bytes == len(BODY)
+    assert client.transfer_stats.summary()['requests'] == 1
@@ -0,0 +1,160 @@
+"""
+Tests for the concurrency module
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import patch, MagicMock
+from oneworldsync.concurrency import AdaptiveConcurrencyLimiter
+from oneworldsync.content1_client import Content1Client
+from oneworldsync.retry import RetryPolicy
+
+
+def run_requests(limiter, statuses):
+    """Send one request per status through the limiter, one at a time"""
+    for status in statuses:
+        with limiter.slot() as slot:
+            slot.record(status)
+
+
+def test_limiter_increases_when_healthy_and_saturated():
+    """Test the limit grows additively after healthy, saturated windows"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=3, window_size=5, latency_target=1.0)
+    
+    run_requests(limiter, [200] * 5)
+    assert limiter.limit == 2
+    
+    # Two requests in flight at a time use the new limit
+    for _ in range(3):
+        with limiter.slot() as first, limiter.slot() as second:
+            first.record(200)
+            second.record(200)
+    assert limiter.limit == 3
+
+
+def test_limiter_does_not_grow_when_unused():
+    """Test the limit does not grow while fewer requests than the limit are in flight"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, window_size=5)
+    
+    run_requests(limiter, [200] * 20)
+    
+    assert limiter.limit == 4
+
+
+def test_limiter_decreases_multiplicatively_on_throttling():
+    """Test a 429 halves the limit, but only once per generation of requests"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, window_size=5)
+    slots = [limiter.slot() for _ in range(3)]
+    for slot in slots:
+        slot.__enter__()
+    for slot in slots:
+        slot.record(429)
+        slot.__exit__(None, None, None)
+    
+    assert limiter.limit == 4
+    assert limiter.metrics()['counts']['throttled'] == 3
+    
+    run_requests(limiter, [429])
+    assert limiter.limit == 2
+
+
+def test_limiter_counts_timeouts():
+    """Test a timeout raised inside a slot reduces the limit"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+    
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        with limiter.slot():
+            raise requests.exceptions.ReadTimeout()
+    
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
+    assert limiter.metrics()['counts']['timeout'] == 1
+
+
+def test_limiter_holds_on_high_latency():
+    """Test the limit stops growing when p95 latency exceeds the target"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, window_size=2, latency_target=0.5)
+    
+    with patch('oneworldsync.concurrency.time.monotonic', side_effect=[0, 1, 10, 11]):
+        run_requests(limiter, [200, 200])
+    
+    assert limiter.limit == 1
+    assert limiter.metrics()['p95_latency'] == 1
+
+
+def test_limiter_bounds_threads():
+    """Test no more than limit threads hold a slot at once"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+    peak = {'current': 0, 'max': 0}
+    lock = threading.Lock()
+    
+    def work():
+        with limiter.slot() as slot:
+            with lock:
+                peak['current'] += 1
+                peak['max'] = max(peak['max'], peak['current'])
+            time.sleep(0.01)
+            with lock:
+                peak['current'] -= 1
+            slot.record(200)
+    
+    threads = [threading.Thread(target=work) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert peak['max'] == 3
+
+
+def test_limiter_bounds_coroutines():
+    """Test async slots wait for capacity on the event loop"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    peak = {'current': 0, 'max': 0}
+    
+    async def work():
+        async with limiter.async_slot() as slot:
+            peak['current'] += 1
+            peak['max'] = max(peak['max'], peak['current'])
+            await asyncio.sleep(0.01)
+            peak['current'] -= 1
+            slot.record(200)
+    
+    async def run():
+        await asyncio.gather(*[work() for _ in range(10)])
+    
+    asyncio.run(run())
+    
+    assert peak['max'] == 2
+    assert limiter.metrics()['counts']['success'] == 10
+
+
+def test_limiter_metrics_history():
+    """Test limit changes are recorded in the metrics history"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+    run_requests(limiter, [429])
+    
+    history = limiter.metrics()['history']
+    
+    assert [entry['limit'] for entry in history] == [4, 2]
+    assert history[-1]['reason'] == 'throttled'
+
+
+def test_client_reports_outcomes_to_limiter():
+    """Test the client sends each attempt through the concurrency limiter"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+    client = Content1Client('test_app_id', 'test_secret_key', concurrency_limiter=limiter,
+                            retry_policy=RetryPolicy(backoff_factor=0))
+    throttled = MagicMock(status_code=429, headers={})
+    ok = MagicMock(status_code=200, headers={})
+    ok.content = b'{"count": 5}'
+    
+    with patch.object(client.session, 'request', side_effect=[throttled, ok]):
+        assert client.count_products() == 5
+    
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
+    assert limiter.metrics()['counts'] == {'success': 1, 'throttled': 1, 'timeout': 0, 'error': 0}
@@ -0,0 +1,221 @@
+"""
+Tests for the Content1 async client module
+"""
+
+import json
+import asyncio
+import datetime
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+pytest.importorskip('aiohttp')
+
+from oneworldsync.concurrency import AdaptiveConcurrencyLimiter
+from oneworldsync.content1_async_client import AsyncContent1Client
+from oneworldsync.exceptions import AuthenticationError, APIError
+from oneworldsync.models import Content1ProductResults, Content1HierarchyResults
+from oneworldsync.retry import RetryPolicy
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response used as an async context manager"""
+    
+    def __init__(self, status, body=None, text='', delay=0, tracker=None, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+        self._text = text
+        self._delay = delay
+        self._tracker = tracker
+    
+    async def __aenter__(self):
+        if self._tracker is not None:
+            self._tracker['current'] += 1
+            self._tracker['peak'] = max(self._tracker['peak'], self._tracker['current'])
+        await asyncio.sleep(self._delay)
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self._tracker is not None:
+            self._tracker['current'] -= 1
+    
+    async def text(self):
+        return self._text
+    
+    async def read(self):
+        return json.dumps(self._body).encode('utf-8')
+
+
+def make_client(session, **kwargs):
+    """Create an async client using a fake session"""
+    return AsyncContent1Client('test_app_id', 'test_secret_key', session=session, **kwargs)
+
+
+def test_async_client_init_with_env(mock_content1_env_credentials):
+    """Test AsyncContent1Client initialization with environment variables"""
+    client = AsyncContent1Client()
+    
+    assert client.app_id == 'env_app_id'
+    assert client.secret_key == 'env_secret_key'
+    assert client.gln == 'env_gln'
+    assert client.api_url == 'https://env.content1-api.1worldsync.com'
+
+
+def test_async_make_request_success():
+    """Test successful async request"""
+    session = MagicMock(closed=False)
+    session.request.return_value = FakeResponse(200, {'count': 10})
+    client = make_client(session)
+    
+    response = asyncio.run(client._make_request('POST', '/V1/product/count', data={}))
+    
+    assert response == {'count': 10}
+    method, url = session.request.call_args[0]
+    assert method == 'POST'
+    assert url.startswith('https://content1-api.1worldsync.com/V1/product/count?timestamp=')
+    assert session.request.call_args[1]['headers']['appId'] == 'test_app_id'
+
+
+def test_async_make_request_records_transfer():
+    """Test the async client records the wire and decoded size of response bodies"""
+    session = MagicMock(closed=False)
+    session.request.return_value = FakeResponse(200, {'count': 10}, headers={'Content-Encoding': 'gzip', 'Content-Length': '7'})
+    client = make_client(session)
+    
+    asyncio.run(client._make_request('POST', '/V1/product/count', data={}))
+    
+    record = client.transfer_stats.last
+    assert (record.path, record.encoding, record.wire_bytes, record.decoded_bytes) == ('/V1/product/count', 'gzip', 7, 13)
+
+
+def test_async_make_request_errors():
+    """Test async request error handling"""
+    session = MagicMock(closed=False)
+    client = make_client(session)
+    
+    session.request.return_value = FakeResponse(401, text='Authentication failed')
+    with pytest.raises(AuthenticationError):
+        asyncio.run(client._make_request('POST', '/V1/product/count'))
+    
+    session.request.return_value = FakeResponse(400, text='Bad request')
+    with pytest.raises(APIError) as excinfo:
+        asyncio.run(client._make_request('POST', '/V1/product/count'))
+    assert excinfo.value.status_code == 400
+
+
+def test_async_make_request_retries_throttling():
+    """Test throttled async requests are retried with a fresh signature"""
+    session = MagicMock(closed=False)
+    session.request.side_effect = [
+        FakeResponse(429, headers={'Retry-After': '0'}),
+        FakeResponse(200, {'count': 3})
+    ]
+    client = make_client(session, retry_policy=RetryPolicy(backoff_factor=0))
+    
+    with patch.object(client.auth, 'generate_timestamp', side_effect=['t1', 't2']):
+        response = asyncio.run(client._make_request('POST', '/V1/product/count'))
+    
+    assert response == {'count': 3}
+    urls = [call[0][1] for call in session.request.call_args_list]
+    assert urls[0].endswith('timestamp=t1')
+    assert urls[1].endswith('timestamp=t2')
+
+
+def test_async_client_reports_outcomes_to_limiter():
+    """Test the async client reports each attempt's status, so a 429 halves the limit"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+    session = MagicMock(closed=False)
+    session.request.side_effect = [
+        FakeResponse(429, headers={'Retry-After': '0'}),
+        FakeResponse(200, {'count': 3})
+    ]
+    client = make_client(session, concurrency_limiter=limiter, retry_policy=RetryPolicy(backoff_factor=0))
+    
+    assert asyncio.run(client._make_request('POST', '/V1/product/count')) == {'count': 3}
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+    assert limiter.metrics()['counts'] == {'success': 1, 'throttled': 1, 'timeout': 0, 'error': 0}
+
+
+def test_async_timeouts_are_reported_and_bounded_by_deadline():
+    """Test async timeouts count against the limiter and attempts never outlast the retry deadline"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+    session = MagicMock(closed=False)
+    session.request.side_effect = [asyncio.TimeoutError(), FakeResponse(200, {'count': 3})]
+    client = make_client(session, timeout=30, concurrency_limiter=limiter,
+                         retry_policy=RetryPolicy(backoff_factor=0, deadline=5))
+    
+    assert asyncio.run(client._make_request('POST', '/V1/product/count')) == {'count': 3}
+    assert limiter.metrics()['counts']['timeout'] == 1
+    assert limiter.limit == 4
+    assert all(call[1]['timeout'].total <= 5 for call in session.request.call_args_list)
+
+
+def test_async_concurrency_is_bounded(mock_content1_response):
+    """Test that no more than max_concurrency requests are in flight"""
+    tracker = {'current': 0, 'peak': 0}
+    session = MagicMock(closed=False)
+    session.request.side_effect = lambda *args, **kwargs: FakeResponse(
+        200, mock_content1_response, delay=0.01, tracker=tracker
+    )
+    client = make_client(session, max_concurrency=5)
+    
+    async def run():
+        return await asyncio.gather(*[client.fetch_products_by_gtin([str(i)]) for i in range(50)])
+    
+    results = asyncio.run(run())
+    
+    assert len(results) == 50
+    assert all(isinstance(result, Content1ProductResults) for result in results)
+    assert tracker['peak'] == 5
+
+
+def test_async_fetch_methods(mock_content1_response, mock_content1_hierarchy_response):
+    """Test async fetch methods return the result models"""
+    client = AsyncContent1Client('test_app_id', 'test_secret_key')
+    
+    with patch.object(client, '_make_request', AsyncMock(return_value={'count': 42})):
+        assert asyncio.run(client.count_products()) == 42
+    
+    with patch.object(client, '_make_request', AsyncMock(return_value=mock_content1_response)) as mock_request:
+        results = asyncio.run(client.fetch_next_page({'searchAfter': ['token']}, original_criteria={'targetMarket': 'US'}))
+        
+        assert len(results) == 2
+        assert results.search_after == 'next_page_token'
+        assert mock_request.call_args[1]['data'] == {'targetMarket': 'US', 'searchAfter': ['token']}
+    
+    with patch.object(client, '_make_request', AsyncMock(return_value=mock_content1_hierarchy_response)):
+        results = asyncio.run(client.fetch_hierarchies())
+        
+        assert isinstance(results, Content1HierarchyResults)
+        assert len(results) == 1
+
+
+def test_async_make_request_resigns_on_clock_skew():
+    """Test an async 401 with a skewed Date header is re-signed and retried once"""
+    session = MagicMock(closed=False)
+    client = make_client(session)
+    date = {'Date': 'Tue, 01 Jan 2030 12:00:00 GMT'}
+    session.request.side_effect = [
+        FakeResponse(401, text='Invalid hashcode', headers=date),
+        FakeResponse(200, body={'count': 3}, headers=date)
+    ]
+    
+    assert asyncio.run(client._make_request('POST', '/V1/product/count')) == {'count': 3}
+    assert session.request.call_count == 2
+    assert 'timestamp=2030-01-01T12:00' in session.request.call_args_list[1][0][1]
+
+
+def test_async_make_request_measures_clock_offset_when_headers_arrive():
+    """Test the async clock offset is measured at the midpoint of sending and receiving headers"""
+    session = MagicMock(closed=False)
+    client = make_client(session)
+    session.request.return_value = FakeResponse(200, body={'count': 3}, headers={'Date': 'Tue, 01 Jan 2030 12:00:00 GMT'})
+    sent_at = datetime.datetime(2030, 1, 1, 11, 59, 58, tzinfo=datetime.timezone.utc)
+    
+    with patch('oneworldsync.content1_async_client.datetime') as mock_datetime, \
+            patch.object(client.auth, 'update_clock_offset', return_value=False) as mock_update:
+        mock_datetime.now.side_effect = [sent_at, sent_at + datetime.timedelta(seconds=4)]
+        asyncio.run(client._make_request('POST', '/V1/product/count'))
+    
+    mock_update.assert_called_once_with('Tue, 01 Jan 2030 12:00:00 GMT', sent_at + datetime.timedelta(seconds=2))
@@ -75,4 +75,100 @@ def test_content1_generate_auth_headers_no_gln():
         assert headers['accept'] == 'application/json'
         assert headers['appId'] == 'test_app_id'
         assert headers['hashCode'] == 'test_hash_code'
-        assert 'gln' not in headers
\ No newline at end of file
+        assert 'gln' not in headers
+
+
+def test_content1_generate_hash_reuses_keyed_state():
+    """Test repeated hashes from the cached keyed HMAC match a fresh HMAC"""
+    auth = Content1HMACAuth('test_app_id', 'test_secret_key')
+    
+    for uri in ['/V1/product/count?timestamp=2023-01-01T12:00:00Z', '/V1/product/fetch?pageSize=10&timestamp=x']:
+        expected_hash = base64.b64encode(
+            hmac.new(b'test_secret_key', uri.encode('utf-8'), hashlib.sha256).digest()
+        ).decode('utf-8')
+        assert auth.generate_hash(uri) == expected_hash
+        assert auth.generate_hash(uri) == expected_hash
+
+
+def test_content1_header_template_is_immutable():
+    """Test the header template cannot be modified and is not shared with returned headers"""
+    auth = Content1HMACAuth('test_app_id', 'test_secret_key', 'test_gln')
+    
+    with pytest.raises(TypeError):
+        auth.header_template['appId'] = 'other'
+    
+    headers = auth.generate_auth_headers('/V1/product/count')
+    headers['appId'] = 'changed'
+    
+    assert auth.header_template['appId'] == 'test_app_id'
+    assert 'hashCode' not in auth.header_template
+
+
+def test_content1_credential_changes_refresh_cache():
+    """Test changing credentials updates the cached key and header template"""
+    auth = Content1HMACAuth('test_app_id', 'test_secret_key')
+    uri = '/V1/product/count?timestamp=2023-01-01T12:00:00Z'
+    
+    auth.secret_key = 'new_secret_key'
+    auth.app_id = 'new_app_id'
+    auth.gln = 'new_gln'
+    
+    assert auth.generate_hash(uri) == Content1HMACAuth('new_app_id', 'new_secret_key').generate_hash(uri)
+    headers = auth.generate_auth_headers(uri)
+    assert headers['appId'] == 'new_app_id'
+    assert headers['gln'] == 'new_gln'
+
+
+def test_content1_sign_many():
+    """Test batch signing matches signing each URI individually"""
+    auth = Content1HMACAuth('test_app_id', 'test_secret_key', 'test_gln')
+    uris = [f'/V1/product/fetch?pageSize=1000&timestamp=2023-01-01T12:00:0{n}Z' for n in range(5)]
+    
+    signed = auth.sign_many(uris)
+    
+    assert signed == [auth.generate_auth_headers(uri) for uri in uris]
+    assert len({headers['hashCode'] for headers in signed}) == 5
+
+
+def test_content1_update_clock_offset():
+    """Test the clock offset is measured from a Date header and applied to timestamps"""
+    auth = Content1HMACAuth('test_app_id', 'test_secret_key')
+    server_time = datetime.datetime(2030, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+    local_time = server_time - datetime.timedelta(minutes=10)
+    
+    with patch('oneworldsync.content1_auth.datetime') as mock_datetime:
+        mock_datetime.now.return_value = local_time
+        
+        # The header is truncated to the second, so half a second is added to it
+        assert auth.update_clock_offset('Tue, 01 Jan 2030 12:00:00 GMT')
+        assert auth.clock_offset == 600.5
+        assert auth.generate_timestamp() == '2030-01-01T12:00:00Z'
+        
+        # Re-measuring the same skew does not change the offset
+        assert not auth.update_clock_offset('Tue, 01 Jan 2030 12:00:01 GMT')
+        assert auth.clock_offset == 600.5
+
+
+def test_content1_update_clock_offset_at_given_local_time():
+    """Test the offset is measured against the local time the server answered, not now"""
+    auth = Content1HMACAuth('test_app_id', 'test_secret_key')
+    answered_at = datetime.datetime(2030, 1, 1, 11, 59, 59, 500000, tzinfo=datetime.timezone.utc)
+    
+    # A body that took five seconds to download is not mistaken for clock skew
+    with patch('oneworldsync.content1_auth.datetime') as mock_datetime:
+        mock_datetime.now.return_value = answered_at + datetime.timedelta(seconds=5)
+        
+        assert not auth.update_clock_offset('Tue, 01 Jan 2030 12:00:00 GMT', answered_at)
+    
+    assert auth.clock_offset == 0.0
+
+
+def test_content1_update_clock_offset_ignores_small_or_invalid_dates():
+    """Test small differences and unparseable Date headers leave timestamps unchanged"""
+    auth = Content1HMACAuth('test_app_id', 'test_secret_key')
+    now = datetime.datetime.now(datetime.timezone.utc)
+    
+    assert not auth.update_clock_offset(now.strftime('%a, %d %b %Y %H:%M:%S GMT'))
+    assert not auth.update_clock_offset('not a date')
+    assert not auth.update_clock_offset(None)
+    assert auth.clock_offset == 0.0
@@ -4,9 +4,14 @@ Tests for the Content1 client module
 
 import pytest
 import os
+import json
+import datetime
+import threading
+import requests
 from unittest.mock import patch, MagicMock
 from oneworldsync.content1_client import Content1Client
 from oneworldsync.exceptions import AuthenticationError, APIError
+from oneworldsync.retry import RetryPolicy
 
 
 def test_content1_client_init_with_params(mock_content1_credentials):
@@ -47,12 +52,12 @@ def test_content1_make_request_success():
     
     # Mock the auth.generate_auth_headers method
     with patch.object(client.auth, 'generate_auth_headers', return_value={'appId': 'test_app_id', 'hashCode': 'test_hash'}):
-        # Mock the requests.request method
+        # Mock the session request method
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {'count': 10}
+        mock_response.content = b'{"count": 10}'
         
-        with patch('requests.request', return_value=mock_response):
+        with patch.object(client.session, 'request', return_value=mock_response):
             response = client._make_request('GET', '/V1/product/count')
             
             assert response == {'count': 10}
@@ -64,12 +69,12 @@ def test_content1_make_request_auth_error():
     
     # Mock the auth.generate_auth_headers method
     with patch.object(client.auth, 'generate_auth_headers', return_value={'appId': 'test_app_id', 'hashCode': 'test_hash'}):
-        # Mock the requests.request method
+        # Mock the session request method
         mock_response = MagicMock()
         mock_response.status_code = 401
         mock_response.text = 'Authentication failed'
         
-        with patch('requests.request', return_value=mock_response):
+        with patch.object(client.session, 'request', return_value=mock_response):
             with pytest.raises(AuthenticationError):
                 client._make_request('GET', '/V1/product/count')
 
@@ -80,18 +85,147 @@ def test_content1_make_request_api_error():
     
     # Mock the auth.generate_auth_headers method
     with patch.object(client.auth, 'generate_auth_headers', return_value={'appId': 'test_app_id', 'hashCode': 'test_hash'}):
-        # Mock the requests.request method
+        # Mock the session request method
         mock_response = MagicMock()
         mock_response.status_code = 400
         mock_response.text = 'Bad request'
         
-        with patch('requests.request', return_value=mock_response):
+        with patch.object(client.session, 'request', return_value=mock_response):
             with pytest.raises(APIError) as excinfo:
                 client._make_request('GET', '/V1/product/count')
             
             assert excinfo.value.status_code == 400
 
 
+def make_mock_response(status_code, body=None, headers=None):
+    """Create a mock response with a status code, JSON body and headers"""
+    mock_response = MagicMock()
+    mock_response.status_code = status_code
+    mock_response.text = str(body)
+    mock_response.content = json.dumps(body).encode('utf-8')
+    mock_response.headers = headers or {}
+    mock_response.elapsed = datetime.timedelta(0)
+    return mock_response
+
+
+def test_content1_make_request_retries_throttling():
+    """Test 429 and 5xx responses are retried with a fresh signature each time"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    responses = [
+        make_mock_response(429, headers={'Retry-After': '3'}),
+        make_mock_response(503),
+        make_mock_response(200, {'count': 10})
+    ]
+    
+    with patch.object(client.session, 'request', side_effect=responses) as mock_request, \
+            patch.object(client.auth, 'generate_timestamp', side_effect=['t1', 't2', 't3']), \
+            patch('oneworldsync.content1_client.time.sleep') as mock_sleep:
+        response = client._make_request('POST', '/V1/product/count')
+        
+        assert response == {'count': 10}
+        assert mock_request.call_count == 3
+        urls = [call[0][1] for call in mock_request.call_args_list]
+        assert urls == [f"https://content1-api.1worldsync.com/V1/product/count?timestamp=t{n}" for n in (1, 2, 3)]
+        hash_codes = {call[1]['headers']['hashCode'] for call in mock_request.call_args_list}
+        assert len(hash_codes) == 3
+        # Retry-After is honoured for the throttled response
+        assert mock_sleep.call_args_list[0][0][0] == 3.0
+
+
+def test_content1_make_request_retries_exhausted():
+    """Test the last error is raised once retries are exhausted"""
+    client = Content1Client('test_app_id', 'test_secret_key', retry_policy=RetryPolicy(max_retries=2))
+    
+    with patch.object(client.session, 'request', return_value=make_mock_response(500, 'Server error')) as mock_request, \
+            patch('oneworldsync.content1_client.time.sleep'):
+        with pytest.raises(APIError) as excinfo:
+            client._make_request('POST', '/V1/product/count')
+        
+        assert excinfo.value.status_code == 500
+        assert mock_request.call_count == 3
+
+
+def test_content1_make_request_retries_connection_errors():
+    """Test connection errors are retried and then reported as APIError"""
+    client = Content1Client('test_app_id', 'test_secret_key', retry_policy=RetryPolicy(max_retries=1))
+    error = requests.exceptions.ConnectionError('connection reset')
+    
+    with patch.object(client.session, 'request', side_effect=[error, make_mock_response(200, {'count': 1})]), \
+            patch('oneworldsync.content1_client.time.sleep'):
+        assert client._make_request('POST', '/V1/product/count') == {'count': 1}
+    
+    with patch.object(client.session, 'request', side_effect=error) as mock_request, \
+            patch('oneworldsync.content1_client.time.sleep'):
+        with pytest.raises(APIError) as excinfo:
+            client._make_request('POST', '/V1/product/count')
+        
+        assert excinfo.value.status_code == 0
+        assert mock_request.call_count == 2
+
+
+def test_content1_make_request_no_retry_for_non_idempotent_method():
+    """Test methods outside the retry policy are not retried"""
+    client = Content1Client('test_app_id', 'test_secret_key', retry_policy=RetryPolicy(retry_methods={'GET'}))
+    
+    with patch.object(client.session, 'request', return_value=make_mock_response(503)) as mock_request:
+        with pytest.raises(APIError):
+            client._make_request('POST', '/V1/product/count')
+        
+        assert mock_request.call_count == 1
+
+
+def test_content1_client_session_pool_config():
+    """Test Content1Client configures a pooled session"""
+    client = Content1Client('test_app_id', 'test_secret_key', pool_connections=4, pool_maxsize=32)
+    
+    adapter = client.session.get_adapter('https://content1-api.1worldsync.com')
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
+    assert client.session.headers['Connection'] == 'keep-alive'
+    
+    client = Content1Client('test_app_id', 'test_secret_key', keep_alive=False)
+    assert client.session.headers['Connection'] == 'close'
+
+
+def test_content1_client_reuses_session():
+    """Test all requests go through the same session"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b'{"count": 1, "items": []}'
+    
+    with patch.object(client.session, 'request', return_value=mock_response) as mock_request:
+        client.count_products()
+        client.fetch_products()
+        client.fetch_hierarchies()
+        client.fetch_next_page({'searchAfter': ['token']})
+        
+        assert mock_request.call_count == 4
+
+
+def test_content1_client_context_manager():
+    """Test the client closes its session when used as a context manager"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    
+    with patch.object(client.session, 'close') as mock_close:
+        with client as entered:
+            assert entered is client
+        
+        mock_close.assert_called_once()
+
+
+def test_content1_client_external_session_not_closed():
+    """Test a caller-provided session is left open by close()"""
+    session = MagicMock()
+    client = Content1Client('test_app_id', 'test_secret_key', session=session)
+    
+    client.close()
+    
+    assert client.session is session
+    session.close.assert_not_called()
+
+
 def test_content1_count_products():
     """Test count_products method"""
     client = Content1Client('test_app_id', 'test_secret_key')
@@ -138,4 +272,119 @@ def test_content1_fetch_hierarchies(mock_content1_hierarchy_response):
         
         assert 'hierarchies' in results
         assert len(results['hierarchies']) == 1
-        assert results['searchAfter'] == 'next_hierarchy_token'
\ No newline at end of file
+        assert results['searchAfter'] == 'next_hierarchy_token'
+
+
+def make_pages(page_count, page_size=2):
+    """Create a chain of fetch responses linked by searchAfter tokens"""
+    pages = []
+    for page in range(page_count):
+        response = {'items': [{'gtin': f"{page:07d}{n:07d}", 'item': {}} for n in range(page_size)]}
+        if page < page_count - 1:
+            response['searchAfter'] = [page + 1]
+        pages.append(response)
+    return pages
+
+
+def test_content1_iter_products():
+    """Test iter_products follows the searchAfter chain across all pages"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    
+    with patch.object(client, '_make_request', side_effect=make_pages(3)) as mock_request:
+        products = list(client.iter_products({'targetMarket': 'US'}, page_size=2))
+        
+        assert [product.gtin for product in products] == [
+            '00000000000000', '00000000000001',
+            '00000010000000', '00000010000001',
+            '00000020000000', '00000020000001'
+        ]
+        assert mock_request.call_count == 3
+        assert mock_request.call_args_list[0][1]['data'] == {'targetMarket': 'US'}
+        assert mock_request.call_args_list[2][1]['data'] == {'targetMarket': 'US', 'searchAfter': [2]}
+
+
+def test_content1_iter_products_prefetches_next_page():
+    """Test the next page is fetched while the consumer still holds the current one"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    fetched = threading.Event()
+    
+    def make_request(*args, **kwargs):
+        if mock_request.call_count == 2:
+            fetched.set()
+        return make_pages(2)[mock_request.call_count - 1]
+    
+    with patch.object(client, '_make_request', side_effect=make_request) as mock_request:
+        products = client.iter_products(page_size=2, prefetch=1)
+        next(products)
+        
+        # The second page arrives without the consumer asking for it
+        assert fetched.wait(timeout=5)
+        assert len(list(products)) == 3
+
+
+def test_content1_iter_products_propagates_errors():
+    """Test errors on the prefetch thread are raised to the consumer"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    
+    with patch.object(client, '_make_request', side_effect=[make_pages(2)[0], APIError(500, 'Server error')]):
+        products = client.iter_products(page_size=2)
+        
+        assert len([next(products), next(products)]) == 2
+        with pytest.raises(APIError):
+            next(products)
+
+
+def test_content1_iter_hierarchies(mock_content1_hierarchy_response):
+    """Test iter_hierarchies follows the searchAfter chain"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    last_page = {'hierarchies': []}
+    
+    with patch.object(client, '_make_request', side_effect=[mock_content1_hierarchy_response, last_page]) as mock_request:
+        hierarchies = list(client.iter_hierarchies(prefetch=0))
+        
+        assert len(hierarchies) == 1
+        assert mock_request.call_args_list[1][1]['data'] == {'searchAfter': 'next_hierarchy_token'}
+
+
+def test_content1_make_request_resigns_on_clock_skew():
+    """Test a 401 with a skewed Date header is re-signed with the server clock and retried once"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    responses = [
+        make_mock_response(401, 'Invalid hashcode', headers={'Date': 'Tue, 01 Jan 2030 12:00:00 GMT'}),
+        make_mock_response(200, {'count': 10}, headers={'Date': 'Tue, 01 Jan 2030 12:00:00 GMT'})
+    ]
+    
+    with patch.object(client.session, 'request', side_effect=responses) as mock_request:
+        assert client._make_request('POST', '/V1/product/count') == {'count': 10}
+    
+    assert mock_request.call_count == 2
+    assert client.auth.clock_offset > 0
+    assert 'timestamp=2030-01-01T12:00' in mock_request.call_args_list[1][0][1]
+
+
+def test_content1_make_request_measures_clock_offset_when_headers_arrive():
+    """Test the clock offset is measured at the request midpoint, not after the body is read"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    response = make_mock_response(200, {'count': 10}, headers={'Date': 'Tue, 01 Jan 2030 12:00:00 GMT'})
+    response.elapsed = datetime.timedelta(seconds=4)
+    sent_at = datetime.datetime(2030, 1, 1, 11, 59, 58, tzinfo=datetime.timezone.utc)
+    
+    with patch.object(client.session, 'request', return_value=response), \
+            patch('oneworldsync.content1_client.datetime') as mock_datetime, \
+            patch.object(client.auth, 'update_clock_offset', return_value=False) as mock_update:
+        mock_datetime.now.return_value = sent_at
+        client._make_request('POST', '/V1/product/count')
+    
+    mock_update.assert_called_once_with('Tue, 01 Jan 2030 12:00:00 GMT', sent_at + datetime.timedelta(seconds=2))
+
+
+def test_content1_make_request_resigns_only_once():
+    """Test a 401 that keeps failing after re-signing raises AuthenticationError"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    response = make_mock_response(401, 'Invalid timestamp')
+    
+    with patch.object(client.session, 'request', return_value=response) as mock_request:
+        with pytest.raises(AuthenticationError):
+            client._make_request('POST', '/V1/product/count')
+    
+    assert mock_request.call_count == 2
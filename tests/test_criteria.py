@@ -0,0 +1,101 @@
+"""
+Tests for the criteria module
+"""
+
+import pytest
+from datetime import date, datetime, timezone
+from oneworldsync.criteria import ProductCriteria, FrozenCriteria, DateRangeCriteria
+from oneworldsync.content1_client import Content1Client
+from oneworldsync.models import Content1ProductResults
+from unittest.mock import patch
+
+
+def test_build_returns_copy():
+    """Test changing built criteria does not change the builder"""
+    criteria = ProductCriteria().with_gtin(['1']).with_target_market('US')
+    
+    built = criteria.build()
+    built['searchAfter'] = ['x']
+    built['gtin'].append('2')
+    
+    assert criteria.build() == {'gtin': ['1'], 'targetMarket': 'US'}
+
+
+def test_fetch_next_page_leaves_criteria_unchanged():
+    """Test paging does not add searchAfter to the caller's criteria"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    criteria = ProductCriteria().with_target_market('US')
+    
+    with patch.object(client, 'fetch_products', return_value=Content1ProductResults({})) as fetch:
+        client.fetch_next_page({'searchAfter': ['token']}, original_criteria=criteria)
+    
+    assert fetch.call_args.args[0] == {'targetMarket': 'US', 'searchAfter': ['token']}
+    assert 'searchAfter' not in criteria.build()
+
+
+def test_frozen_criteria_are_canonical():
+    """Test equal criteria built in any order are equal and hash alike"""
+    a = ProductCriteria().with_gtin(['2', '1', '2']).with_target_market('US').freeze()
+    b = FrozenCriteria({'targetMarket': 'US', 'gtin': ('1', '2')})
+    
+    assert a == b
+    assert hash(a) == hash(b)
+    assert a.digest == b.digest
+    assert a.canonical == b'{"gtin":["1","2"],"targetMarket":"US"}'
+    assert len({a: 1, b: 2}) == 1
+    assert a == {'gtin': ['1', '2'], 'targetMarket': 'US'}
+    assert a != FrozenCriteria({'gtin': ['1'], 'targetMarket': 'US'})
+
+
+def test_frozen_criteria_normalize_dates():
+    """Test date objects and ISO strings freeze to the same criteria"""
+    a = FrozenCriteria({'lastModifiedDate': DateRangeCriteria.between(date(2024, 1, 1), date(2024, 1, 31))})
+    b = FrozenCriteria({'lastModifiedDate': DateRangeCriteria.between('2024-01-01', '2024-01-31')})
+    
+    assert a == b
+    assert FrozenCriteria({'since': datetime(2024, 1, 1, 12)})['since'] == '2024-01-01T12:00:00'
+
+
+@pytest.mark.parametrize('value', ['2024-01-01T00:00:00', '2024-01-01 00:00', datetime(2024, 1, 1), date(2024, 1, 1)])
+def test_frozen_criteria_normalize_date_strings(value):
+    """Test ISO date strings and date-times at midnight give the digest of the plain date"""
+    assert FrozenCriteria({'since': value}).digest == FrozenCriteria({'since': '2024-01-01'}).digest
+
+
+def test_frozen_criteria_normalize_time_zones():
+    """Test the same instant in different time zones gives one digest, other strings are kept"""
+    utc = FrozenCriteria({'since': '2024-01-01T12:00:00Z'})
+    
+    assert utc == FrozenCriteria({'since': '2024-01-01T14:00:00+02:00'})
+    assert utc == FrozenCriteria({'since': datetime(2024, 1, 1, 12, tzinfo=timezone.utc)})
+    assert utc != FrozenCriteria({'since': '2024-01-01T12:00:00'})
+    assert FrozenCriteria({'brandName': '2024-13-45'})['brandName'] == '2024-13-45'
+    assert FrozenCriteria({'searchAfter': ['2024-01-01T00:00:00Z']})['searchAfter'] == ('2024-01-01T00:00:00Z',)
+
+
+def test_frozen_criteria_are_immutable():
+    """Test frozen criteria and their nested values cannot be changed"""
+    frozen = FrozenCriteria({'gtin': ['1'], 'fields': {'include': ['b', 'a']}})
+    
+    assert frozen['gtin'] == ('1',)
+    assert frozen['fields']['include'] == ('a', 'b')
+    with pytest.raises(TypeError):
+        frozen['gtin'] = ['2']
+    with pytest.raises(TypeError):
+        frozen['fields']['include'] = ()
+
+
+def test_frozen_criteria_build_and_replace():
+    """Test frozen criteria build mutable request bodies and derived copies"""
+    frozen = FrozenCriteria({'gtin': ['1'], 'targetMarket': 'US'})
+    
+    body = frozen.build()
+    body['gtin'].append('2')
+    
+    assert frozen.build() == {'gtin': ['1'], 'targetMarket': 'US'}
+    assert frozen.replace(targetMarket=None, searchAfter=[5]) == {'gtin': ['1'], 'searchAfter': [5]}
+    
+    client = Content1Client('test_app_id', 'test_secret_key')
+    with patch.object(client, '_make_request', return_value={'items': []}) as request:
+        client.fetch_products(frozen)
+    assert request.call_args.kwargs['data'] == {'gtin': ['1'], 'targetMarket': 'US'}
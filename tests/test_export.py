@@ -0,0 +1,89 @@
+"""
+Tests for the export module
+"""
+
+import pytest
+from datetime import datetime, timezone
+from conftest import PagingClient, make_items
+from oneworldsync.export import PartitionedExporter, split_date_range, window_criteria
+
+
+def test_window_criteria():
+    """Test window criteria preserve the base criteria and drop searchAfter"""
+    criteria = window_criteria({'targetMarket': 'US', 'searchAfter': ['x']}, '2024-01-01', '2024-01-31')
+    
+    assert criteria['targetMarket'] == 'US'
+    assert 'searchAfter' not in criteria
+    assert criteria['lastModifiedDate']['from'] == {'date': '2024-01-01', 'op': 'GTE'}
+    assert criteria['lastModifiedDate']['to'] == {'date': '2024-01-31', 'op': 'LTE'}
+
+
+def test_split_date_range_balances_counts():
+    """Test windows are disjoint, cover the range and hold similar counts"""
+    # Skewed distribution: most items on the last days
+    items = make_items(10, 1) + [dict(item, gtin=item['gtin'] + 'x') for item in make_items(10, 9)[-60:]]
+    client = PagingClient(items)
+    
+    windows = split_date_range(client, {}, '2024-01-01', '2024-01-10', 3)
+    
+    assert windows[0]['from_date'] == '2024-01-01'
+    assert windows[-1]['to_date'] == '2024-01-10'
+    for previous, current in zip(windows, windows[1:]):
+        assert previous['to_date'] < current['from_date']
+    assert sum(window['count'] for window in windows) == len(items)
+    assert max(window['count'] for window in windows) <= len(items) / 3 + 10
+
+
+def test_split_date_range_invalid():
+    """Test invalid date ranges are rejected"""
+    with pytest.raises(ValueError):
+        split_date_range(PagingClient([]), {}, '2024-01-10', '2024-01-01', 2)
+
+
+def test_partitioned_export_exactly_once():
+    """Test the exporter yields every product exactly once across windows"""
+    items = make_items(8, 25)
+    # A product that moved between windows appears twice in the source
+    items.append(dict(items[0], lastModifiedDate='2024-01-08T13:00:00Z'))
+    client = PagingClient(items)
+    
+    exporter = PartitionedExporter(client, '2024-01-01', '2024-01-08', criteria={'targetMarket': 'US'},
+                                   partitions=4, page_size=10)
+    products = list(exporter)
+    
+    assert len(products) == 200
+    assert len({product.gtin for product in products}) == 200
+    assert exporter.stats['duplicates'] == 1
+    assert exporter.stats['tracked'] < 200
+    assert len(exporter.plan()) == 4
+    assert len(client.fetch_threads) > 1
+
+
+def test_partitioned_export_tracks_only_products_that_can_repeat():
+    """Test only boundary days and products modified during the export are remembered"""
+    items = make_items(8, 25)
+    # A product modified after the export started, returned with its new date first
+    now = datetime.now(timezone.utc)
+    items.insert(0, dict(items[-1], lastModifiedDate=now.strftime('%Y-%m-%dT%H:%M:%SZ')))
+    client = PagingClient(items)
+    
+    exporter = PartitionedExporter(client, '2024-01-01', now.date(), partitions=1, page_size=50)
+    products = list(exporter)
+    
+    assert len(products) == 200
+    assert exporter.stats['duplicates'] == 1
+    # The window's first day and the modified product
+    assert exporter.stats['tracked'] == 26
+
+
+def test_partitioned_export_stops_early():
+    """Test the consumer can stop before all windows are exported"""
+    client = PagingClient(make_items(8, 25))
+    exporter = PartitionedExporter(client, '2024-01-01', '2024-01-08', partitions=4,
+                                   page_size=5, max_pending_pages=1)
+    
+    iterator = iter(exporter)
+    first = [next(iterator) for _ in range(3)]
+    iterator.close()
+    
+    assert len(first) == 3
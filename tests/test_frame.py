@@ -0,0 +1,136 @@
+"""
+Tests for the frame module
+"""
+
+import pytest
+from oneworldsync.frame import ProductFrame
+from oneworldsync.models import Content1ProductResults
+
+
+def make_page(rows, start=0):
+    """Create a results page from (brand, target market, GPC code) rows"""
+    items = []
+    for n, (brand, market, gpc) in enumerate(rows, start):
+        items.append({
+            'item': {
+                'gtin': f"{n:014d}",
+                'brandName': brand,
+                'targetMarket': market,
+                'globalClassificationCategory': {'code': gpc, 'name': f"Category {gpc}"}
+            }
+        })
+    return Content1ProductResults({'items': items})
+
+
+@pytest.fixture
+def frame():
+    """Frame built from two pages"""
+    frame = ProductFrame()
+    frame.extend(make_page([('Acme', 'US', '100'), ('Acme', 'CA', '100'), ('Zed', 'US', '200')]))
+    frame.extend([make_page([('Acme', 'US', '200'), ('Other', 'US', '300')], start=3)])
+    return frame
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def scan(request, monkeypatch):
+    """Run a test with the NumPy scans and with the pure Python fallback"""
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr('oneworldsync.frame.np', None)
+    return request.param
+
+
+def test_frame_columns(frame):
+    """Test pages are appended into columns in order"""
+    assert len(frame) == 5
+    assert frame.column('gtin') == [f"{n:014d}" for n in range(5)]
+    assert frame.column('brand_name') == ['Acme', 'Acme', 'Zed', 'Acme', 'Other']
+    assert frame.to_dict()['gpc_category'] == ['100', '100', '200', '200', '300']
+    
+    with pytest.raises(KeyError):
+        frame.column('unknown')
+
+
+def test_frame_filter_and_count(frame, scan):
+    """Test filters accept values, collections and callables"""
+    us_acme = frame.filter(brand_name='Acme', target_market='US')
+    
+    assert us_acme.column('gtin') == ['00000000000000', '00000000000003']
+    assert frame.count(gpc_category={'200', '300'}) == 3
+    assert frame.count(brand_name=lambda brand: brand.startswith('Z')) == 1
+    assert frame.count(brand_name='Missing') == 0
+    assert frame.count() == 5
+    assert len(frame.filter(brand_name='Missing')) == 0
+
+
+def test_frame_count_by_and_group_by(frame, scan):
+    """Test counts and groups by one or several columns"""
+    assert frame.count_by('brand_name') == {'Acme': 3, 'Zed': 1, 'Other': 1}
+    assert list(frame.count_by('brand_name'))[0] == 'Acme'
+    assert frame.count_by('brand_name', 'target_market')[('Acme', 'US')] == 2
+    
+    groups = frame.group_by('target_market')
+    assert sorted(groups) == ['CA', 'US']
+    assert groups['US'].column('brand_name') == ['Acme', 'Zed', 'Acme', 'Other']
+    assert groups['US'].count_by('gpc_category') == {'100': 1, '200': 2, '300': 1}
+    
+    with pytest.raises(ValueError):
+        frame.count_by()
+
+
+def test_frame_numpy_scans_match_python(monkeypatch):
+    """Test the NumPy scans give the same rows, counts and group order as the Python loops"""
+    pytest.importorskip('numpy')
+    rows = [(f"Brand {n % 7}", ('US', 'CA', 'DE')[n % 3], str(n % 5)) for n in range(200)]
+    frame = ProductFrame(make_page(rows))
+    
+    def results():
+        groups = frame.group_by('brand_name', 'target_market')
+        return (
+            frame.filter(target_market={'US', 'DE'}, gpc_category=lambda code: code > '1').to_dict(),
+            list(frame.count_by('gpc_category').items()),
+            list(frame.count_by('target_market', 'brand_name').items()),
+            [(key, group.column('gtin')) for key, group in groups.items()]
+        )
+    
+    expected = results()
+    monkeypatch.setattr('oneworldsync.frame.np', None)
+    
+    assert results() == expected
+
+
+def test_frame_custom_columns():
+    """Test frames store only the requested columns"""
+    results = make_page([('Acme', 'US', '100')])
+    frame = results.to_frame(columns=('gtin', 'brand_name'))
+    
+    assert frame.columns == ['gtin', 'brand_name']
+    assert frame.to_dict() == {'gtin': ['00000000000000'], 'brand_name': ['Acme']}
+
+
+def test_frame_to_numpy(frame):
+    """Test columns export to NumPy arrays"""
+    np = pytest.importorskip('numpy')
+    
+    arrays = frame.to_numpy()
+    
+    assert list(arrays['brand_name']) == frame.column('brand_name')
+    assert int(np.sum(arrays['brand_name'] == 'Acme')) == 3
+    assert len(ProductFrame().to_numpy()['gtin']) == 0
+
+
+def test_frame_to_arrow(frame):
+    """Test the frame exports to an Arrow table with dictionary-encoded columns"""
+    pa = pytest.importorskip('pyarrow')
+    
+    table = frame.to_arrow()
+    
+    assert table.num_rows == 5
+    assert table.column_names == frame.columns
+    assert pa.types.is_dictionary(table.schema.field('brand_name').type)
+    assert table.column('brand_name').to_pylist() == frame.column('brand_name')
+    
+    # The table does not pin the frame's buffers
+    frame.extend(make_page([('Acme', 'US', '100')], start=5))
+    assert len(frame) == 6
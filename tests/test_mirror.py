@@ -0,0 +1,140 @@
+"""
+Tests for the mirror module
+"""
+
+import threading
+import pytest
+from oneworldsync.mirror import ProductMirror
+from oneworldsync.models import Content1Product
+from oneworldsync.sync import DeltaSync
+
+
+def make_product(gtin, modified='2024-01-01T00:00:00Z', market='US', gln='1234567890123', brand='Acme', gpc='10000043'):
+    return Content1Product({
+        'gtin': gtin, 'informationProviderGLN': gln, 'targetMarket': market, 'lastModifiedDate': modified,
+        'item': {'gtin': gtin, 'brandName': brand, 'globalClassificationCategory': {'code': gpc, 'name': 'Cereal'},
+                 'gtinName': [{'value': f"Product {gtin}"}]}
+    })
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    with ProductMirror(tmp_path / 'mirror.db', batch_size=3) as mirror:
+        yield mirror
+
+
+def test_load_and_get(mirror):
+    """Test bulk-loaded products are returned as Content1Product"""
+    assert mirror.load(make_product(f"{n:014d}") for n in range(10)) == 10
+    
+    product = mirror.get('00000000000004')
+    assert isinstance(product, Content1Product)
+    assert product.gtin_name == 'Product 00000000000004'
+    assert product.gpc_category == '10000043'
+    assert len(mirror) == 10
+    assert '00000000000009' in mirror
+    assert mirror.get('99999999999999') is None
+
+
+def test_database_uses_wal(mirror):
+    """Test the database is opened in WAL mode"""
+    assert mirror._connection.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+
+def test_upsert_keeps_newest_version(mirror):
+    """Test a product is only replaced by a version at least as recent"""
+    mirror.upsert([make_product('1', '2024-01-05T00:00:00Z', brand='New')])
+    
+    assert mirror.upsert([make_product('1', '2024-01-01T00:00:00Z', brand='Old')]) == 0
+    assert mirror.get('1').brand_name == 'New'
+    assert mirror.upsert([make_product('1', '2024-01-06T00:00:00+00:00', brand='Newer')]) == 1
+    assert mirror.get('1').brand_name == 'Newer'
+    assert len(mirror) == 1
+
+
+def test_lookups_by_scope(mirror):
+    """Test lookups filtered by target market and information provider"""
+    mirror.load([
+        make_product('1', market='US'),
+        make_product('1', '2024-02-01T00:00:00Z', market='CA'),
+        make_product('2', market='US', gln='999'),
+        make_product('3', market='US', brand='Other', gpc='20000000')
+    ])
+    
+    assert mirror.get('1').target_market == 'CA'
+    assert mirror.get('1', target_market='US').target_market == 'US'
+    assert mirror.get('2', information_provider_gln='1234567890123') is None
+    assert sorted(p.gtin for p in mirror.get_many(['1', '2', '3', '4', '1'], target_market='US')) == ['1', '2', '3']
+    assert [p.gtin for p in mirror.find(brand_name='Other')] == ['3']
+    assert [p.gtin for p in mirror.find(gpc_category='10000043', information_provider_gln='999')] == ['2']
+    assert [p.target_market for p in mirror.find(modified_since='2024-01-15')] == ['CA']
+    assert len(mirror.find(target_market='US', limit=2)) == 2
+
+
+def test_get_many_beyond_parameter_limit(mirror):
+    """Test lookups of more GTINs than one query can bind"""
+    mirror.load(make_product(str(n)) for n in range(1200))
+    
+    assert len(mirror.get_many([str(n) for n in range(0, 2400, 2)])) == 600
+
+
+def test_delete(mirror):
+    """Test removing a product"""
+    mirror.upsert([make_product('1')])
+    
+    assert mirror.delete('1', '1234567890123', 'US')
+    assert not mirror.delete('1', '1234567890123', 'US')
+    assert len(mirror) == 0
+
+
+def test_concurrent_writers(mirror):
+    """Test threads can load into a shared mirror"""
+    def load(offset):
+        mirror.load(make_product(str(offset + n)) for n in range(50))
+    
+    threads = [threading.Thread(target=load, args=(offset,)) for offset in range(0, 200, 50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(mirror) == 200
+
+
+def test_reads_are_not_blocked_by_a_write(mirror):
+    """Test lookups from another thread see the committed data while a write transaction is open"""
+    mirror.upsert([make_product('1')])
+    found = []
+    
+    with mirror._lock:
+        mirror._connection.execute("BEGIN IMMEDIATE")
+        mirror._connection.execute("DELETE FROM products")
+        reader = threading.Thread(target=lambda: found.append((mirror.get('1'), len(mirror), '1' in mirror)))
+        reader.start()
+        reader.join(5)
+        mirror._connection.execute("ROLLBACK")
+    
+    assert not reader.is_alive()
+    assert found[0][0].gtin == '1'
+    assert found[0][1:] == (1, True)
+
+
+def test_in_memory_mirror():
+    """Test an in-memory mirror reads on its only connection"""
+    with ProductMirror(':memory:') as mirror:
+        mirror.upsert([make_product('1')])
+        
+        assert mirror.get('1').gtin == '1'
+        assert len(mirror) == 1
+
+
+def test_delta_sync_into_mirror(mirror, tmp_path):
+    """Test the mirror can be kept up to date by DeltaSync"""
+    class Client:
+        def iter_products(self, criteria=None, page_size=1000):
+            return iter([make_product('1', '2024-01-02T00:00:00Z'), make_product('2', '2024-01-03T00:00:00Z')])
+    
+    result = DeltaSync(Client(), mirror, tmp_path / 'sync.json').run()
+    
+    assert result.upserted == 2
+    assert mirror.get('2').last_modified_date == '2024-01-03T00:00:00Z'
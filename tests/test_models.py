@@ -3,6 +3,7 @@ Tests for the models module
 """
 
 import pytest
+from unittest.mock import patch
 from oneworldsync.models import Content1Product, Content1ProductResults, Content1Hierarchy, Content1HierarchyResults
 
 
@@ -137,4 +138,31 @@ def test_content1_hierarchy_results_to_dict(mock_content1_hierarchy_response):
     
     assert results_dict['metadata']['search_after'] == 'next_hierarchy_token'
     assert len(results_dict['hierarchies']) == 1
-    assert results_dict['hierarchies'][0]['gtin'] == '00000000000001'
\ No newline at end of file
+    assert results_dict['hierarchies'][0]['gtin'] == '00000000000001'
+
+
+def test_content1_product_extracted_data_is_lazy():
+    """Test product data is only extracted when extracted_data is read, and only once"""
+    data = {'item': {'gtin': '00000000000001', 'brandName': 'Test Brand'}}
+    
+    with patch('oneworldsync.models.extract_product_data', return_value={'gtin': '00000000000001'}) as mock_extract:
+        results = Content1ProductResults({'items': [data, data]})
+        assert mock_extract.call_count == 0
+        
+        product = results[0]
+        assert product.extracted_data == {'gtin': '00000000000001'}
+        assert product.extracted_data is product.extracted_data
+        assert mock_extract.call_count == 1
+
+
+def test_models_use_slots():
+    """Test the models are slotted and keep no per-instance __dict__"""
+    product = Content1Product({'gtin': '00000000000001', 'item': {'brandName': 'Test Brand'}})
+    hierarchy = Content1Hierarchy({'gtin': '00000000000001', 'hierarchy': []})
+    
+    for model in (product, hierarchy, Content1ProductResults({}), Content1HierarchyResults({})):
+        assert not hasattr(model, '__dict__')
+    
+    assert product.brand_name == 'Test Brand'
+    with pytest.raises(AttributeError):
+        product.unknown_attribute = 'value'
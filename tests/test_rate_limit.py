@@ -0,0 +1,114 @@
+"""
+Tests for the rate_limit module
+"""
+
+import multiprocessing
+import pytest
+from unittest.mock import patch, MagicMock
+from oneworldsync.content1_client import Content1Client
+from oneworldsync.rate_limit import RateLimiter, TokenBucketRateLimiter, FileTokenBucketRateLimiter
+
+
+def test_token_bucket_burst_then_rate():
+    """Test the bucket allows a burst and then spaces requests at the rate"""
+    with patch('oneworldsync.rate_limit.time.monotonic', return_value=100.0):
+        limiter = TokenBucketRateLimiter(rate=10, burst=2)
+        waits = [limiter.reserve() for _ in range(4)]
+    
+    assert waits[0] == 0
+    assert waits[1] == 0
+    assert waits[2] == pytest.approx(0.1)
+    assert waits[3] == pytest.approx(0.2)
+
+
+def test_token_bucket_refills_over_time():
+    """Test tokens refill with elapsed time up to the burst size"""
+    with patch('oneworldsync.rate_limit.time.monotonic', side_effect=[0.0, 0.0, 0.0, 10.0, 10.0, 10.0]):
+        limiter = TokenBucketRateLimiter(rate=1, burst=2)
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == 0
+        # After ten seconds the bucket is full again, but never above the burst size
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == pytest.approx(1.0)
+
+
+def test_token_bucket_invalid_rate():
+    """Test a non-positive rate is rejected"""
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate=0)
+
+
+def test_rate_limiter_requires_reserve():
+    """Test a rate limiter must implement reserve, which acquire builds on"""
+    class Incomplete(RateLimiter):
+        pass
+    
+    class Fixed(RateLimiter):
+        def reserve(self, tokens=1):
+            return 0.0
+    
+    with pytest.raises(TypeError):
+        RateLimiter()
+    with pytest.raises(TypeError):
+        Incomplete()
+    Fixed().acquire()
+
+
+def test_file_token_bucket_shared_between_instances(tmp_path):
+    """Test limiters on the same file draw from one bucket"""
+    path = tmp_path / 'bucket.json'
+    
+    with patch('oneworldsync.rate_limit.time.time', return_value=1000.0):
+        first = FileTokenBucketRateLimiter(path, rate=10, burst=1)
+        second = FileTokenBucketRateLimiter(path, rate=10, burst=1)
+        
+        assert first.reserve() == 0
+        assert second.reserve() == pytest.approx(0.1)
+        assert first.reserve() == pytest.approx(0.2)
+
+
+def test_file_token_bucket_requires_file_locking(tmp_path):
+    """Test the file limiter is refused where fcntl is unavailable"""
+    with patch('oneworldsync.rate_limit.fcntl', None):
+        with pytest.raises(RuntimeError):
+            FileTokenBucketRateLimiter(tmp_path / 'bucket.json', rate=10)
+
+
+def _reserve_many(path, count, results):
+    """Reserve tokens from a shared file bucket in a child process"""
+    limiter = FileTokenBucketRateLimiter(path, rate=1, burst=1)
+    results.put([limiter.reserve() for _ in range(count)])
+
+
+def test_file_token_bucket_shared_between_processes(tmp_path):
+    """Test several processes queue up behind one shared bucket"""
+    path = str(tmp_path / 'bucket.json')
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=_reserve_many, args=(path, 5, results)) for _ in range(3)]
+    for process in processes:
+        process.start()
+    waits = sorted(wait for _ in processes for wait in results.get(timeout=10))
+    for process in processes:
+        process.join()
+    
+    # 15 reservations at 1 per second: each caller gets its own slot
+    assert len(waits) == 15
+    assert waits[0] == 0
+    assert waits[-1] == pytest.approx(14, abs=0.5)
+
+
+def test_client_acquires_before_each_request():
+    """Test the client consults the rate limiter before every request"""
+    limiter = MagicMock()
+    client = Content1Client('test_app_id', 'test_secret_key', rate_limiter=limiter)
+    
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b'{"count": 1}'
+    
+    with patch.object(client.session, 'request', return_value=mock_response):
+        client.count_products()
+        client.count_products()
+    
+    assert limiter.acquire.call_count == 2
@@ -0,0 +1,58 @@
+"""
+Tests for the retry module
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from oneworldsync.retry import RetryPolicy
+
+
+def test_retry_policy_defaults():
+    """Test default retryable statuses and methods"""
+    policy = RetryPolicy()
+    
+    assert policy.is_retryable_status(429)
+    assert policy.is_retryable_status(503)
+    assert not policy.is_retryable_status(400)
+    assert not policy.is_retryable_status(401)
+    assert 'POST' in policy.retry_methods
+
+
+def test_retry_policy_backoff_grows_and_is_capped():
+    """Test exponential backoff without jitter"""
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    
+    assert [policy.backoff(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+
+
+def test_retry_policy_jitter_within_bounds():
+    """Test jittered backoff stays between zero and the exponential delay"""
+    policy = RetryPolicy(backoff_factor=1, max_backoff=60)
+    
+    for _ in range(100):
+        assert 0 <= policy.backoff(3) <= 4
+
+
+def test_retry_policy_parse_retry_after():
+    """Test parsing Retry-After seconds and HTTP dates"""
+    assert RetryPolicy.parse_retry_after('7') == 7.0
+    assert RetryPolicy.parse_retry_after('') is None
+    assert RetryPolicy.parse_retry_after('soon') is None
+    assert RetryPolicy.parse_retry_after(None) is None
+    
+    retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= RetryPolicy.parse_retry_after(retry_at) <= 30
+
+
+def test_retry_policy_get_delay():
+    """Test retry decisions for attempts, methods, Retry-After and the deadline"""
+    policy = RetryPolicy(max_retries=2, backoff_factor=1, jitter=False, deadline=10, retry_methods={'GET'})
+    
+    assert policy.get_delay('GET', 1, 0) == 1
+    assert policy.get_delay('get', 2, 0) == 2
+    assert policy.get_delay('GET', 3, 0) is None
+    assert policy.get_delay('POST', 1, 0) is None
+    assert policy.get_delay('GET', 1, 0, {'Retry-After': '4'}) == 4
+    assert policy.get_delay('GET', 1, 0, {'Retry-After': '20'}) is None
+    assert policy.get_delay('GET', 1, 9.5) is None
+    assert RetryPolicy.disabled().get_delay('GET', 1, 0) is None
@@ -0,0 +1,169 @@
+"""
+Tests for the schema module
+"""
+
+import pytest
+from oneworldsync.schema import (
+    Schema, Field, PRODUCT_SCHEMA, LAST, COLLECT, MAP, OMIT, compile_steps
+)
+from oneworldsync.utils import extract_product_data
+
+
+@pytest.fixture
+def item():
+    """Product item with nested lists"""
+    return {
+        'identifiers': [
+            {'type': {'value': 'SKU'}, 'id': 'sku-1'},
+            {'type': {'value': 'GTIN'}, 'id': '00000000000001'},
+            {'type': {'value': 'GTIN'}, 'id': '00000000000002'}
+        ],
+        'names': [
+            {'values': [{'value': ''}, {'value': 'First name'}, {'value': 'Other language'}]},
+            {'values': [{'value': 'Second name'}]}
+        ],
+        'nutrients': [
+            {'code': 'FAT', 'quantity': [{'value': '8'}]},
+            {'code': 'NA', 'quantity': [{'value': '120'}]},
+            {'code': 'UNKNOWN', 'quantity': []}
+        ],
+        'single': {'value': 'not a list'},
+        'count': 0
+    }
+
+
+def test_schema_rules(item):
+    """Test first, last, collect and map rules with wildcards and filters"""
+    schema = Schema({
+        'gtin': Field('identifiers[type.value=GTIN].id'),
+        'last_gtin': Field('identifiers[type.value=GTIN].id', rule=LAST),
+        'ids': Field('identifiers[].id', rule=COLLECT),
+        'name': Field('names[].values[first].value', rule=LAST),
+        'all_names': Field('names[].values[].value', rule=COLLECT),
+        'nutrients': Field('nutrients[]', rule=MAP, key='code', value='quantity.0.value'),
+        'single': Field('single[].value'),
+        'count': Field('count'),
+        'missing': Field('missing.path', default='n/a')
+    })
+    
+    result = schema.extract(item)
+    
+    assert result == {
+        'gtin': '00000000000001',
+        'last_gtin': '00000000000002',
+        'ids': ['sku-1', '00000000000001', '00000000000002'],
+        'name': 'Second name',
+        'all_names': ['First name', 'Other language', 'Second name'],
+        'nutrients': {'FAT': '8', 'NA': '120'},
+        'single': 'not a list',
+        'count': 0,
+        'missing': 'n/a'
+    }
+
+
+def test_schema_where_convert_and_nested_output(item):
+    """Test predicates, converters, OMIT and dotted output names"""
+    schema = Schema({
+        'ids.gtins': Field('identifiers[].id', rule=COLLECT, where=lambda value: value.startswith('0'), convert=int),
+        'ids.sku': Field('identifiers[type.value=SKU].id', convert=str.upper),
+        'ids.missing': Field('identifiers[].missing', default=OMIT),
+        'constant': Field(default=[])
+    })
+    
+    first = schema.extract(item)
+    second = schema.extract(item)
+    
+    assert first == {'ids': {'gtins': [1, 2], 'sku': 'SKU-1'}, 'constant': []}
+    # Mutable defaults are not shared between results
+    assert first['constant'] is not second['constant']
+
+
+def test_schema_select(item):
+    """Test selecting a subset of fields"""
+    schema = Schema({'gtin': Field('identifiers[type.value=GTIN].id'), 'count': Field('count')})
+    
+    assert schema.select('gtin').extract(item) == {'gtin': '00000000000001'}
+    with pytest.raises(KeyError):
+        schema.select('unknown')
+
+
+def test_schema_handles_unexpected_shapes():
+    """Test mismatched types and non-dict input never raise"""
+    schema = Schema({'value': Field('a[].b.0.c', rule=COLLECT)})
+    
+    assert schema.extract({'a': 'text'}) == {'value': []}
+    assert schema.extract({'a': [None, 5, {'b': {'0': {'c': 'by key'}}}, {'b': [{'c': 'by index'}]}]}) == {
+        'value': ['by key', 'by index']
+    }
+    assert schema.extract(None) == {'value': []}
+
+
+def test_schema_deep_nesting():
+    """Test nested wildcards stop at the first match only where requested"""
+    schema = Schema({
+        'first': Field('a[].b[first].c[].d', rule=LAST),
+        'all': Field('a[].b[].c[].d', rule=COLLECT)
+    })
+    data = {'a': [{'b': [{'c': [{'d': 1}, {'d': 2}]}, {'c': [{'d': 3}]}]}]}
+    
+    assert schema.extract(data) == {'first': 2, 'all': [1, 2, 3]}
+
+
+def test_field_validation():
+    """Test invalid rules and paths are rejected"""
+    with pytest.raises(ValueError):
+        Field('a', rule='average')
+    with pytest.raises(ValueError):
+        Field('a[]', rule=MAP)
+    with pytest.raises(ValueError):
+        compile_steps('a[b=1')
+    with pytest.raises(ValueError):
+        compile_steps('a..b')
+    with pytest.raises(ValueError):
+        compile_steps('a[b]')
+
+
+def test_product_schema_matches_extract_product_data():
+    """Test extract_product_data is the product schema applied to the item"""
+    product = {
+        'item': {
+            'itemIdentificationInformation': {
+                'itemIdentifier': [{'itemId': '00000000000001', 'itemIdType': {'value': 'GTIN'}}]
+            },
+            'tradeItemInformation': [{
+                'tradeItemDescriptionModule': {'tradeItemDescriptionInformation': [{
+                    'brandNameInformation': {'brandName': 'Acme'},
+                    'regulatedProductName': [{'statement': {'values': [{'value': 'Cereal'}, {'value': 'Cereales'}]}}]
+                }]},
+                'referencedFileDetailInformationModule': {'referencedFileHeader': [
+                    {'referencedFileTypeCode': {'value': 'PRODUCT_IMAGE'}, 'uniformResourceIdentifier': 'a.jpg',
+                     'isPrimaryFile': {'value': 'false'}},
+                    {'referencedFileTypeCode': {'value': 'PRODUCT_IMAGE'}, 'uniformResourceIdentifier': 'b.jpg',
+                     'isPrimaryFile': {'value': 'true'}}
+                ]},
+                'tradeItemMeasurementsModuleGroup': [{'tradeItemMeasurementsModule': {
+                    'tradeItemMeasurements': {'height': {'value': '10', 'qual': 'CM'}}
+                }}]
+            }],
+            'productCategory': [{
+                'productCategoryScheme': {'value': 'GPC'},
+                'productCategoryCodes': [
+                    {'productCategoryCode': {'value': '10000043'}, 'productCategoryComponent': {'value': 'BRICK'}}
+                ]
+            }]
+        }
+    }
+    
+    data = extract_product_data(product)
+    
+    assert data == PRODUCT_SCHEMA.extract(product['item'])
+    assert data['gtin'] == '00000000000001'
+    assert data['brand_name'] == 'Acme'
+    assert data['product_name'] == 'Cereal'
+    assert data['image_url'] == 'b.jpg'
+    assert data['images'] == [{'url': 'a.jpg', 'is_primary': False}, {'url': 'b.jpg', 'is_primary': True}]
+    assert data['dimensions'] == {'height': {'value': '10', 'unit': 'CM'}}
+    assert data['gpc_code'] == data['category'] == '10000043'
+    assert data['manufacturer'] == ''
+    assert data['allergen_info'] == []
+    assert extract_product_data({})['dimensions'] == {}
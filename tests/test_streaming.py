@@ -0,0 +1,164 @@
+"""
+Tests for the streaming module
+"""
+
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+from oneworldsync.content1_client import Content1Client
+from oneworldsync.models import Content1Product, Content1Hierarchy
+from oneworldsync.streaming import JSONStreamParser, StreamedResults
+
+
+PAGE = {
+    'items': [
+        {'item': {'gtin': '00000000000001', 'brandName': 'Brand "A" ]}'}},
+        {'item': {'gtin': '00000000000002', 'brandName': 'Marqué'}}
+    ],
+    'searchAfter': ['00000000000002'],
+    'totalCount': 1234567
+}
+
+
+def chunks_of(body, size):
+    return [body[start:start + size] for start in range(0, len(body), size)]
+
+
+def make_stream_response(body, chunk_size=7, status_code=200):
+    """Create a mock streamed response returning the body in small chunks"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {}
+    response.iter_content.return_value = chunks_of(body, chunk_size)
+    return response
+
+
+@pytest.mark.parametrize('size', [1, 3, 16, 100000])
+@pytest.mark.parametrize('indent', [None, 2])
+def test_parser_any_chunking(size, indent):
+    """Test elements and metadata are the same for any chunk boundaries"""
+    body = json.dumps(PAGE, indent=indent, ensure_ascii=False).encode('utf-8')
+    parser = JSONStreamParser()
+    
+    elements = list(parser.parse(chunks_of(body, size)))
+    
+    assert elements == [('items', item) for item in PAGE['items']]
+    assert parser.metadata == {'searchAfter': ['00000000000002'], 'totalCount': 1234567}
+    assert parser.done
+    assert parser.bytes_read == len(body)
+
+
+@pytest.mark.parametrize('body', [
+    b'{"totalCount": 1.25, "items": []}',
+    b'{"items": [1.25, 3]}',
+    b'{"items":[1e5,2]}',
+    b'{"items": [-2.5E-3, 1e+7], "totalCount": 10}'
+])
+def test_parser_numbers_split_at_any_byte(body):
+    """Test floats and exponents cut by a chunk boundary are parsed whole"""
+    document = json.loads(body)
+    for cut in range(1, len(body)):
+        parser = JSONStreamParser()
+        
+        elements = list(parser.parse([body[:cut], body[cut:]]))
+        
+        assert elements == [('items', item) for item in document['items']]
+        assert parser.metadata == {key: value for key, value in document.items() if key != 'items'}
+
+
+def test_parser_yields_elements_before_document_ends():
+    """Test elements are returned before the rest of the document has arrived"""
+    body = json.dumps(PAGE).encode('utf-8')
+    first_end = body.index(b'}}') + 2
+    parser = JSONStreamParser()
+    
+    assert parser.feed(body[:first_end - 1]) == []
+    assert parser.feed(body[first_end - 1:-1]) == [('items', item) for item in PAGE['items']]
+    assert not parser.done
+    assert parser.feed(body[-1:]) == []
+    assert parser.done
+
+
+def test_parser_other_arrays_are_metadata():
+    """Test only the configured array keys are streamed"""
+    parser = JSONStreamParser(('hierarchies',))
+    
+    elements = list(parser.parse([b'{"items": [1, 2], "hierarchies": [{"gtin": "1"}]}']))
+    
+    assert elements == [('hierarchies', {'gtin': '1'})]
+    assert parser.metadata == {'items': [1, 2]}
+
+
+@pytest.mark.parametrize('body', [b'[1, 2]', b'{"items": [1 2]}', b'{"items": [{"a": 1}', b'{1: 2}'])
+def test_parser_malformed(body):
+    """Test malformed or truncated documents raise ValueError"""
+    with pytest.raises(ValueError):
+        list(JSONStreamParser().parse([body]))
+
+
+def test_streamed_results():
+    """Test streamed results build models and expose the page metadata"""
+    response = make_stream_response(json.dumps(PAGE).encode('utf-8'))
+    results = StreamedResults(response)
+    
+    products = list(results)
+    
+    assert [product.gtin for product in products] == ['00000000000001', '00000000000002']
+    assert all(isinstance(product, Content1Product) for product in products)
+    assert results.count == 2
+    assert results.search_after == ['00000000000002']
+    assert results.total_count == 1234567
+    response.close.assert_called()
+    
+    with pytest.raises(RuntimeError):
+        list(results)
+
+
+def test_streamed_results_empty_body():
+    """Test a response without a body has no results"""
+    results = StreamedResults(make_stream_response(b'', status_code=204))
+    
+    assert list(results) == []
+    assert results.search_after is None
+
+
+def test_client_stream_products():
+    """Test stream_products requests a streamed response and parses it incrementally"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    response = make_stream_response(json.dumps(PAGE).encode('utf-8'))
+    
+    with patch.object(client.session, 'request', return_value=response) as mock_request:
+        results = client.stream_products({'targetMarket': 'US'}, page_size=2)
+        products = list(results)
+    
+    assert mock_request.call_args[1]['stream'] is True
+    response.json.assert_not_called()
+    assert len(products) == 2
+    assert results.search_after == ['00000000000002']
+
+
+def test_client_iter_products_stream():
+    """Test iter_products(stream=True) follows searchAfter across streamed pages"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    pages = [
+        make_stream_response(json.dumps(PAGE).encode('utf-8')),
+        make_stream_response(b'{"items": [], "searchAfter": null}')
+    ]
+    
+    with patch.object(client.session, 'request', side_effect=pages) as mock_request:
+        gtins = [product.gtin for product in client.iter_products({'targetMarket': 'US'}, stream=True)]
+    
+    assert gtins == ['00000000000001', '00000000000002']
+    assert json.loads(mock_request.call_args_list[1][1]['data']) == {'targetMarket': 'US', 'searchAfter': ['00000000000002']}
+
+
+def test_client_stream_hierarchies():
+    """Test stream_hierarchies yields hierarchy models"""
+    client = Content1Client('test_app_id', 'test_secret_key')
+    body = json.dumps({'hierarchies': [{'gtin': '1', 'hierarchy': []}], 'searchAfter': None}).encode('utf-8')
+    
+    with patch.object(client.session, 'request', return_value=make_stream_response(body)):
+        hierarchies = list(client.stream_hierarchies())
+    
+    assert len(hierarchies) == 1
+    assert isinstance(hierarchies[0], Content1Hierarchy)
@@ -0,0 +1,112 @@
+"""
+Tests for the sync module
+"""
+
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from conftest import PagingClient, make_item
+from oneworldsync.criteria import ProductCriteria
+from oneworldsync.models import Content1Product
+from oneworldsync.sync import DeltaSync, MemoryProductStore, ProductStore, parse_modified_date, sync_scope
+
+
+def test_parse_modified_date():
+    """Test dates and timestamps are parsed as UTC"""
+    assert parse_modified_date('2024-01-31T12:00:00Z') == datetime(2024, 1, 31, 12, tzinfo=timezone.utc)
+    assert parse_modified_date('2024-01-31') == datetime(2024, 1, 31, tzinfo=timezone.utc)
+    assert parse_modified_date('2024-01-31T14:00:00+02:00') == datetime(2024, 1, 31, 12, tzinfo=timezone.utc)
+    assert parse_modified_date('') is None
+    assert parse_modified_date('not a date') is None
+
+
+def test_sync_scope_ignores_sync_fields_and_order():
+    """Test the scope only depends on the criteria the sync does not set itself"""
+    base = ProductCriteria().with_target_market('US').with_ip_gln('123').with_brand_name('Acme')
+    same = {'brandName': 'Acme', 'ipGln': '123', 'targetMarket': 'US',
+            'lastModifiedDate': {'from': {'date': '2024-01-01'}}, 'searchAfter': [5]}
+    
+    assert sync_scope(base) == sync_scope(same)
+    assert sync_scope(base) != sync_scope({'targetMarket': 'CA', 'ipGln': '123', 'brandName': 'Acme'})
+
+
+def test_delta_sync_pulls_only_changes(tmp_path):
+    """Test the second sync starts at the watermark minus the overlap and upserts changes"""
+    client = PagingClient([
+        make_item('1', '2024-01-01T10:00:00Z'),
+        make_item('2', '2024-01-03T10:00:00Z'),
+        make_item('3', '2024-01-05T08:30:00Z'),
+        make_item('4', '2024-01-05T09:00:00Z', market='CA')
+    ])
+    store = MemoryProductStore()
+    sync = DeltaSync(client, store, tmp_path / 'sync.json', criteria={'targetMarket': 'US'}, batch_size=2)
+    
+    first = sync.run()
+    
+    assert first.since is None
+    assert 'lastModifiedDate' not in client.requests[0]
+    assert (first.items, first.upserted, len(store)) == (3, 3, 3)
+    assert first.watermark == datetime(2024, 1, 5, 8, 30, tzinfo=timezone.utc)
+    assert sync.watermark() == first.watermark
+    
+    client.items.append(make_item('2', '2024-01-06T07:00:00Z', name='Renamed'))
+    second = sync.run()
+    
+    assert second.since == first.watermark - timedelta(days=1)
+    assert client.requests[1]['lastModifiedDate']['from']['date'] == '2024-01-04'
+    assert (second.items, second.upserted, len(store)) == (2, 2, 3)
+    assert store.get('2', '1234567890123', 'US').brand_name == 'Renamed'
+    assert second.watermark == datetime(2024, 1, 6, 7, tzinfo=timezone.utc)
+
+
+def test_memory_store_keeps_newer_version():
+    """Test an older version of a product does not replace a newer one"""
+    store = MemoryProductStore()
+    store.upsert([Content1Product(make_item('1', '2024-01-05T00:00:00Z', name='New'))])
+    
+    assert store.upsert([Content1Product(make_item('1', '2024-01-01T00:00:00Z', name='Old'))]) == 0
+    assert store.get('1', '1234567890123', 'US').brand_name == 'New'
+
+
+def test_product_store_requires_upsert():
+    """Test a product store must implement upsert"""
+    class Incomplete(ProductStore):
+        pass
+    
+    with pytest.raises(TypeError):
+        ProductStore()
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_watermarks_are_kept_per_scope(tmp_path):
+    """Test syncs of different scopes share a state file without interfering"""
+    client = PagingClient([make_item('1', '2024-01-02T00:00:00Z'),
+                              make_item('2', '2024-02-02T00:00:00Z', market='CA')])
+    store = MemoryProductStore()
+    us = DeltaSync(client, store, tmp_path / 'sync.json', criteria={'targetMarket': 'US'})
+    ca = DeltaSync(client, store, tmp_path / 'sync.json', criteria={'targetMarket': 'CA'})
+    
+    us.run()
+    ca.run()
+    
+    state = json.loads((tmp_path / 'sync.json').read_text())
+    assert len(state) == 2
+    assert us.watermark().month == 1
+    assert ca.watermark().month == 2
+
+
+def test_failed_sync_keeps_watermark(tmp_path):
+    """Test the watermark does not advance when the pull fails part way"""
+    class FailingClient(PagingClient):
+        def iter_products(self, criteria=None, page_size=1000):
+            yield Content1Product(make_item('9', '2024-03-01T00:00:00Z'))
+            raise ConnectionError("connection lost")
+    
+    sync = DeltaSync(FailingClient([]), MemoryProductStore(), tmp_path / 'sync.json', initial_since='2024-01-01')
+    
+    with pytest.raises(ConnectionError):
+        sync.run()
+    
+    assert sync.watermark() is None
+    assert sync.since() == datetime(2024, 1, 1, tzinfo=timezone.utc)
@@ -6,7 +6,7 @@ import pytest
 from datetime import datetime, timezone
 from oneworldsync.utils import (
     format_timestamp, parse_timestamp, extract_nested_value,
-    get_nested_dict_value, extract_product_data, format_dimensions
+    get_nested_dict_value, compile_path, extract_product_data, format_dimensions, normalize_gtin
 )
 
 
@@ -106,6 +106,31 @@ def test_get_nested_dict_value():
     assert get_nested_dict_value(data, '') == data
 
 
+def test_compile_path():
+    """Test compiled accessors behave like get_nested_dict_value"""
+    data = {
+        'level1': {
+            'list': [{'item': 1}, {'item': 2}],
+            'digits': {'0': 'zero'},
+            'none': None
+        }
+    }
+    
+    list_item = compile_path('level1.list.1.item')
+    assert list_item(data) == 2
+    assert compile_path('level1.digits.0')(data) == 'zero'
+    assert compile_path('level1.list.5.item')(data, 'default') == 'default'
+    assert compile_path('level1.list.item')(data, 'default') == 'default'
+    assert compile_path('level1.none.key')(data, 'default') == 'default'
+    assert compile_path('level1.missing')(data) is None
+    assert list_item({}, 'default') == 'default'
+    assert list_item('string') is None
+    assert list_item.path == 'level1.list.1.item'
+    
+    # Compiled paths are cached
+    assert compile_path('level1.list.1.item') is list_item
+
+
 def test_format_dimensions():
     """Test format_dimensions function"""
     # Test with all dimensions
@@ -191,4 +216,12 @@ def test_extract_product_data():
     empty_result = extract_product_data({})
     assert empty_result['gtin'] == ''
     assert empty_result['brand_name'] == ''
-    assert empty_result['product_name'] == ''
\ No newline at end of file
+    assert empty_result['product_name'] == ''
+
+
+def test_normalize_gtin():
+    """Test normalize_gtin function"""
+    assert normalize_gtin('12345678') == '00000012345678'
+    assert normalize_gtin(' 012345678905 ') == '00012345678905'
+    assert normalize_gtin(12345678905) == '00012345678905'
+    assert normalize_gtin('10012345678902') == '10012345678902'